@@ -5,24 +5,21 @@ import pandas as pd
 
 from project_games.config import load_config
 from project_games.data.loader import load_processed_data
-from project_games.analysis.temporal import games_per_year, filter_relevant_period
-from project_games.analysis.platform import (
-    platform_total_sales,
-    platform_yearly_sales,
-    platform_growth_analysis,
-    platform_lifecycle,
+from project_games.analysis.temporal import (
+    GROWTH_DIMENSIONS,
+    filter_relevant_period,
+    growth_panels,
 )
-from project_games.analysis.genre import genre_sales_summary, classify_genres
-from project_games.analysis.regional import (
-    top_platforms_by_region,
-    top_genres_by_region,
-    market_share_platforms,
-    market_share_genres,
-    rating_sales_by_region,
-)
-from project_games.analysis.hypothesis import run_configured_tests
+from project_games.analysis.platform import platform_yearly_sales, platform_lifecycle
+from project_games.analysis.hypothesis import group_samples
+from project_games.analysis.memo import AnalysisCache
+from project_games.analysis.results import load_results, run_sections
+from project_games.analysis.search import TitleIndex
+from project_games.analysis.topk import TopKIndex
 from project_games.visualization.plots_plotly import (
+    GROWTH_LABELS,
     fig_games_per_year,
+    fig_growth,
     fig_platform_sales,
     fig_platform_evolution,
     fig_platform_heatmap,
@@ -44,15 +41,31 @@ st.set_page_config(
 )
 
 
-@st.cache_data
+# Shared, read-only across sessions: the same frame objects are reused on every
+# rerun, so the analysis cache can key them by identity-memoized fingerprints.
+@st.cache_resource
 def load_data():
     cfg = load_config()
     df = load_processed_data()
     df_rel = filter_relevant_period(df, cfg)
-    return df, df_rel, cfg
+    results, from_store = load_results(df, cfg)
+    return df, df_rel, cfg, results, from_store, TopKIndex(df), TitleIndex(df)
+
+
+@st.cache_resource
+def get_analysis_cache() -> AnalysisCache:
+    return AnalysisCache(maxsize=256)
+
 
+def filtered_view(df, index, cfg, selections, year_range):
+    """Period frame and analysis results for a sidebar selection."""
+    df_sel = index.filter(df, selections)
+    df_view = index.filter(df, selections, {"year_of_release": year_range})
+    return df_view, run_sections(df_sel, df_view, cfg, skip_insufficient=True)
 
-df_full, df_rel, cfg = load_data()
+
+df_full, df_rel, cfg, results, from_store, index, titles = load_data()
+memo = get_analysis_cache()
 
 # ---------------------------------------------------------------------------
 # Sidebar
@@ -65,11 +78,37 @@ tab_choice = st.sidebar.radio(
     ["Overview", "Temporal", "Platforms", "Genres", "Regional", "Hypothesis Tests"],
 )
 
-start_year = cfg["analysis"]["relevant_period"]["start_year"]
 st.sidebar.markdown("---")
-st.sidebar.caption(f"Relevant period: {start_year}–2016")
+st.sidebar.subheader("Filters")
+years = index.values("year_of_release")
+default_period = (cfg["analysis"]["relevant_period"]["start_year"], int(max(years)))
+year_range = st.sidebar.slider(
+    "Release years", int(min(years)), int(max(years)), default_period
+)
+selections = {
+    "platform": st.sidebar.multiselect("Platforms", index.values("platform")),
+    "genre": st.sidebar.multiselect("Genres", index.values("genre")),
+    "rating": st.sidebar.multiselect("Ratings", index.values("rating")),
+}
+
+if any(selections.values()) or tuple(year_range) != default_period:
+    df_rel, results = memo.call(
+        filtered_view, df_full, index, cfg, selections, tuple(year_range)
+    )
+    results_source = "filtered view"
+else:
+    results_source = "precomputed" if from_store else "computed live"
+
+start_year = year_range[0]
+st.sidebar.markdown("---")
+st.sidebar.caption(f"Period: {year_range[0]}–{year_range[1]}")
 st.sidebar.caption(f"Total records: {len(df_full):,}")
 st.sidebar.caption(f"Filtered records: {len(df_rel):,}")
+st.sidebar.caption(f"Results: {results_source}")
+
+if df_rel.empty:
+    st.warning("No games match the current filters.")
+    st.stop()
 
 # ---------------------------------------------------------------------------
 # Overview
@@ -84,8 +123,27 @@ if tab_choice == "Overview":
     c4.metric("Total Sales", f"${df_rel['total_sales'].sum():,.1f}M")
 
     st.markdown("---")
-    st.subheader("Dataset sample")
-    st.dataframe(df_rel.head(20), use_container_width=True)
+    st.subheader("Top titles")
+    c1, c2 = st.columns([3, 1])
+    metric = c1.selectbox("Rank by", index.metrics)
+    top_k = c2.number_input("Titles", min_value=5, max_value=100, value=20, step=5)
+    top_titles = index.top(
+        df_full, metric, int(top_k), selections, {"year_of_release": tuple(year_range)}
+    )
+    st.dataframe(top_titles, use_container_width=True, hide_index=True)
+
+    st.markdown("---")
+    st.subheader("Find a game")
+    query = st.text_input("Search titles", placeholder="e.g. mario kart")
+    if query:
+        matches = titles.search(query, limit=20)
+        if matches.empty:
+            st.info(f"No titles match “{query}”.")
+        else:
+            st.caption("All years and platforms, regardless of the sidebar filters.")
+            st.dataframe(matches, use_container_width=True, hide_index=True)
+            title = st.selectbox("Releases of", matches["name"])
+            st.dataframe(titles.lookup(df_full, title), use_container_width=True, hide_index=True)
 
 # ---------------------------------------------------------------------------
 # Temporal
@@ -93,7 +151,7 @@ if tab_choice == "Overview":
 elif tab_choice == "Temporal":
     st.title("Temporal Analysis")
 
-    gpy = games_per_year(df_full)
+    gpy = results["games_per_year"]
     st.plotly_chart(fig_games_per_year(gpy), use_container_width=True)
 
     st.markdown("### Statistics")
@@ -102,13 +160,26 @@ elif tab_choice == "Temporal":
     col2.metric("Mean / Year", f"{gpy.mean():.0f}")
     col3.metric("Years with Data", len(gpy))
 
+    st.markdown("### Growth")
+    c1, c2, c3 = st.columns(3)
+    dimension = c1.selectbox("Dimension", GROWTH_DIMENSIONS)
+    metric = c2.selectbox("Metric", list(GROWTH_LABELS), format_func=GROWTH_LABELS.get, index=1)
+    window = c3.number_input("Rolling window (years)", min_value=1, max_value=10, value=3)
+    panels = memo.call(growth_panels, df_rel, window=int(window))
+    panel = panels[panels["dimension"] == dimension]
+    leaders = panel.groupby("group")["sales"].sum().nlargest(8).index.tolist()
+    groups = st.multiselect("Groups", sorted(panel["group"].unique()), default=sorted(leaders))
+    panel = panel[panel["group"].isin(groups)]
+    st.plotly_chart(fig_growth(panel, metric), use_container_width=True)
+    st.dataframe(panel.drop(columns="dimension"), use_container_width=True, hide_index=True)
+
 # ---------------------------------------------------------------------------
 # Platforms
 # ---------------------------------------------------------------------------
 elif tab_choice == "Platforms":
     st.title("Platform Analysis")
 
-    ps = platform_total_sales(df_rel)
+    ps = results["platform_total_sales"]
     top_n = st.slider("Top N platforms", 5, 20, 10)
     top_list = ps.head(top_n).index.tolist()
 
@@ -116,31 +187,30 @@ elif tab_choice == "Platforms":
         ["Sales Ranking", "Evolution", "Heatmap", "Growth & Lifecycle"]
     )
 
+    pys = memo.call(platform_yearly_sales, df_rel, top_list)
+
     with tab1:
         st.plotly_chart(fig_platform_sales(ps, top_n), use_container_width=True)
 
     with tab2:
-        pys = platform_yearly_sales(df_rel, top_list)
         st.plotly_chart(fig_platform_evolution(pys, top_list), use_container_width=True)
 
     with tab3:
-        pys_all = platform_yearly_sales(df_rel, top_list)
-        st.plotly_chart(fig_platform_heatmap(pys_all, min_year=start_year), use_container_width=True)
+        st.plotly_chart(fig_platform_heatmap(pys, min_year=start_year), use_container_width=True)
 
     with tab4:
         st.subheader("Growth Analysis")
-        growth = platform_growth_analysis(df_rel)
+        growth = results["platform_growth_analysis"]
         st.dataframe(growth, use_container_width=True)
 
         st.subheader("Lifecycle")
-        pys_lc = platform_yearly_sales(df_rel, top_list)
-        lc = platform_lifecycle(pys_lc)
+        lc = memo.call(platform_lifecycle, pys)
         st.dataframe(lc, use_container_width=True)
 
     st.markdown("---")
     st.subheader("Sales Distribution")
     st.plotly_chart(
-        fig_boxplot_by_group(df_rel, "platform", groups=top_list),
+        fig_boxplot_by_group(df_rel, "platform", groups=top_list, aggregate=True),
         use_container_width=True,
     )
 
@@ -150,10 +220,10 @@ elif tab_choice == "Platforms":
 elif tab_choice == "Genres":
     st.title("Genre Analysis")
 
-    gs = genre_sales_summary(df_rel)
+    gs = results["genre_sales_summary"]
     st.plotly_chart(fig_genre_sales(gs), use_container_width=True)
 
-    tiers = classify_genres(df_rel)
+    tiers = results["classify_genres"]
     col1, col2 = st.columns(2)
     col1.success(f"**High-sales genres:** {', '.join(tiers['high_sales'])}")
     col2.warning(f"**Low-sales genres:** {', '.join(tiers['low_sales'])}")
@@ -162,7 +232,7 @@ elif tab_choice == "Genres":
     st.subheader("Sales Distribution by Genre")
     top_genres = gs.head(8).index.tolist()
     st.plotly_chart(
-        fig_boxplot_by_group(df_rel, "genre", groups=top_genres),
+        fig_boxplot_by_group(df_rel, "genre", groups=top_genres, aggregate=True),
         use_container_width=True,
     )
 
@@ -181,31 +251,31 @@ elif tab_choice == "Regional":
     )
 
     if region_tab == "Platforms by Region":
-        data = top_platforms_by_region(df_rel)
+        data = results["top_platforms_by_region"]
         st.plotly_chart(
             fig_regional_comparison(data, "Top 5 Platforms by Region"),
             use_container_width=True,
         )
-        share = market_share_platforms(df_rel)
+        share = results["market_share_platforms"]
         st.plotly_chart(
             fig_market_share_heatmap(share, "Platform Market Share (%)"),
             use_container_width=True,
         )
 
     elif region_tab == "Genres by Region":
-        data = top_genres_by_region(df_rel)
+        data = results["top_genres_by_region"]
         st.plotly_chart(
             fig_regional_comparison(data, "Top 5 Genres by Region"),
             use_container_width=True,
         )
-        share = market_share_genres(df_rel)
+        share = results["market_share_genres"]
         st.plotly_chart(
             fig_market_share_heatmap(share, "Genre Market Share (%)"),
             use_container_width=True,
         )
 
     else:
-        rating_df = rating_sales_by_region(df_rel)
+        rating_df = results["rating_sales_by_region"]
         st.plotly_chart(fig_rating_by_region(rating_df), use_container_width=True)
         st.dataframe(rating_df, use_container_width=True)
 
@@ -216,22 +286,30 @@ elif tab_choice == "Hypothesis Tests":
     st.title("Hypothesis Tests")
     st.markdown(f"**Significance level (α):** {cfg['analysis']['significance_level']}")
 
-    results = run_configured_tests(df_rel, cfg)
+    if not results["hypothesis_tests"]:
+        st.info("No configured test has enough data in the current selection.")
 
-    for r in results:
+    for r in results["hypothesis_tests"]:
         with st.expander(f"{'✅' if r.reject_null else '❌'} {r.name}: {r.group_a_label} vs {r.group_b_label}", expanded=True):
             c1, c2, c3 = st.columns(3)
             c1.metric(f"{r.group_a_label} mean", f"{r.mean_a:.4f}", f"n={r.n_a}")
             c2.metric(f"{r.group_b_label} mean", f"{r.mean_b:.4f}", f"n={r.n_b}")
             c3.metric("p-value", f"{r.p_value:.6f}")
+            st.caption(f"Test: {r.test} ({r.alternative})")
 
             verdict = "**REJECT H₀** — Statistically significant difference" if r.reject_null else "**FAIL TO REJECT H₀** — No significant difference found"
             st.markdown(verdict)
 
-            scores_a = df_rel[df_rel[cfg["hypothesis_tests"][results.index(r)]["group_column"]] == r.group_a_label][cfg["hypothesis_tests"][results.index(r)]["column"]].dropna()
-            scores_b = df_rel[df_rel[cfg["hypothesis_tests"][results.index(r)]["group_column"]] == r.group_b_label][cfg["hypothesis_tests"][results.index(r)]["column"]].dropna()
+            if r.sample_a is not None:
+                scores_a, scores_b = r.sample_a, r.sample_b
+            else:
+                # Results from the store carry no samples; one cached pass per column pair.
+                samples = memo.call(group_samples, df_rel, r.group_column, r.column)
+                scores_a, scores_b = samples[r.group_a_label], samples[r.group_b_label]
 
             st.plotly_chart(
-                fig_hypothesis_comparison(scores_a, scores_b, r.group_a_label, r.group_b_label),
+                fig_hypothesis_comparison(
+                    scores_a, scores_b, r.group_a_label, r.group_b_label, aggregate=True
+                ),
                 use_container_width=True,
             )
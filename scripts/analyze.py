@@ -1,43 +1,50 @@
 #!/usr/bin/env python3
-"""Run the full analysis pipeline on processed data."""
-
-from project_games.analysis.genre import classify_genres, genre_sales_summary
-from project_games.analysis.hypothesis import run_configured_tests
-from project_games.analysis.platform import (
-    platform_growth_analysis,
-    platform_total_sales,
-    platform_yearly_sales,
-)
-from project_games.analysis.regional import (
-    market_share_genres,
-    market_share_platforms,
-    rating_sales_by_region,
-    top_genres_by_region,
-    top_platforms_by_region,
-)
-from project_games.analysis.temporal import (
-    filter_relevant_period,
-    games_per_year,
-    significant_years,
+"""Run the full analysis pipeline on processed data.
+
+With ``--snapshots``, analyse several processed snapshot files concurrently and
+print a side-by-side diff of their key tables instead.
+"""
+
+import argparse
+
+from project_games.analysis.bootstrap import bootstrap_intervals
+from project_games.analysis.compare import compare_snapshots
+from project_games.analysis.cooccurrence import (
+    incidence_matrix,
+    jaccard_similarity,
+    sales_overlap,
+    top_pairs,
 )
-from project_games.config import load_config
+from project_games.analysis.results import default_store, run_analysis, save_results
+from project_games.analysis.temporal import filter_relevant_period, growth_panels
+from project_games.config import get_project_root, load_config
 from project_games.data.loader import load_processed_data
 
 
-def main() -> None:
-    cfg = load_config()
-
+def run_single(cfg: dict) -> None:
     print("Loading processed data...")
     df = load_processed_data()
     print(f"  {len(df)} rows loaded")
 
+    results = run_analysis(df, cfg)
+
     # --- Temporal analysis ---
     print("\n--- Temporal Analysis ---")
-    gpy = games_per_year(df)
-    sig = significant_years(df)
+    gpy = results["games_per_year"]
+    sig = results["significant_years"]
     print(f"  Years with data: {len(gpy)}")
     print(f"  Significant years (>= mean): {len(sig)} ({sig.index.min()}-{sig.index.max()})")
 
+    panels = growth_panels(df)
+    last_year = int(panels["year"].max())
+    growth = panels[(panels["dimension"] == "platform") & (panels["year"] == last_year)]
+    print(f"  Platform sales change in {last_year}:")
+    for _, row in growth.nlargest(5, "sales").iterrows():
+        print(
+            f"    {row['group']}: {row['yoy_pct']:+.0f}% YoY, "
+            f"{row['cagr_pct']:+.0f}%/yr since launch"
+        )
+
     # --- Filter to relevant period ---
     df_rel = filter_relevant_period(df, cfg)
     start = cfg["analysis"]["relevant_period"]["start_year"]
@@ -45,39 +52,101 @@ def main() -> None:
 
     # --- Platform analysis ---
     print("\n--- Platform Analysis ---")
-    ps = platform_total_sales(df_rel)
+    ps = results["platform_total_sales"]
     print(f"  Top 5 platforms: {', '.join(ps.head(5).index)}")
 
-    growth = platform_growth_analysis(df_rel)
+    growth = results["platform_growth_analysis"]
     for _, row in growth.head(5).iterrows():
         print(f"    {row['platform']}: ${row['total_sales']:.1f}M, trend={row['trend']}")
 
     # --- Genre analysis ---
     print("\n--- Genre Analysis ---")
-    gs = genre_sales_summary(df_rel)
+    gs = results["genre_sales_summary"]
     print(f"  Top 5 genres by total sales:")
     for genre in gs.head(5).index:
         print(f"    {genre}: ${gs.loc[genre, 'sum']:.1f}M ({gs.loc[genre, 'count']:.0f} games)")
 
-    tiers = classify_genres(df_rel)
+    tiers = results["classify_genres"]
     print(f"  High-sales genres: {', '.join(tiers['high_sales'])}")
     print(f"  Low-sales genres: {', '.join(tiers['low_sales'])}")
 
+    intervals = bootstrap_intervals(df_rel, cfg=cfg)
+    averages = intervals["genre_averages"]
+    ci = cfg["bootstrap"]["ci"]
+    print(f"  Avg sales per game, {ci:.0%} bootstrap CI, share of resamples in each tier:")
+    for genre, row in averages.iterrows():
+        print(
+            f"    {genre}: ${row['avg_per_game']:.2f}M [{row['low']:.2f}, {row['high']:.2f}]"
+            f"  high {row['p_high_sales']:.0%}  low {row['p_low_sales']:.0%}"
+        )
+
     # --- Regional analysis ---
     print("\n--- Regional Analysis ---")
-    for region, series in top_platforms_by_region(df_rel).items():
+    for region, series in results["top_platforms_by_region"].items():
         print(f"  {region} top platform: {series.index[0]} (${series.iloc[0]:.1f}M)")
-    for region, series in top_genres_by_region(df_rel).items():
+    for region, series in results["top_genres_by_region"].items():
         print(f"  {region} top genre: {series.index[0]} (${series.iloc[0]:.1f}M)")
 
+    # --- Platform overlap ---
+    print("\n--- Platform Overlap ---")
+    titles = incidence_matrix(df_rel, "name", "platform")
+    for _, row in top_pairs(jaccard_similarity(titles), 5).iterrows():
+        print(f"  {row['a']} & {row['b']}: title Jaccard similarity {row['value']:.2f}")
+    overlap = sales_overlap(incidence_matrix(df_rel, "name", "platform", weight="total_sales"))
+    for _, row in top_pairs(overlap, 3, symmetric=False).iterrows():
+        print(f"  {row['value']:.0%} of {row['a']} sales from titles also on {row['b']}")
+
     # --- Hypothesis tests ---
     print("\n--- Hypothesis Tests ---")
-    results = run_configured_tests(df_rel, cfg)
-    for r in results:
+    for r in results["hypothesis_tests"]:
         print(f"  {r.summary()}")
 
+    # --- Persist for the dashboard and other consumers ---
+    store = default_store(cfg)
+    save_results(df, results, cfg, store)
+    print(f"\nResults saved to {store.path}")
+
+    reports_dir = get_project_root() / cfg["data"]["reports_dir"]
+    reports_dir.mkdir(parents=True, exist_ok=True)
+    for name, table in intervals.items():
+        table.to_csv(reports_dir / f"bootstrap_{name}.csv", index=name == "genre_averages")
+    print(f"Bootstrap intervals saved to {reports_dir}")
+    panels.to_csv(reports_dir / "growth_panels.csv", index=False)
+    print(f"Growth panels saved to {reports_dir / 'growth_panels.csv'}")
+
     print("\nAnalysis complete.")
 
 
+def run_snapshots(cfg: dict, paths: list[str], workers: int | None) -> None:
+    print(f"Analysing {len(paths)} snapshots...")
+    diff, from_store = compare_snapshots(paths, cfg, n_workers=workers)
+    for label, cached in from_store.items():
+        print(f"  {label}: {'cached' if cached else 'analysed'}")
+
+    reports_dir = get_project_root() / cfg["data"]["reports_dir"]
+    reports_dir.mkdir(parents=True, exist_ok=True)
+    for name, table in diff.items():
+        print(f"\n--- {name.replace('_', ' ').title()} ---")
+        print(table.to_string())
+        table.to_csv(reports_dir / f"snapshot_diff_{name}.csv")
+
+    print(f"\nDiff tables saved to {reports_dir}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--snapshots", nargs="+", metavar="PATH", help="processed snapshot files to compare"
+    )
+    parser.add_argument("--workers", type=int, default=None, help="worker processes")
+    args = parser.parse_args()
+
+    cfg = load_config()
+    if args.snapshots:
+        run_snapshots(cfg, args.snapshots, args.workers)
+    else:
+        run_single(cfg)
+
+
 if __name__ == "__main__":
     main()
@@ -1,16 +1,29 @@
 #!/usr/bin/env python3
 """Load raw data, clean it, impute missing values, and save to processed/."""
 
-from pathlib import Path
+import argparse
 
 from project_games.config import get_project_root, load_config
 from project_games.data.cleaning import clean_dataset
+from project_games.data.columnar import write_columnar
+from project_games.data.database import write_database
 from project_games.data.imputation import impute_dataset
 from project_games.data.loader import load_raw_data
+from project_games.data.partitioned import write_partitioned
 
 
 def main() -> None:
     cfg = load_config()
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--partition-by",
+        nargs="*",
+        default=cfg["data"]["partition_by"],
+        metavar="COLUMN",
+        help="partition columns of the partitioned copy, e.g. year_of_release platform "
+        "(none: skip it)",
+    )
+    args = parser.parse_args()
     root = get_project_root()
 
     print("Loading raw data...")
@@ -18,7 +31,7 @@ def main() -> None:
     print(f"  Loaded {len(df)} rows")
 
     print("Cleaning...")
-    df = clean_dataset(df)
+    df = clean_dataset(df, fuzzy_names=cfg["matching"]["fuzzy_names"])
     print(f"  After cleaning: {len(df)} rows")
 
     print("Imputing missing values...")
@@ -30,6 +43,18 @@ def main() -> None:
     df.to_csv(out_path, index=False)
     print(f"Saved to {out_path}")
 
+    columnar_path = write_columnar(df, root / cfg["data"]["columnar_path"])
+    print(f"Saved memory-mapped copy to {columnar_path}")
+
+    sqlite_path = write_database(df, root / cfg["data"]["sqlite_path"])
+    print(f"Saved indexed SQLite copy to {sqlite_path}")
+
+    if args.partition_by:
+        parts_path = write_partitioned(
+            df, root / cfg["data"]["partitioned_path"], args.partition_by
+        )
+        print(f"Saved copy partitioned by {', '.join(args.partition_by)} to {parts_path}")
+
 
 if __name__ == "__main__":
     main()
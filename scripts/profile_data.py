@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Profile a dataset CSV in one streaming pass with fixed-memory sketches."""
+
+import argparse
+import time
+
+import pandas as pd
+
+from project_games.config import get_project_root, load_config
+from project_games.data.profiling import profile_csv
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--source", choices=["raw", "processed"], default="raw")
+    parser.add_argument("--path", default=None, help="CSV to profile (overrides --source)")
+    parser.add_argument("--chunksize", type=int, default=50_000, help="rows per chunk")
+    parser.add_argument("--top", type=int, default=5, help="frequent values per column")
+    args = parser.parse_args()
+
+    cfg = load_config()
+    root = get_project_root()
+    path = args.path or root / cfg["data"][f"{args.source}_path"]
+
+    print(f"Profiling {path} in chunks of {args.chunksize} rows...")
+    start = time.perf_counter()
+    profile = profile_csv(path, chunksize=args.chunksize, top_k=args.top)
+    print(f"  {int(profile['rows'].max())} rows in {time.perf_counter() - start:.2f}s")
+
+    out_dir = root / cfg["data"]["reports_dir"]
+    out_dir.mkdir(parents=True, exist_ok=True)
+    out_path = out_dir / f"profile_{args.source if args.path is None else 'custom'}.csv"
+    profile.to_csv(out_path, index=False)
+
+    with pd.option_context("display.width", 160, "display.max_columns", None):
+        summary = profile.drop(columns="top_values").set_index("column")
+        print(summary.to_string(float_format="{:.2f}".format))
+    print(f"\nSaved profile to {out_path}")
+
+
+if __name__ == "__main__":
+    main()
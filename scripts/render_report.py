@@ -0,0 +1,37 @@
+#!/usr/bin/env python3
+"""Render every static report figure into data/reports/figures."""
+
+import argparse
+import time
+
+from project_games.config import load_config
+from project_games.data.cleaning import clean_dataset
+from project_games.data.loader import load_processed_data, load_raw_data
+from project_games.visualization.report import default_figures_dir, render_report, report_figures
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--formats", nargs="+", default=["png"], choices=["png", "svg"])
+    parser.add_argument("--workers", type=int, default=None, help="worker processes")
+    parser.add_argument("--force", action="store_true", help="re-render unchanged figures")
+    args = parser.parse_args()
+
+    cfg = load_config()
+
+    print("Loading data...")
+    df = load_processed_data()
+    raw_df = clean_dataset(load_raw_data())
+
+    specs = report_figures(df, cfg, raw_df=raw_df)
+    out_dir = default_figures_dir(cfg)
+    print(f"Rendering {len(specs)} figures to {out_dir}...")
+    start = time.perf_counter()
+    status = render_report(specs, out_dir, tuple(args.formats), args.workers, args.force)
+    for name, state in status.items():
+        print(f"  {name}: {state}")
+    print(f"Done in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
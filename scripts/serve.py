@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""Serve the analysis package as a local HTTP/JSON API.
+
+Example::
+
+    curl 'http://127.0.0.1:8765/platforms/total-sales?start_year=2014&genre=Action&top=5'
+"""
+
+import argparse
+
+from project_games.config import load_config
+from project_games.service import ENDPOINTS, run
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--workers", type=int, default=None, help="threads for pandas work (default: auto)"
+    )
+    args = parser.parse_args()
+
+    print(f"Serving on http://{args.host}:{args.port}")
+    for path in sorted(ENDPOINTS):
+        print(f"  GET {path}")
+    try:
+        run(args.host, args.port, load_config(), max_workers=args.workers)
+    except KeyboardInterrupt:
+        print("Stopped.")
+
+
+if __name__ == "__main__":
+    main()
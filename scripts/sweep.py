@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""Run the analysis over a grid of config overrides and tabulate the outcomes.
+
+The grid is the ``sweep`` section of the config unless ``--set`` options are
+given, e.g. ``--set analysis.relevant_period.start_year=2013,2014,2015``.
+"""
+
+import argparse
+import time
+
+import pandas as pd
+import yaml
+
+from project_games.analysis.sweep import run_sweep, sweep_summary
+from project_games.config import get_project_root, load_config
+
+
+def parse_setting(text: str) -> tuple[str, list]:
+    """``KEY=V1,V2,...`` to ``(KEY, [V1, V2, ...])`` with YAML-typed values."""
+    key, sep, values = text.partition("=")
+    if not sep or not key or not values:
+        raise argparse.ArgumentTypeError(f"expected KEY=V1,V2,..., got {text!r}")
+    return key, [yaml.safe_load(v) for v in values.split(",")]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--set",
+        dest="settings",
+        action="append",
+        type=parse_setting,
+        metavar="KEY=V1,V2",
+        help="grid values for a dotted config key (repeatable; replaces the config grid)",
+    )
+    parser.add_argument("--workers", type=int, default=None, help="worker processes")
+    args = parser.parse_args()
+
+    cfg = load_config()
+    grid = dict(args.settings) if args.settings else cfg["sweep"]
+    n_points = len(pd.MultiIndex.from_product(list(grid.values())))
+    print(f"Sweeping {n_points} grid points over {', '.join(grid)}...")
+
+    start = time.perf_counter()
+    table = run_sweep(grid, cfg=cfg, n_workers=args.workers)
+    summary = sweep_summary(table)
+    print(f"  Done in {time.perf_counter() - start:.1f}s")
+
+    out_dir = get_project_root() / cfg["data"]["reports_dir"]
+    out_dir.mkdir(parents=True, exist_ok=True)
+    table.to_csv(out_dir / "sweep_results.csv", index=False)
+    summary.to_csv(out_dir / "sweep_summary.csv", index=False)
+
+    with pd.option_context("display.width", 160, "display.max_columns", None):
+        print()
+        print(summary.to_string(index=False, float_format="{:.4g}".format))
+    print(f"\nSaved results and summary tables to {out_dir}")
+
+
+if __name__ == "__main__":
+    main()
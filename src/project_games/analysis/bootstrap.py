@@ -0,0 +1,196 @@
+"""Bootstrap confidence intervals for market shares and per-game averages.
+
+Titles are resampled with the Poisson bootstrap: every replicate gives each row
+an independent Poisson(1) weight, which approximates multinomial resampling and
+needs no coordination between replicates. Every statistic here is a ratio of
+weighted group sums, so all of them come from one product of a weight matrix
+(replicates × rows) with a sparse design matrix (rows × group-and-column cells).
+Replicates are drawn in chunks to bound memory. One pass yields the intervals of
+every share and average, and the tables share the same replicates.
+"""
+
+import warnings
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from project_games.analysis.regional import REGION_COLS
+from project_games.config import load_config
+
+DEFAULT_BOOTSTRAP = {"n_boot": 2000, "ci": 0.95, "seed": 0, "chunk_size": 250}
+
+
+def group_design(codes: np.ndarray, n_groups: int, values: np.ndarray) -> sparse.csr_matrix:
+    """Sparse ``rows × (columns * n_groups)`` matrix that sums *values* by group.
+
+    Cell ``j * n_groups + g`` of row ``i`` holds ``values[i, j]`` when row *i* is
+    in group *g*. Rows with a negative code and NaN values contribute nothing.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    # An explicit column count, since ``reshape(0, -1)`` is ambiguous.
+    n_cols = values.shape[1] if values.ndim == 2 else 1
+    values = np.nan_to_num(values.reshape(len(codes), n_cols))
+    rows = np.flatnonzero(codes >= 0)
+    cells = np.arange(n_cols)[None, :] * n_groups + codes[rows, None]
+    return sparse.csr_matrix(
+        (values[rows].ravel(), (np.repeat(rows, n_cols), cells.ravel())),
+        shape=(len(codes), n_cols * n_groups),
+    )
+
+
+def replicate_sums(
+    design: sparse.spmatrix, n_boot: int = 2000, chunk_size: int = 250, seed: int = 0
+) -> np.ndarray:
+    """Poisson-bootstrap replicates (``n_boot × cells``) of the column sums of *design*."""
+    rng = np.random.default_rng(seed)
+    n_rows, n_cells = design.shape
+    design_t = sparse.csr_matrix(design.T)
+    out = np.empty((n_boot, n_cells))
+    for start in range(0, n_boot, chunk_size):
+        stop = min(start + chunk_size, n_boot)
+        weights = rng.poisson(1.0, size=(n_rows, stop - start)).astype(np.float64)
+        out[start:stop] = (design_t @ weights).T
+    return out
+
+
+def _nanquantile(values: np.ndarray, q, axis: int, keepdims: bool = False) -> np.ndarray:
+    """:func:`numpy.nanquantile` that gives NaN for empty or all-NaN slices."""
+    if values.size == 0:
+        shape = list(values.shape)
+        if keepdims:
+            shape[axis] = 1
+        else:
+            del shape[axis]
+        return np.full(np.shape(q) + tuple(shape), np.nan)
+    with warnings.catch_warnings():
+        # Cells without sales have no share in any replicate.
+        warnings.simplefilter("ignore", RuntimeWarning)
+        return np.nanquantile(values, q, axis=axis, keepdims=keepdims)
+
+
+def _interval(replicates: np.ndarray, ci: float) -> tuple[np.ndarray, np.ndarray]:
+    """Percentile interval along the replicate axis (NaN replicates ignored)."""
+    alpha = (1 - ci) / 2
+    low, high = _nanquantile(replicates, [alpha, 1 - alpha], axis=0)
+    return low, high
+
+
+def _codes(df: pd.DataFrame, by: str) -> tuple[np.ndarray, pd.Index]:
+    """Sorted group codes with missing keys coded as an extra, last group."""
+    codes, groups = pd.factorize(df[by], sort=True)
+    return np.where(codes < 0, len(groups), codes), pd.Index(groups, name=by)
+
+
+def _share_table(
+    point: np.ndarray, replicates: np.ndarray, groups: pd.Index, ci: float
+) -> pd.DataFrame:
+    """Tidy shares (%) per group and region from ``(.., regions, groups + 1)`` sums."""
+    with np.errstate(invalid="ignore", divide="ignore"):
+        point_share = point / point.sum(axis=-1, keepdims=True) * 100
+        shares = replicates / replicates.sum(axis=-1, keepdims=True) * 100
+    low, high = _interval(shares, ci)
+    n_groups = len(groups)
+    tables = [
+        pd.DataFrame(
+            {
+                groups.name: groups,
+                "region": region,
+                "share": point_share[j, :n_groups],
+                "low": low[j, :n_groups],
+                "high": high[j, :n_groups],
+            }
+        )
+        for j, region in enumerate(REGION_COLS)
+    ]
+    return pd.concat(tables, ignore_index=True)
+
+
+def _average_table(
+    point: np.ndarray, replicates: np.ndarray, groups: pd.Index, ci: float
+) -> pd.DataFrame:
+    """Per-game averages with intervals and tier probabilities from (sum, count) sums."""
+    n_groups = len(groups)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        point_avg = point[0, :n_groups] / point[1, :n_groups]
+        averages = replicates[:, 0, :n_groups] / replicates[:, 1, :n_groups]
+    low, high = _interval(averages, ci)
+
+    # Tiers as in classify_genres, redrawn in every replicate.
+    q75 = _nanquantile(averages, 0.75, axis=1, keepdims=True)
+    q25 = _nanquantile(averages, 0.25, axis=1, keepdims=True)
+    table = pd.DataFrame(
+        {
+            "sum": point[0, :n_groups],
+            "count": point[1, :n_groups].astype(np.int64),
+            "avg_per_game": point_avg,
+            "low": low,
+            "high": high,
+            "p_high_sales": (averages >= q75).mean(axis=0),
+            "p_low_sales": (averages <= q25).mean(axis=0),
+        },
+        index=groups,
+    )
+    return table.sort_values("sum", ascending=False)
+
+
+def bootstrap_intervals(
+    df: pd.DataFrame,
+    n_boot: int | None = None,
+    ci: float | None = None,
+    seed: int | None = None,
+    cfg: dict | None = None,
+) -> dict[str, pd.DataFrame]:
+    """Bootstrap intervals for every market share and per-game average of *df*.
+
+    Returns three tables that share the same replicates:
+
+    - ``platform_shares`` and ``genre_shares``: one row per group and region
+      with the share (%) of the region's sales, as in
+      :func:`~project_games.analysis.regional.market_share_platforms`, and its
+      ``low``/``high`` bounds;
+    - ``genre_averages``: :func:`~project_games.analysis.genre.genre_sales_summary`'s
+      ``sum``, ``count`` and ``avg_per_game`` with bounds on the average, and the
+      share of replicates in which each genre falls in the high or low tier of
+      :func:`~project_games.analysis.genre.classify_genres`.
+
+    Unset parameters come from the ``bootstrap`` config section.
+    """
+    if cfg is None:
+        cfg = load_config()
+    settings = {**DEFAULT_BOOTSTRAP, **cfg.get("bootstrap", {})}
+    n_boot = settings["n_boot"] if n_boot is None else n_boot
+    ci = settings["ci"] if ci is None else ci
+    seed = settings["seed"] if seed is None else seed
+
+    regional = df[list(REGION_COLS.values())].to_numpy(dtype=np.float64)
+    platform_codes, platforms = _codes(df, "platform")
+    genre_codes, genres = _codes(df, "genre")
+    totals = np.column_stack([df["total_sales"].to_numpy(dtype=np.float64), np.ones(len(df))])
+    designs = [
+        group_design(platform_codes, len(platforms) + 1, regional),
+        group_design(genre_codes, len(genres) + 1, regional),
+        group_design(genre_codes, len(genres) + 1, totals),
+    ]
+    design = sparse.hstack(designs, format="csr")
+    point = np.asarray(design.sum(axis=0)).ravel()
+    replicates = replicate_sums(design, n_boot, settings["chunk_size"], seed)
+
+    splits = np.cumsum([d.shape[1] for d in designs])[:-1]
+    points = np.split(point, splits)
+    parts = np.split(replicates, splits, axis=1)
+    n_regions = len(REGION_COLS)
+    return {
+        "platform_shares": _share_table(
+            points[0].reshape(n_regions, -1),
+            parts[0].reshape(n_boot, n_regions, -1),
+            platforms,
+            ci,
+        ),
+        "genre_shares": _share_table(
+            points[1].reshape(n_regions, -1), parts[1].reshape(n_boot, n_regions, -1), genres, ci
+        ),
+        "genre_averages": _average_table(
+            points[2].reshape(2, -1), parts[2].reshape(n_boot, 2, -1), genres, ci
+        ),
+    }
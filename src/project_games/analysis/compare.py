@@ -0,0 +1,138 @@
+"""Side-by-side comparison of analysis results across dataset snapshots.
+
+Each snapshot is loaded and analysed in its own worker process. Results are
+cached in the results store under the snapshot's file hash, so unchanged
+snapshots are served without being re-read or re-analysed.
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+from project_games.analysis.results import (
+    SECTIONS,
+    ResultsStore,
+    default_store,
+    pack_sections,
+    results_key,
+    run_analysis,
+)
+from project_games.config import load_config
+from project_games.data.fingerprint import file_fingerprint
+from project_games.data.loader import load_processed_data
+from project_games.workers import process_pool
+
+
+def analyze_snapshot(
+    path: str | Path, cfg: dict, store_path: str | Path
+) -> tuple[dict[str, pd.DataFrame], bool]:
+    """Packed analysis tables for one snapshot file, from the store when unchanged.
+
+    Returns ``(tables, from_store)``.
+    """
+    store = ResultsStore(store_path)
+    file_fp, config_fp = file_fingerprint(path), results_key(cfg)
+
+    tables = store.get(file_fp, config_fp)
+    if tables is not None and set(SECTIONS) <= tables.keys():
+        return tables, True
+
+    tables = pack_sections(run_analysis(load_processed_data(path), cfg))
+    store.put(file_fp, config_fp, tables)
+    return tables, False
+
+
+def snapshot_labels(paths: list[str | Path]) -> list[str]:
+    """Short unique labels for snapshot paths (file stems, full paths on clashes)."""
+    stems = [Path(p).stem for p in paths]
+    if len(set(stems)) == len(stems):
+        return stems
+    return [str(p) for p in paths]
+
+
+def _side_by_side(
+    tables: dict[str, dict[str, pd.DataFrame]], section: str, key: str, value: str
+) -> pd.DataFrame:
+    return pd.DataFrame(
+        {label: t[section].set_index(key)[value] for label, t in tables.items()}
+    )
+
+
+def _changed(wide: pd.DataFrame) -> pd.Series:
+    return wide.nunique(axis=1, dropna=False) > 1
+
+
+def diff_snapshots(
+    tables: dict[str, dict[str, pd.DataFrame]], cfg: dict
+) -> dict[str, pd.DataFrame]:
+    """Side-by-side tables of the key results, one column per snapshot label.
+
+    ``top_platforms`` covers the union of each snapshot's top-N platforms and adds
+    the sales delta between the first and last snapshot; the other tables flag the
+    rows whose value changed across snapshots.
+    """
+    labels = list(tables)
+    first, last = labels[0], labels[-1]
+    top_n = cfg["analysis"].get("top_n_platforms", 5)
+
+    sales = _side_by_side(tables, "platform_total_sales", "platform", "total_sales")
+    top = sorted({p for label in labels for p in sales[label].nlargest(top_n).index})
+    top_platforms = sales.loc[top].fillna(0)
+    top_platforms["delta"] = top_platforms[last] - top_platforms[first]
+    top_platforms = top_platforms.sort_values(last, ascending=False)
+
+    trends = _side_by_side(tables, "platform_growth_analysis", "platform", "trend")
+    trends["changed"] = _changed(trends[labels])
+
+    tiers = pd.DataFrame(
+        {
+            label: (
+                t["classify_genres"]
+                .set_index("genre")["tier"]
+                .reindex(t["genre_sales_summary"]["genre"])
+                .fillna("mid_sales")
+            )
+            for label, t in tables.items()
+        }
+    )
+    tiers["changed"] = _changed(tiers[labels])
+
+    p_values = _side_by_side(tables, "hypothesis_tests", "name", "p_value")
+    rejects = _side_by_side(tables, "hypothesis_tests", "name", "reject_null")
+    p_values["verdict_changed"] = _changed(rejects)
+
+    return {
+        "top_platforms": top_platforms,
+        "platform_trends": trends.sort_index(),
+        "genre_tiers": tiers.sort_index(),
+        "hypothesis_p_values": p_values,
+    }
+
+
+def compare_snapshots(
+    paths: list[str | Path],
+    cfg: dict | None = None,
+    store: ResultsStore | None = None,
+    n_workers: int | None = None,
+) -> tuple[dict[str, pd.DataFrame], dict[str, bool]]:
+    """Analyse snapshot files concurrently and diff their key tables.
+
+    Returns ``(diff_tables, from_store)`` where *from_store* maps each snapshot
+    label to whether its results came from the cache.
+    """
+    if cfg is None:
+        cfg = load_config()
+    if store is None:
+        store = default_store(cfg)
+
+    labels = snapshot_labels(paths)
+    with process_pool(min(n_workers or len(paths), len(paths))) as pool:
+        outputs = list(
+            pool.map(
+                analyze_snapshot, paths, [cfg] * len(paths), [store.path] * len(paths)
+            )
+        )
+
+    tables = {label: out[0] for label, out in zip(labels, outputs)}
+    from_store = {label: out[1] for label, out in zip(labels, outputs)}
+    return diff_snapshots(tables, cfg), from_store
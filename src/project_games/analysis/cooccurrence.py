@@ -0,0 +1,136 @@
+"""Sparse incidence matrices and the co-occurrence and similarity measures built on them.
+
+An :class:`Incidence` is a ``rows × columns`` ``scipy.sparse`` matrix built from
+two integer-coded columns of the dataset (titles × platforms, platforms ×
+genres, ...), optionally weighted by a sales column. Every measure below is a
+product of the incidence matrix with itself, so the cost grows with the number
+of non-zero entries, not with ``rows × columns``. The ``columns × columns``
+results are small and returned as labelled DataFrames.
+"""
+
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from project_games.analysis.regional import REGION_COLS
+
+
+@dataclass
+class Incidence:
+    """A ``rows × columns`` sparse matrix with the labels of its axes.
+
+    Stored entries mark presence; their values are the summed weights (1 when
+    unweighted). A pair with a zero weight is still present.
+    """
+
+    matrix: sparse.csr_matrix
+    rows: pd.Index
+    columns: pd.Index
+
+    def binary(self) -> "Incidence":
+        """Same pattern with every stored entry set to 1."""
+        matrix = self.matrix.copy()
+        matrix.data = np.ones_like(matrix.data)
+        return Incidence(matrix, self.rows, self.columns)
+
+
+def incidence_matrix(
+    df: pd.DataFrame, row: str = "name", column: str = "platform", weight: str | None = None
+) -> Incidence:
+    """Incidence of *row* values × *column* values in *df*.
+
+    Labels are integer-coded over their sorted uniques. Rows with a missing label
+    are dropped. Repeated pairs sum their *weight*, or count once when unweighted.
+    Missing weights count as 0.
+    """
+    row_codes, rows = pd.factorize(df[row], sort=True)
+    col_codes, columns = pd.factorize(df[column], sort=True)
+    keep = (row_codes >= 0) & (col_codes >= 0)
+    if weight is None:
+        data = np.ones(int(keep.sum()))
+    else:
+        data = np.nan_to_num(df[weight].to_numpy(dtype=np.float64)[keep])
+    matrix = sparse.csr_matrix(
+        (data, (row_codes[keep], col_codes[keep])), shape=(len(rows), len(columns))
+    )
+    # One stored entry per pair; zero-weight entries stay stored, marking presence.
+    matrix.sum_duplicates()
+    incidence = Incidence(matrix, pd.Index(rows, name=row), pd.Index(columns, name=column))
+    return incidence if weight is not None else incidence.binary()
+
+
+def _frame(values: np.ndarray, labels: pd.Index) -> pd.DataFrame:
+    return pd.DataFrame(values, index=labels, columns=labels.rename(None))
+
+
+def _gram(incidence: Incidence) -> np.ndarray:
+    return (incidence.matrix.T @ incidence.matrix).toarray()
+
+
+def cooccurrence(incidence: Incidence) -> pd.DataFrame:
+    """Number of rows shared by each pair of columns.
+
+    The diagonal holds the number of rows of each column.
+    """
+    return _frame(_gram(incidence.binary()), incidence.columns)
+
+
+def cosine_similarity(incidence: Incidence) -> pd.DataFrame:
+    """Cosine similarity of the (weighted) column vectors; 0 for empty columns."""
+    gram = _gram(incidence)
+    norms = np.sqrt(np.diag(gram))
+    outer = np.outer(norms, norms)
+    similarity = np.divide(gram, outer, out=np.zeros_like(gram), where=outer > 0)
+    return _frame(similarity, incidence.columns)
+
+
+def jaccard_similarity(incidence: Incidence) -> pd.DataFrame:
+    """Shared rows over the union of rows for each pair of columns."""
+    shared = _gram(incidence.binary())
+    sizes = np.diag(shared)
+    union = sizes[:, None] + sizes[None, :] - shared
+    similarity = np.divide(shared, union, out=np.zeros_like(shared), where=union > 0)
+    return _frame(similarity, incidence.columns)
+
+
+def sales_overlap(incidence: Incidence) -> pd.DataFrame:
+    """Share of each column's weight coming from rows that also have another column.
+
+    Entry ``(a, b)`` is the weight of column *a* over the rows present in column
+    *b*, divided by the total weight of *a*. For titles × platforms weighted by
+    sales, that is the fraction of *a*'s sales made by titles also released on
+    *b*. The measure is not symmetric.
+    """
+    overlap = (incidence.matrix.T @ incidence.binary().matrix).toarray()
+    totals = np.asarray(incidence.matrix.sum(axis=0)).ravel()[:, None]
+    share = np.divide(overlap, totals, out=np.zeros_like(overlap), where=totals != 0)
+    return _frame(share, incidence.columns)
+
+
+def genre_similarity_by_region(df: pd.DataFrame) -> dict[str, pd.DataFrame]:
+    """Per region, cosine similarity of genres by their sales across platforms.
+
+    Two genres are similar in a region when their sales there are spread over
+    the platforms in similar proportions.
+    """
+    return {
+        region: cosine_similarity(incidence_matrix(df, "platform", "genre", weight=col))
+        for region, col in REGION_COLS.items()
+    }
+
+
+def top_pairs(matrix: pd.DataFrame, n: int = 10, symmetric: bool = True) -> pd.DataFrame:
+    """The *n* largest off-diagonal entries as a ``(a, b, value)`` table.
+
+    With *symmetric*, each unordered pair is listed once.
+    """
+    values = matrix.to_numpy()
+    size = len(values)
+    mask = np.triu(np.ones((size, size), dtype=bool), k=1)
+    if not symmetric:
+        mask |= mask.T
+    a, b = np.nonzero(mask)
+    pairs = pd.DataFrame({"a": matrix.index[a], "b": matrix.columns[b], "value": values[a, b]})
+    return pairs.sort_values("value", ascending=False, kind="stable").head(n).reset_index(drop=True)
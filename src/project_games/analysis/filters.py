@@ -0,0 +1,126 @@
+"""Bitmap index for interactive cross-filtering of the games dataset.
+
+Every distinct platform, genre, rating and year gets a packed bitmap (one bit per
+row) built once at load time. A selection is answered with bitwise OR within a
+column and AND across columns, so combining filters never rescans the frame.
+Range columns additionally keep cumulative bitmaps so any ``[lo, hi]`` range costs
+a single AND-NOT.
+"""
+
+from collections.abc import Iterable
+
+import numpy as np
+import pandas as pd
+
+FILTER_COLUMNS = ("platform", "genre", "rating", "year_of_release")
+RANGE_COLUMNS = ("year_of_release",)
+
+
+class BitmapIndex:
+    """Packed per-value bitmaps over the rows of one DataFrame."""
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        columns: Iterable[str] = FILTER_COLUMNS,
+        range_columns: Iterable[str] = RANGE_COLUMNS,
+    ):
+        self.n_rows = len(df)
+        self._n_bytes = (self.n_rows + 7) // 8
+        self._bitmaps: dict[str, dict] = {}
+        self._ranges: dict[str, tuple[np.ndarray, np.ndarray]] = {}
+
+        for col in columns:
+            codes, uniques = pd.factorize(df[col], sort=True)
+            # Rows sorted by code; missing keys (code -1) come first and are skipped.
+            order = np.argsort(codes, kind="stable")
+            counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+            stops = np.cumsum(counts) + int((codes < 0).sum())
+            bitmaps = {}
+            for value, start, stop in zip(uniques, stops - counts, stops):
+                bits = np.zeros(self.n_rows, dtype=bool)
+                bits[order[start:stop]] = True
+                bitmaps[value] = np.packbits(bits)
+            self._bitmaps[col] = bitmaps
+
+            if col in range_columns:
+                values = np.asarray(uniques)
+                stacked = (
+                    np.stack(list(bitmaps.values()))
+                    if bitmaps
+                    else np.zeros((0, self._n_bytes), dtype=np.uint8)
+                )
+                cumulative = np.bitwise_or.accumulate(stacked, axis=0)
+                self._ranges[col] = (values, cumulative)
+
+    def _empty(self) -> np.ndarray:
+        return np.zeros(self._n_bytes, dtype=np.uint8)
+
+    def _full(self) -> np.ndarray:
+        return np.packbits(np.ones(self.n_rows, dtype=bool))
+
+    def values(self, column: str) -> list:
+        """Sorted distinct values indexed for *column*."""
+        return list(self._bitmaps[column])
+
+    def _range_bitmap(self, column: str, lo, hi) -> np.ndarray:
+        values, cumulative = self._ranges[column]
+        upper = np.searchsorted(values, hi, side="right") - 1
+        lower = np.searchsorted(values, lo, side="left") - 1
+        if upper < 0 or upper <= lower:
+            return self._empty()
+        bits = cumulative[upper].copy()
+        if lower >= 0:
+            bits &= ~cumulative[lower]
+        return bits
+
+    def bitmap(
+        self,
+        selections: dict[str, Iterable] | None = None,
+        ranges: dict[str, tuple] | None = None,
+    ) -> np.ndarray:
+        """Packed bitmap of rows matching every selection and range.
+
+        *selections* maps a column to accepted values (empty or ``None`` means no
+        constraint); *ranges* maps a range column to an inclusive ``(lo, hi)``.
+        """
+        bits = self._full()
+        for col, accepted in (selections or {}).items():
+            if not accepted:
+                continue
+            column_bits = self._empty()
+            for value in accepted:
+                if value in self._bitmaps[col]:
+                    column_bits |= self._bitmaps[col][value]
+            bits &= column_bits
+        for col, (lo, hi) in (ranges or {}).items():
+            bits &= self._range_bitmap(col, lo, hi)
+        return bits
+
+    def positions(
+        self,
+        selections: dict[str, Iterable] | None = None,
+        ranges: dict[str, tuple] | None = None,
+    ) -> np.ndarray:
+        """Row positions matching the selection, in ascending order."""
+        bits = np.unpackbits(self.bitmap(selections, ranges), count=self.n_rows)
+        return np.flatnonzero(bits)
+
+    def count(
+        self,
+        selections: dict[str, Iterable] | None = None,
+        ranges: dict[str, tuple] | None = None,
+    ) -> int:
+        """Number of rows matching the selection."""
+        return int(np.unpackbits(self.bitmap(selections, ranges), count=self.n_rows).sum())
+
+    def filter(
+        self,
+        df: pd.DataFrame,
+        selections: dict[str, Iterable] | None = None,
+        ranges: dict[str, tuple] | None = None,
+    ) -> pd.DataFrame:
+        """Rows of *df* (the frame the index was built from) matching the selection."""
+        if len(df) != self.n_rows:
+            raise ValueError(f"Index built for {self.n_rows} rows, got {len(df)}")
+        return df.iloc[self.positions(selections, ranges)].reset_index(drop=True)
@@ -19,7 +19,11 @@ def genre_sales_summary(df: pd.DataFrame) -> pd.DataFrame:
 
 def classify_genres(df: pd.DataFrame) -> dict[str, list[str]]:
     """Classify genres into high/low sales tiers using quartiles."""
-    stats = genre_sales_summary(df)
+    return _genre_tiers(genre_sales_summary(df))
+
+
+def _genre_tiers(stats: pd.DataFrame) -> dict[str, list[str]]:
+    """High/low sales tiers from a :func:`genre_sales_summary` table."""
     q75 = stats["avg_per_game"].quantile(0.75)
     q25 = stats["avg_per_game"].quantile(0.25)
     return {
@@ -1,7 +1,8 @@
-from dataclasses import dataclass
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
 
+import numpy as np
 import pandas as pd
-from scipy import stats
 
 from project_games.config import load_config
 
@@ -19,35 +20,139 @@ class HypothesisResult:
     p_value: float
     alpha: float
     reject_null: bool
+    column: str = ""
+    group_column: str = ""
+    test: str = "welch"
+    alternative: str = "two-sided"
+    levene_p: float | None = None
+    sample_a: np.ndarray | None = field(default=None, repr=False, compare=False)
+    sample_b: np.ndarray | None = field(default=None, repr=False, compare=False)
 
     def summary(self) -> str:
         verdict = "REJECT H0" if self.reject_null else "FAIL TO REJECT H0"
         return (
             f"{self.name}: {self.group_a_label} (n={self.n_a}, mean={self.mean_a:.4f}) "
             f"vs {self.group_b_label} (n={self.n_b}, mean={self.mean_b:.4f}) | "
-            f"t={self.t_statistic:.4f}, p={self.p_value:.6f} => {verdict}"
+            f"{self.test} ({self.alternative}) stat={self.t_statistic:.4f}, "
+            f"p={self.p_value:.6f} => {verdict}"
         )
 
 
-def run_ttest(
-    df: pd.DataFrame,
-    column: str,
-    group_column: str,
+def group_samples(df: pd.DataFrame, group_column: str, column: str) -> dict[str, np.ndarray]:
+    """Non-null *column* values for every value of *group_column*, in one pass."""
+    values = df[[group_column, column]].dropna()
+    codes, uniques = pd.factorize(values[group_column])
+    order = np.argsort(codes, kind="stable")
+    bounds = np.cumsum(np.bincount(codes, minlength=len(uniques)))[:-1]
+    return dict(zip(uniques, np.split(values[column].to_numpy()[order], bounds)))
+
+
+def collect_samples(
+    df: pd.DataFrame, keys: Iterable[tuple[str, str, str]]
+) -> dict[tuple[str, str, str], np.ndarray]:
+    """Non-null samples for many ``(group_column, column, group)`` keys.
+
+    Each group column is sorted once, restricted to the requested groups; every
+    requested column is then sliced from that one ordering.
+    """
+    wanted: dict[str, dict[str, set]] = {}
+    for group_column, column, group in keys:
+        wanted.setdefault(group_column, {}).setdefault(column, set()).add(group)
+
+    samples = {}
+    for group_column, by_column in wanted.items():
+        groups = sorted(set().union(*by_column.values()), key=str)
+        codes = pd.Index(groups).get_indexer(df[group_column])
+        order = np.argsort(codes, kind="stable")
+        counts = np.bincount(codes[codes >= 0], minlength=len(groups))
+        stops = np.cumsum(counts) + int((codes < 0).sum())
+        for column, needed in by_column.items():
+            values = df[column].to_numpy(dtype=float)[order]
+            for group, start, stop in zip(groups, stops - counts, stops):
+                if group in needed:
+                    chunk = values[start:stop]
+                    samples[(group_column, column, group)] = chunk[~np.isnan(chunk)]
+    return samples
+
+
+TestResult = tuple[str, float, float, float | None]
+ALTERNATIVES = ("two-sided", "less", "greater")
+
+
+# scipy.stats is imported inside the tests: it is slow to import and most
+# importers of this module (the app, the API, result sections) never run a test.
+
+
+def _student(a: np.ndarray, b: np.ndarray, alternative: str, alpha: float) -> TestResult:
+    from scipy import stats
+
+    res = stats.ttest_ind(a, b, equal_var=True, alternative=alternative)
+    return "student", res.statistic, res.pvalue, None
+
+
+def _welch(a: np.ndarray, b: np.ndarray, alternative: str, alpha: float) -> TestResult:
+    from scipy import stats
+
+    res = stats.ttest_ind(a, b, equal_var=False, alternative=alternative)
+    return "welch", res.statistic, res.pvalue, None
+
+
+def _levene_then_ttest(
+    a: np.ndarray, b: np.ndarray, alternative: str, alpha: float
+) -> TestResult:
+    """Student's t-test when Levene's test keeps equal variances, Welch's otherwise."""
+    from scipy import stats
+
+    levene_p = stats.levene(a, b).pvalue
+    ttest = _student if levene_p >= alpha else _welch
+    name, statistic, p_value, _ = ttest(a, b, alternative, alpha)
+    return name, statistic, p_value, levene_p
+
+
+def _mannwhitney(a: np.ndarray, b: np.ndarray, alternative: str, alpha: float) -> TestResult:
+    from scipy import stats
+
+    res = stats.mannwhitneyu(a, b, alternative=alternative)
+    return "mannwhitney", res.statistic, res.pvalue, None
+
+
+TESTS: dict[str, Callable[[np.ndarray, np.ndarray, str, float], TestResult]] = {
+    "student": _student,
+    "welch": _welch,
+    "levene_then_ttest": _levene_then_ttest,
+    "mannwhitney": _mannwhitney,
+}
+
+
+def compare_samples(
+    scores_a: np.ndarray,
+    scores_b: np.ndarray,
     group_a: str,
     group_b: str,
     alpha: float = 0.05,
     name: str = "",
+    column: str = "",
+    group_column: str = "",
+    test: str = "welch",
+    alternative: str = "two-sided",
 ) -> HypothesisResult:
-    """Run Welch's t-test comparing *column* between two groups."""
-    scores_a = df[df[group_column] == group_a][column].dropna()
-    scores_b = df[df[group_column] == group_b][column].dropna()
+    """Run *test* (a key of :data:`TESTS`) on two pre-extracted samples.
 
+    ``t_statistic`` holds the statistic of the test actually run (U for
+    Mann-Whitney); ``test`` records which one ``levene_then_ttest`` picked.
+    """
+    if test not in TESTS:
+        raise ValueError(f"Unknown test {test!r}; expected one of {', '.join(TESTS)}")
+    if alternative not in ALTERNATIVES:
+        raise ValueError(
+            f"Unknown alternative {alternative!r}; expected one of {', '.join(ALTERNATIVES)}"
+        )
     if len(scores_a) < 2 or len(scores_b) < 2:
         raise ValueError(
             f"Insufficient data: {group_a}={len(scores_a)}, {group_b}={len(scores_b)}"
         )
 
-    t_stat, p_val = stats.ttest_ind(scores_a, scores_b, equal_var=False)
+    test_run, statistic, p_val, levene_p = TESTS[test](scores_a, scores_b, alternative, alpha)
 
     return HypothesisResult(
         name=name or f"{group_a}_vs_{group_b}",
@@ -57,32 +162,99 @@ def run_ttest(
         n_b=len(scores_b),
         mean_a=scores_a.mean(),
         mean_b=scores_b.mean(),
-        t_statistic=t_stat,
+        t_statistic=statistic,
         p_value=p_val,
         alpha=alpha,
         reject_null=p_val < alpha,
+        column=column,
+        group_column=group_column,
+        test=test_run,
+        alternative=alternative,
+        levene_p=levene_p,
+        sample_a=scores_a,
+        sample_b=scores_b,
     )
 
 
+def run_ttest(
+    df: pd.DataFrame,
+    column: str,
+    group_column: str,
+    group_a: str,
+    group_b: str,
+    alpha: float = 0.05,
+    name: str = "",
+    test: str = "welch",
+    alternative: str = "two-sided",
+) -> HypothesisResult:
+    """Compare *column* between two groups (Welch's t-test unless *test* says otherwise)."""
+    samples = collect_samples(
+        df, [(group_column, column, group_a), (group_column, column, group_b)]
+    )
+    return compare_samples(
+        samples[(group_column, column, group_a)],
+        samples[(group_column, column, group_b)],
+        group_a,
+        group_b,
+        alpha=alpha,
+        name=name,
+        column=column,
+        group_column=group_column,
+        test=test,
+        alternative=alternative,
+    )
+
+
+def configured_sample_keys(cfg: dict) -> list[tuple[str, str, str]]:
+    """``(group_column, column, group)`` sample keys of the configured tests."""
+    return [
+        (t["group_column"], t["column"], group)
+        for t in cfg["hypothesis_tests"]
+        for group in (t["group_a"], t["group_b"])
+    ]
+
+
 def run_configured_tests(
-    df: pd.DataFrame, cfg: dict | None = None
+    df: pd.DataFrame,
+    cfg: dict | None = None,
+    skip_insufficient: bool = False,
+    samples: dict[tuple[str, str, str], np.ndarray] | None = None,
 ) -> list[HypothesisResult]:
-    """Run all hypothesis tests defined in config/default.yaml."""
+    """Run all hypothesis tests defined in config/default.yaml.
+
+    Each entry's ``test`` (default ``welch``) and ``alternative`` (default
+    ``two-sided``) are honoured. The samples of every test are extracted up front
+    in one pass per group column, unless already extracted *samples* (see
+    :func:`collect_samples` and :func:`configured_sample_keys`) are passed. With
+    *skip_insufficient*, tests whose groups have fewer than two values (e.g. on a
+    filtered subset) are left out instead of raising.
+    """
     if cfg is None:
         cfg = load_config()
 
     alpha = cfg["analysis"]["significance_level"]
-    results = []
+    tests = cfg["hypothesis_tests"]
+    if samples is None:
+        samples = collect_samples(df, configured_sample_keys(cfg))
 
-    for test_cfg in cfg["hypothesis_tests"]:
-        result = run_ttest(
-            df,
-            column=test_cfg["column"],
-            group_column=test_cfg["group_column"],
+    results = []
+    for test_cfg in tests:
+        key = (test_cfg["group_column"], test_cfg["column"])
+        sample_a = samples[(*key, test_cfg["group_a"])]
+        sample_b = samples[(*key, test_cfg["group_b"])]
+        if skip_insufficient and (len(sample_a) < 2 or len(sample_b) < 2):
+            continue
+        result = compare_samples(
+            sample_a,
+            sample_b,
             group_a=test_cfg["group_a"],
             group_b=test_cfg["group_b"],
             alpha=alpha,
             name=test_cfg["name"],
+            column=test_cfg["column"],
+            group_column=test_cfg["group_column"],
+            test=test_cfg.get("test", "welch"),
+            alternative=test_cfg.get("alternative", "two-sided"),
         )
         results.append(result)
 
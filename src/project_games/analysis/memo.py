@@ -0,0 +1,93 @@
+"""Bounded LRU memoization of analysis calls keyed by dataset fingerprint.
+
+One :class:`AnalysisCache` is meant to be shared by every dashboard session, so
+repeated calls with the same data and parameters are served from memory. Frames
+passed to the cache are treated as immutable: their fingerprint is computed once
+per object and reused for as long as the object is alive.
+"""
+
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+import pandas as pd
+
+from project_games.data.fingerprint import dataset_fingerprint
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable representation of call parameters (lists, dicts, sets, frames)."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return tuple(sorted(_freeze(v) for v in value))
+    return value
+
+
+class AnalysisCache:
+    """Thread-safe LRU cache for ``func(df, *args, **kwargs)`` calls."""
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, Any] = OrderedDict()
+        self._fingerprints: dict[int, tuple[weakref.ref, str]] = {}
+        self._lock = threading.RLock()
+
+    def fingerprint(self, df: pd.DataFrame | pd.Series) -> str:
+        """Dataset fingerprint of *df*, computed once per live object."""
+        key = id(df)
+        with self._lock:
+            entry = self._fingerprints.get(key)
+            if entry is not None and entry[0]() is df:
+                return entry[1]
+
+        fp = dataset_fingerprint(df.to_frame() if isinstance(df, pd.Series) else df)
+        with self._lock:
+            self._fingerprints[key] = (weakref.ref(df, lambda _: self._forget(key)), fp)
+        return fp
+
+    def _forget(self, key: int) -> None:
+        with self._lock:
+            self._fingerprints.pop(key, None)
+
+    def call(self, func: Callable, df: pd.DataFrame, *args, **kwargs) -> Any:
+        """Return ``func(df, *args, **kwargs)``, from the cache when possible.
+
+        Cached results are shared between callers and must not be mutated.
+        """
+        key = (
+            func.__module__,
+            func.__qualname__,
+            self.fingerprint(df),
+            _freeze(args),
+            _freeze(kwargs),
+        )
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        result = func(df, *args, **kwargs)
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._fingerprints.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
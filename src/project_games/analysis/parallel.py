@@ -0,0 +1,268 @@
+"""Map-reduce backend for the grouped aggregations in ``analysis/*``.
+
+Group keys are integer-coded once in the parent process, and the codes and value
+columns are copied into shared memory. Each worker attaches to the shared blocks,
+reduces a contiguous row partition into per-group partial sums and counts, and
+the parent adds the partials together. The functions at the bottom of this
+module are drop-in replacements for their serial counterparts, and
+:func:`grouped_sections` runs them all for
+:func:`~project_games.analysis.results.run_sections` when the ``parallel.workers``
+config is not 1.
+
+Only the reductions run in the workers. The parent still factorizes the keys,
+copies the columns into shared memory and computes the exact genre medians,
+which are not decomposable over partitions. These serial steps bound the
+speed-up.
+"""
+
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+from project_games.analysis.genre import _genre_tiers
+from project_games.analysis.platform import _growth_table
+from project_games.analysis.regional import (
+    REGION_COLS,
+    _rating_table,
+    _share_table,
+    _top_by_region,
+)
+from project_games.workers import default_workers, process_pool
+
+# Below this many rows the pool start-up costs more than it saves.
+MIN_PARALLEL_ROWS = 200_000
+
+_STATS = ("sum", "count")
+
+
+def _reduce_partition(codes: np.ndarray, values: np.ndarray, n_groups: int) -> np.ndarray:
+    """Partial (rows, sum, count) per group for one row partition.
+
+    *values* has shape (n_columns, n_rows); NaN values and negative codes are skipped.
+    """
+    n_cols = values.shape[0]
+    out = np.zeros((1 + 2 * n_cols, n_groups))
+    keyed = codes >= 0
+    out[0] = np.bincount(codes[keyed], minlength=n_groups)
+    for j in range(n_cols):
+        v = values[j]
+        valid = keyed & ~np.isnan(v)
+        c = codes[valid]
+        out[1 + 2 * j] = np.bincount(c, weights=v[valid], minlength=n_groups)
+        out[2 + 2 * j] = np.bincount(c, minlength=n_groups)
+    return out
+
+
+def _shared_worker(
+    codes_name: str,
+    values_name: str,
+    n_rows: int,
+    n_cols: int,
+    n_groups: int,
+    start: int,
+    stop: int,
+) -> np.ndarray:
+    codes_shm = shared_memory.SharedMemory(name=codes_name)
+    values_shm = shared_memory.SharedMemory(name=values_name)
+    try:
+        codes = np.ndarray((n_rows,), dtype=np.int64, buffer=codes_shm.buf)
+        values = np.ndarray((n_cols, n_rows), dtype=np.float64, buffer=values_shm.buf)
+        partial = _reduce_partition(codes[start:stop], values[:, start:stop], n_groups)
+        del codes, values
+        return partial
+    finally:
+        codes_shm.close()
+        values_shm.close()
+
+
+def _encode_keys(df: pd.DataFrame, by: list[str]) -> tuple[np.ndarray, list[pd.Index]]:
+    """Mixed-radix integer code per row over the sorted uniques of each key column."""
+    codes = np.zeros(len(df), dtype=np.int64)
+    missing = np.zeros(len(df), dtype=bool)
+    levels = []
+    for col in by:
+        col_codes, uniques = pd.factorize(df[col], sort=True)
+        missing |= col_codes < 0
+        codes = codes * len(uniques) + col_codes
+        levels.append(pd.Index(uniques, name=col))
+    codes[missing] = -1
+    return codes, levels
+
+
+def _partition_bounds(n_rows: int, n_partitions: int) -> list[tuple[int, int]]:
+    edges = np.linspace(0, n_rows, n_partitions + 1).astype(int)
+    return [(int(a), int(b)) for a, b in zip(edges[:-1], edges[1:]) if b > a]
+
+
+def grouped_moments(
+    df: pd.DataFrame,
+    by: str | list[str],
+    columns: list[str],
+    n_workers: int | None = None,
+    min_rows: int | None = None,
+) -> pd.DataFrame:
+    """Per-group sum and count of *columns*.
+
+    Rows with a missing key are dropped (as in ``groupby``) and NaN values are
+    excluded from the statistics of their column. The result is indexed by the
+    observed key combinations in sorted order and has one ``{column}_{stat}``
+    column per statistic.
+
+    Frames shorter than *min_rows* (default :data:`MIN_PARALLEL_ROWS`), or
+    ``n_workers=1``, are reduced in-process.
+    """
+    by = [by] if isinstance(by, str) else list(by)
+    if min_rows is None:
+        min_rows = MIN_PARALLEL_ROWS
+    n_workers = n_workers or default_workers()
+    codes, levels = _encode_keys(df, by)
+    n_groups = int(np.prod([len(level) for level in levels]))
+    values = np.ascontiguousarray(df[columns].to_numpy(dtype=np.float64).T)
+    n_rows, n_cols = len(df), len(columns)
+
+    if n_workers == 1 or n_rows < min_rows:
+        totals = _reduce_partition(codes, values, n_groups)
+    else:
+        codes_shm = shared_memory.SharedMemory(create=True, size=max(codes.nbytes, 1))
+        values_shm = shared_memory.SharedMemory(create=True, size=max(values.nbytes, 1))
+        try:
+            np.ndarray(codes.shape, dtype=codes.dtype, buffer=codes_shm.buf)[:] = codes
+            np.ndarray(values.shape, dtype=values.dtype, buffer=values_shm.buf)[:] = values
+            bounds = _partition_bounds(n_rows, n_workers)
+            with process_pool(n_workers) as pool:
+                partials = pool.map(
+                    _shared_worker,
+                    *zip(*[
+                        (codes_shm.name, values_shm.name, n_rows, n_cols, n_groups, a, b)
+                        for a, b in bounds
+                    ]),
+                )
+                totals = sum(partials)
+        finally:
+            codes_shm.close()
+            codes_shm.unlink()
+            values_shm.close()
+            values_shm.unlink()
+
+    if len(by) == 1:
+        index = levels[0]
+    else:
+        index = pd.MultiIndex.from_product(levels)
+    observed = totals[0] > 0
+
+    data = {}
+    for j, col in enumerate(columns):
+        for k, stat in enumerate(_STATS):
+            data[f"{col}_{stat}"] = totals[1 + 2 * j + k][observed]
+    out = pd.DataFrame(data, index=index[observed])
+    count_cols = [f"{col}_count" for col in columns]
+    out[count_cols] = out[count_cols].astype("int64")
+    return out
+
+
+def _sums(moments: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
+    return moments[[f"{col}_sum" for col in columns]].set_axis(columns, axis=1)
+
+
+def platform_total_sales(df: pd.DataFrame, n_workers: int | None = None) -> pd.Series:
+    """Parallel equivalent of :func:`project_games.analysis.platform.platform_total_sales`."""
+    moments = grouped_moments(df, "platform", ["total_sales"], n_workers)
+    return _sums(moments, ["total_sales"])["total_sales"].sort_values(ascending=False)
+
+
+def platform_yearly_sales(
+    df: pd.DataFrame,
+    top_platforms: list[str] | None = None,
+    n_workers: int | None = None,
+) -> pd.DataFrame:
+    """Parallel equivalent of :func:`project_games.analysis.platform.platform_yearly_sales`."""
+    if top_platforms is not None:
+        df = df[df["platform"].isin(top_platforms)]
+    moments = grouped_moments(df, ["platform", "year_of_release"], ["total_sales"], n_workers)
+    return _sums(moments, ["total_sales"])["total_sales"].unstack(fill_value=0)
+
+
+def genre_sales_summary(df: pd.DataFrame, n_workers: int | None = None) -> pd.DataFrame:
+    """Parallel equivalent of :func:`project_games.analysis.genre.genre_sales_summary`.
+
+    The median is not decomposable over partitions, so it is computed exactly in
+    the parent with a single groupby.
+    """
+    moments = grouped_moments(df, "genre", ["total_sales"], n_workers)
+    stats = pd.DataFrame(
+        {
+            "sum": moments["total_sales_sum"],
+            "mean": moments["total_sales_sum"] / moments["total_sales_count"],
+            "median": df.groupby("genre")["total_sales"].median(),
+            "count": moments["total_sales_count"],
+        }
+    ).sort_values("sum", ascending=False)
+    stats["avg_per_game"] = stats["sum"] / stats["count"]
+    return stats
+
+
+def top_platforms_by_region(
+    df: pd.DataFrame, top_n: int = 5, n_workers: int | None = None
+) -> dict[str, pd.Series]:
+    """Parallel equivalent of :func:`project_games.analysis.regional.top_platforms_by_region`."""
+    cols = list(REGION_COLS.values())
+    return _top_by_region(_sums(grouped_moments(df, "platform", cols, n_workers), cols), top_n)
+
+
+def top_genres_by_region(
+    df: pd.DataFrame, top_n: int = 5, n_workers: int | None = None
+) -> dict[str, pd.Series]:
+    """Parallel equivalent of :func:`project_games.analysis.regional.top_genres_by_region`."""
+    cols = list(REGION_COLS.values())
+    return _top_by_region(_sums(grouped_moments(df, "genre", cols, n_workers), cols), top_n)
+
+
+def market_share_platforms(
+    df: pd.DataFrame, top_n: int = 5, n_workers: int | None = None
+) -> pd.DataFrame:
+    """Parallel equivalent of :func:`project_games.analysis.regional.market_share_platforms`."""
+    cols = list(REGION_COLS.values())
+    sums = _sums(grouped_moments(df, "platform", cols, n_workers), cols)
+    return _share_table(sums, df[cols].sum(), top_n)
+
+
+def market_share_genres(
+    df: pd.DataFrame, top_n: int = 5, n_workers: int | None = None
+) -> pd.DataFrame:
+    """Parallel equivalent of :func:`project_games.analysis.regional.market_share_genres`."""
+    cols = list(REGION_COLS.values())
+    sums = _sums(grouped_moments(df, "genre", cols, n_workers), cols)
+    return _share_table(sums, df[cols].sum(), top_n)
+
+
+def rating_sales_by_region(df: pd.DataFrame, n_workers: int | None = None) -> pd.DataFrame:
+    """Parallel equivalent of :func:`project_games.analysis.regional.rating_sales_by_region`."""
+    cols = list(REGION_COLS.values())
+    moments = grouped_moments(df, "rating", cols, n_workers)
+    means = pd.DataFrame(
+        {col: moments[f"{col}_sum"] / moments[f"{col}_count"] for col in cols}
+    )
+    return _rating_table(_sums(moments, cols), means)
+
+
+def grouped_sections(df_rel: pd.DataFrame, n_workers: int | None = None) -> dict:
+    """The grouped sections of :func:`~project_games.analysis.results.run_sections`.
+
+    *df_rel* is the relevant-period frame.
+    """
+    total = platform_total_sales(df_rel, n_workers)
+    yearly = platform_yearly_sales(df_rel, n_workers=n_workers)
+    summary = genre_sales_summary(df_rel, n_workers)
+    return {
+        "platform_total_sales": total,
+        "platform_yearly_sales": yearly,
+        "platform_growth_analysis": _growth_table(total, yearly),
+        "genre_sales_summary": summary,
+        "classify_genres": _genre_tiers(summary),
+        "top_platforms_by_region": top_platforms_by_region(df_rel, n_workers=n_workers),
+        "top_genres_by_region": top_genres_by_region(df_rel, n_workers=n_workers),
+        "market_share_platforms": market_share_platforms(df_rel, n_workers=n_workers),
+        "market_share_genres": market_share_genres(df_rel, n_workers=n_workers),
+        "rating_sales_by_region": rating_sales_by_region(df_rel, n_workers),
+    }
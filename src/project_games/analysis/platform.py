@@ -43,14 +43,24 @@ def platform_lifecycle(platform_year_sales: pd.DataFrame) -> pd.DataFrame:
                 "is_active": sales[sales.index >= max_year].sum() > 0,
             }
         )
-    return pd.DataFrame(rows).sort_values("total_sales", ascending=False).reset_index(drop=True)
+    columns = [
+        "platform", "first_year", "last_year", "peak_year", "peak_sales",
+        "life_cycle", "total_sales", "is_active",
+    ]
+    return (
+        pd.DataFrame(rows, columns=columns)
+        .sort_values("total_sales", ascending=False)
+        .reset_index(drop=True)
+    )
 
 
 def platform_growth_analysis(df: pd.DataFrame) -> pd.DataFrame:
     """Compute growth rates and trends for each platform."""
-    sales_by_platform = platform_total_sales(df)
-    yearly = platform_yearly_sales(df)
+    return _growth_table(platform_total_sales(df), platform_yearly_sales(df))
+
 
+def _growth_table(sales_by_platform: pd.Series, yearly: pd.DataFrame) -> pd.DataFrame:
+    """Growth rates and trends from total and per-year sales per platform."""
     rows = []
     for platform in sales_by_platform.index:
         if platform not in yearly.index:
@@ -86,7 +96,12 @@ def platform_growth_analysis(df: pd.DataFrame) -> pd.DataFrame:
                 "last_year_sales": last_sales,
             }
         )
-    return pd.DataFrame(rows).sort_values("total_sales", ascending=False).reset_index(drop=True)
+    columns = ["platform", "total_sales", "growth_rate", "trend", "last_year_sales"]
+    return (
+        pd.DataFrame(rows, columns=columns)
+        .sort_values("total_sales", ascending=False)
+        .reset_index(drop=True)
+    )
 
 
 def platform_sales_stats(df: pd.DataFrame, platforms: list[str] | None = None) -> pd.DataFrame:
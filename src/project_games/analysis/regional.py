@@ -4,75 +4,66 @@ import pandas as pd
 REGION_COLS = {"NA": "na_sales", "EU": "eu_sales", "JP": "jp_sales"}
 
 
+def _top_by_region(group_sales: pd.DataFrame, top_n: int) -> dict[str, pd.Series]:
+    """Top-N groups per region from a frame of per-group regional sales."""
+    return {
+        region: group_sales[col].sort_values(ascending=False).head(top_n)
+        for region, col in REGION_COLS.items()
+    }
+
+
+def _share_table(group_sales: pd.DataFrame, totals: pd.Series, top_n: int) -> pd.DataFrame:
+    """Market share (%) of the top-N groups per region from per-group regional sales."""
+    all_items: set[str] = set()
+    shares: dict[str, pd.Series] = {}
+
+    for region, col in REGION_COLS.items():
+        s = (group_sales[col].sort_values(ascending=False) / totals[col] * 100).head(top_n)
+        shares[region] = s
+        all_items.update(s.index)
+
+    out = pd.DataFrame(index=sorted(all_items))
+    for region, s in shares.items():
+        out[region] = s
+    return out.fillna(0).sort_values("NA", ascending=False)
+
+
+def _rating_table(totals: pd.DataFrame, means: pd.DataFrame) -> pd.DataFrame:
+    """Total and average sales per rating and region from grouped sums and means."""
+    out = pd.DataFrame(index=sorted(totals.index))
+    for region, col in REGION_COLS.items():
+        out[f"{region}_total"] = totals[col]
+        out[f"{region}_avg"] = means[col]
+    return out.fillna(0)
+
+
 def top_platforms_by_region(
     df: pd.DataFrame, top_n: int = 5
 ) -> dict[str, pd.Series]:
     """Top-N platforms by sales for each region."""
-    result = {}
-    for region, col in REGION_COLS.items():
-        result[region] = df.groupby("platform")[col].sum().sort_values(ascending=False).head(top_n)
-    return result
+    return _top_by_region(df.groupby("platform")[list(REGION_COLS.values())].sum(), top_n)
 
 
 def top_genres_by_region(
     df: pd.DataFrame, top_n: int = 5
 ) -> dict[str, pd.Series]:
     """Top-N genres by sales for each region."""
-    result = {}
-    for region, col in REGION_COLS.items():
-        result[region] = df.groupby("genre")[col].sum().sort_values(ascending=False).head(top_n)
-    return result
+    return _top_by_region(df.groupby("genre")[list(REGION_COLS.values())].sum(), top_n)
 
 
 def market_share_platforms(df: pd.DataFrame, top_n: int = 5) -> pd.DataFrame:
     """Market share (%) of top platforms per region."""
-    all_platforms: set[str] = set()
-    shares: dict[str, pd.Series] = {}
-
-    for region, col in REGION_COLS.items():
-        total = df[col].sum()
-        pf_sales = df.groupby("platform")[col].sum().sort_values(ascending=False)
-        s = (pf_sales / total * 100).head(top_n)
-        shares[region] = s
-        all_platforms.update(s.index)
-
-    out = pd.DataFrame(index=sorted(all_platforms))
-    for region, s in shares.items():
-        out[region] = s
-    return out.fillna(0).sort_values("NA", ascending=False)
+    cols = list(REGION_COLS.values())
+    return _share_table(df.groupby("platform")[cols].sum(), df[cols].sum(), top_n)
 
 
 def market_share_genres(df: pd.DataFrame, top_n: int = 5) -> pd.DataFrame:
     """Market share (%) of top genres per region."""
-    all_genres: set[str] = set()
-    shares: dict[str, pd.Series] = {}
-
-    for region, col in REGION_COLS.items():
-        total = df[col].sum()
-        genre_sales = df.groupby("genre")[col].sum().sort_values(ascending=False)
-        s = (genre_sales / total * 100).head(top_n)
-        shares[region] = s
-        all_genres.update(s.index)
-
-    out = pd.DataFrame(index=sorted(all_genres))
-    for region, s in shares.items():
-        out[region] = s
-    return out.fillna(0).sort_values("NA", ascending=False)
+    cols = list(REGION_COLS.values())
+    return _share_table(df.groupby("genre")[cols].sum(), df[cols].sum(), top_n)
 
 
 def rating_sales_by_region(df: pd.DataFrame) -> pd.DataFrame:
     """Total and average sales by rating for each region."""
-    all_ratings: set[str] = set()
-    total_data: dict[str, pd.Series] = {}
-    avg_data: dict[str, pd.Series] = {}
-
-    for region, col in REGION_COLS.items():
-        total_data[region] = df.groupby("rating")[col].sum()
-        avg_data[region] = df.groupby("rating")[col].mean()
-        all_ratings.update(total_data[region].index)
-
-    out = pd.DataFrame(index=sorted(all_ratings))
-    for region in REGION_COLS:
-        out[f"{region}_total"] = total_data[region]
-        out[f"{region}_avg"] = avg_data[region]
-    return out.fillna(0)
+    grouped = df.groupby("rating")[list(REGION_COLS.values())]
+    return _rating_table(grouped.sum(), grouped.mean())
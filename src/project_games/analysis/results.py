@@ -0,0 +1,301 @@
+"""Precomputed analysis results and the SQLite store that holds them.
+
+``scripts/analyze.py`` runs every section once and writes it to the store, keyed
+by the fingerprint of the processed dataset and of the analysis config. Consumers
+such as the dashboard read the stored tables and only recompute on a miss.
+
+Sections are stored as tidy tables (plain columns, no index) so they can also be
+read straight from SQLite; :func:`unpack_sections` turns them back into the
+structures the analysis functions return.
+"""
+
+import sqlite3
+from contextlib import closing
+from dataclasses import asdict
+from datetime import datetime, timezone
+from io import StringIO
+from pathlib import Path
+
+import pandas as pd
+
+from project_games.analysis import parallel
+from project_games.analysis.genre import classify_genres, genre_sales_summary
+from project_games.analysis.hypothesis import HypothesisResult, run_configured_tests
+from project_games.analysis.platform import (
+    platform_growth_analysis,
+    platform_total_sales,
+    platform_yearly_sales,
+)
+from project_games.analysis.regional import (
+    market_share_genres,
+    market_share_platforms,
+    rating_sales_by_region,
+    top_genres_by_region,
+    top_platforms_by_region,
+)
+from project_games.analysis.temporal import (
+    filter_relevant_period,
+    games_per_year,
+    significant_years,
+)
+from project_games.config import get_project_root, load_config
+from project_games.data.fingerprint import config_fingerprint, dataset_fingerprint
+
+SECTIONS = (
+    "games_per_year",
+    "significant_years",
+    "platform_total_sales",
+    "platform_yearly_sales",
+    "platform_growth_analysis",
+    "genre_sales_summary",
+    "classify_genres",
+    "top_platforms_by_region",
+    "top_genres_by_region",
+    "market_share_platforms",
+    "market_share_genres",
+    "rating_sales_by_region",
+    "hypothesis_tests",
+)
+
+# Bump when the layout of the packed tables changes, so stale entries are misses.
+RESULTS_VERSION = 3
+
+
+def run_analysis(df: pd.DataFrame, cfg: dict | None = None) -> dict:
+    """Run every analysis section on the processed dataset.
+
+    Temporal sections use the full dataset; the rest use the relevant period.
+    """
+    if cfg is None:
+        cfg = load_config()
+    return run_sections(df, filter_relevant_period(df, cfg), cfg)
+
+
+def run_sections(
+    df: pd.DataFrame, df_rel: pd.DataFrame, cfg: dict, skip_insufficient: bool = False
+) -> dict:
+    """Run every analysis section on an explicit full frame and period frame.
+
+    Unless ``parallel.workers`` is 1 (the default), the grouped sections run on
+    the map-reduce backend of :mod:`project_games.analysis.parallel` with that
+    many workers (``null`` for one per core).
+    """
+    workers = cfg.get("parallel", {}).get("workers", 1)
+    if workers != 1:
+        grouped = parallel.grouped_sections(df_rel, workers)
+    else:
+        grouped = {
+            "platform_total_sales": platform_total_sales(df_rel),
+            "platform_yearly_sales": platform_yearly_sales(df_rel),
+            "platform_growth_analysis": platform_growth_analysis(df_rel),
+            "genre_sales_summary": genre_sales_summary(df_rel),
+            "classify_genres": classify_genres(df_rel),
+            "top_platforms_by_region": top_platforms_by_region(df_rel),
+            "top_genres_by_region": top_genres_by_region(df_rel),
+            "market_share_platforms": market_share_platforms(df_rel),
+            "market_share_genres": market_share_genres(df_rel),
+            "rating_sales_by_region": rating_sales_by_region(df_rel),
+        }
+    return {
+        "games_per_year": games_per_year(df),
+        "significant_years": significant_years(df),
+        **grouped,
+        "hypothesis_tests": run_configured_tests(df_rel, cfg, skip_insufficient),
+    }
+
+
+def _by_region(data: dict[str, pd.Series], key: str) -> pd.DataFrame:
+    return pd.concat(
+        [
+            pd.DataFrame({"region": region, key: s.index, "sales": s.to_numpy()})
+            for region, s in data.items()
+        ],
+        ignore_index=True,
+    )
+
+
+def pack_sections(results: dict) -> dict[str, pd.DataFrame]:
+    """Convert :func:`run_analysis` output into tidy tables for storage."""
+    tiers = results["classify_genres"]
+    return {
+        "games_per_year": results["games_per_year"].rename("games").reset_index(),
+        "significant_years": results["significant_years"].rename("games").reset_index(),
+        "platform_total_sales": results["platform_total_sales"].reset_index(),
+        "platform_yearly_sales": (
+            results["platform_yearly_sales"].stack().rename("total_sales").reset_index()
+        ),
+        "platform_growth_analysis": results["platform_growth_analysis"],
+        "genre_sales_summary": results["genre_sales_summary"].reset_index(),
+        "classify_genres": pd.DataFrame(
+            [(genre, tier) for tier, genres in tiers.items() for genre in genres],
+            columns=["genre", "tier"],
+        ),
+        "top_platforms_by_region": _by_region(results["top_platforms_by_region"], "platform"),
+        "top_genres_by_region": _by_region(results["top_genres_by_region"], "genre"),
+        "market_share_platforms": (
+            results["market_share_platforms"].rename_axis("platform").reset_index()
+        ),
+        "market_share_genres": results["market_share_genres"].rename_axis("genre").reset_index(),
+        "rating_sales_by_region": (
+            results["rating_sales_by_region"].rename_axis("rating").reset_index()
+        ),
+        "hypothesis_tests": pd.DataFrame(
+            [
+                {k: v for k, v in asdict(r).items() if k not in ("sample_a", "sample_b")}
+                for r in results["hypothesis_tests"]
+            ]
+        ),
+    }
+
+
+def _series(table: pd.DataFrame, key: str, value: str) -> pd.Series:
+    return table.set_index(key)[value]
+
+
+def unpack_sections(tables: dict[str, pd.DataFrame]) -> dict:
+    """Inverse of :func:`pack_sections`."""
+    tiers: dict[str, list[str]] = {"high_sales": [], "low_sales": []}
+    for genre, tier in tables["classify_genres"].itertuples(index=False):
+        tiers.setdefault(tier, []).append(genre)
+
+    def by_region(table: pd.DataFrame, key: str) -> dict[str, pd.Series]:
+        return {
+            region: _series(group, key, "sales")
+            for region, group in table.groupby("region", sort=False)
+        }
+
+    return {
+        "games_per_year": _series(tables["games_per_year"], "year_of_release", "games"),
+        "significant_years": _series(tables["significant_years"], "year_of_release", "games"),
+        "platform_total_sales": _series(
+            tables["platform_total_sales"], "platform", "total_sales"
+        ),
+        "platform_yearly_sales": (
+            tables["platform_yearly_sales"]
+            .set_index(["platform", "year_of_release"])["total_sales"]
+            .unstack(fill_value=0)
+        ),
+        "platform_growth_analysis": tables["platform_growth_analysis"],
+        "genre_sales_summary": tables["genre_sales_summary"].set_index("genre"),
+        "classify_genres": tiers,
+        "top_platforms_by_region": by_region(tables["top_platforms_by_region"], "platform"),
+        "top_genres_by_region": by_region(tables["top_genres_by_region"], "genre"),
+        "market_share_platforms": (
+            tables["market_share_platforms"].set_index("platform").rename_axis(None)
+        ),
+        "market_share_genres": tables["market_share_genres"].set_index("genre").rename_axis(None),
+        "rating_sales_by_region": (
+            tables["rating_sales_by_region"].set_index("rating").rename_axis(None)
+        ),
+        "hypothesis_tests": [
+            HypothesisResult(**row) for row in tables["hypothesis_tests"].to_dict("records")
+        ],
+    }
+
+
+class ResultsStore:
+    """SQLite-backed store of tidy analysis tables keyed by dataset and config."""
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+
+    def _connect(self) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sections (
+                dataset_fp TEXT NOT NULL,
+                config_fp TEXT NOT NULL,
+                section TEXT NOT NULL,
+                payload TEXT NOT NULL,
+                created_at TEXT NOT NULL,
+                PRIMARY KEY (dataset_fp, config_fp, section)
+            )
+            """
+        )
+        return conn
+
+    def get(self, dataset_fp: str, config_fp: str) -> dict[str, pd.DataFrame] | None:
+        """All stored tables for the key, or ``None`` if nothing is stored."""
+        if not self.path.exists():
+            return None
+        with closing(self._connect()) as conn:
+            rows = conn.execute(
+                "SELECT section, payload FROM sections WHERE dataset_fp = ? AND config_fp = ?",
+                (dataset_fp, config_fp),
+            ).fetchall()
+        if not rows:
+            return None
+        return {
+            section: pd.read_json(
+                StringIO(payload), orient="split", dtype=False, convert_dates=False
+            )
+            for section, payload in rows
+        }
+
+    def put(self, dataset_fp: str, config_fp: str, tables: dict[str, pd.DataFrame]) -> None:
+        """Replace the stored tables for the key."""
+        created_at = datetime.now(timezone.utc).isoformat()
+        rows = [
+            (
+                dataset_fp,
+                config_fp,
+                section,
+                table.to_json(orient="split", index=False, double_precision=15),
+                created_at,
+            )
+            for section, table in tables.items()
+        ]
+        with closing(self._connect()) as conn, conn:
+            conn.execute(
+                "DELETE FROM sections WHERE dataset_fp = ? AND config_fp = ?",
+                (dataset_fp, config_fp),
+            )
+            conn.executemany("INSERT INTO sections VALUES (?, ?, ?, ?, ?)", rows)
+
+
+def results_key(cfg: dict) -> str:
+    """Config part of the store key: analysis config plus the table layout version."""
+    return f"{config_fingerprint(cfg)}.v{RESULTS_VERSION}"
+
+
+def default_store(cfg: dict | None = None) -> ResultsStore:
+    """Results store at ``data.results_store`` from config."""
+    if cfg is None:
+        cfg = load_config()
+    return ResultsStore(get_project_root() / cfg["data"]["results_store"])
+
+
+def load_results(
+    df: pd.DataFrame,
+    cfg: dict | None = None,
+    store: ResultsStore | None = None,
+) -> tuple[dict, bool]:
+    """Stored results for *df* and *cfg*, computing them live on a miss.
+
+    Returns ``(results, from_store)``.
+    """
+    if cfg is None:
+        cfg = load_config()
+    if store is None:
+        store = default_store(cfg)
+
+    tables = store.get(dataset_fingerprint(df), results_key(cfg))
+    if tables is not None and set(SECTIONS) <= tables.keys():
+        return unpack_sections(tables), True
+    return run_analysis(df, cfg), False
+
+
+def save_results(
+    df: pd.DataFrame,
+    results: dict,
+    cfg: dict | None = None,
+    store: ResultsStore | None = None,
+) -> None:
+    """Write :func:`run_analysis` output for *df* and *cfg* to the store."""
+    if cfg is None:
+        cfg = load_config()
+    if store is None:
+        store = default_store(cfg)
+    store.put(dataset_fingerprint(df), results_key(cfg), pack_sections(results))
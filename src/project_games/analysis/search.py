@@ -0,0 +1,191 @@
+"""Title search over a prebuilt index of normalised game titles.
+
+:class:`TitleIndex` folds every distinct title (see
+:func:`~project_games.data.matching.fold_text`) and keeps two structures:
+
+- a sorted array of the suffixes of each folded title that start at a word, so
+  a binary search finds every title with a word starting with the query;
+- a posting list of title ids per character trigram, intersected to find
+  titles containing the query anywhere (queries of three characters or more).
+
+Matches are ranked exact title, title prefix, word prefix, then substring, and
+by total sales within each tier. Each title's rows are grouped once at build
+time, so looking up a title's cross-platform releases does not scan the frame.
+"""
+
+from bisect import bisect_left
+
+import numpy as np
+import pandas as pd
+
+from project_games.data.matching import fold_text
+
+MATCH_TIERS = ("exact", "prefix", "word", "substring")
+LOOKUP_COLUMNS = (
+    "name",
+    "platform",
+    "year_of_release",
+    "genre",
+    "rating",
+    "na_sales",
+    "eu_sales",
+    "jp_sales",
+    "other_sales",
+    "total_sales",
+    "critic_score",
+    "user_score",
+)
+
+
+class UnknownTitleError(KeyError):
+    """Raised for a title that is not in the :class:`TitleIndex`."""
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class TitleIndex:
+    """Prefix and substring search over the distinct values of a title column."""
+
+    def __init__(self, df: pd.DataFrame, column: str = "name", weight: str = "total_sales"):
+        codes, titles = pd.factorize(df[column])
+        self.n_rows = len(df)
+        self.titles = np.asarray(titles, dtype=object)
+        self.keys = [fold_text(str(title)) for title in self.titles]
+        self._ids = {title: i for i, title in enumerate(self.titles)}
+        self._by_key: dict[str, list[int]] = {}
+        for i, key in enumerate(self.keys):
+            self._by_key.setdefault(key, []).append(i)
+
+        # Row positions grouped by title: rows of title i are order[starts[i]:starts[i + 1]].
+        present = np.flatnonzero(codes >= 0)
+        self._order = present[np.argsort(codes[present], kind="stable")]
+        counts = np.bincount(codes[present], minlength=len(self.titles))
+        self._starts = np.concatenate([[0], np.cumsum(counts)])
+        self._weights = np.nan_to_num(df[weight].to_numpy(dtype=np.float64))
+        self._title_rows = counts
+        self._title_sales = np.bincount(
+            codes[present], weights=self._weights[present], minlength=len(self.titles)
+        )
+        self._platforms = df["platform"].to_numpy(dtype=object) if "platform" in df else None
+
+        suffixes = []
+        for i, key in enumerate(self.keys):
+            for start in [0, *(j + 1 for j, c in enumerate(key) if c == " ")]:
+                suffixes.append((key[start:], i, start == 0))
+        suffixes.sort()
+        self._suffixes = [suffix for suffix, _, _ in suffixes]
+        self._suffix_ids = np.array([i for _, i, _ in suffixes], dtype=np.int64)
+        self._suffix_is_start = np.array([first for _, _, first in suffixes], dtype=bool)
+
+        postings: dict[str, list[int]] = {}
+        for i, key in enumerate(self.keys):
+            for gram in _trigrams(key):
+                postings.setdefault(gram, []).append(i)
+        self._postings = {gram: np.array(ids, dtype=np.int64) for gram, ids in postings.items()}
+
+    def __len__(self) -> int:
+        return len(self.titles)
+
+    def _prefix_matches(self, query: str) -> tuple[np.ndarray, np.ndarray]:
+        """Ids and tiers of titles with a word (tier 1 if the first word) starting with *query*."""
+        lo = bisect_left(self._suffixes, query)
+        hi = bisect_left(self._suffixes, query + "\x7f", lo)
+        ids = self._suffix_ids[lo:hi]
+        tiers = np.where(self._suffix_is_start[lo:hi], 1, 2)
+        return ids, tiers
+
+    def _substring_matches(self, query: str) -> np.ndarray:
+        grams = sorted(_trigrams(query), key=lambda g: len(self._postings.get(g, ())))
+        if not grams:
+            return np.empty(0, dtype=np.int64)
+        ids = self._postings.get(grams[0], np.empty(0, dtype=np.int64))
+        for gram in grams[1:]:
+            if not len(ids):
+                break
+            ids = np.intersect1d(ids, self._postings.get(gram, ids[:0]), assume_unique=True)
+        # Shared trigrams do not guarantee a contiguous match.
+        return np.array([i for i in ids if query in self.keys[i]], dtype=np.int64)
+
+    def _totals(self, mask: np.ndarray | None) -> tuple[np.ndarray, np.ndarray]:
+        """Row count and summed weight per title, over the rows in *mask* if given."""
+        if mask is None:
+            return self._title_rows, self._title_sales
+        if not len(self.titles):
+            return self._title_rows, self._title_sales
+        grouped = mask[self._order]
+        bounds = self._starts[:-1]
+        rows = np.add.reduceat(grouped.astype(np.int64), bounds)
+        sales = np.add.reduceat(np.where(grouped, self._weights[self._order], 0.0), bounds)
+        return rows, sales
+
+    def search(
+        self, query: str, limit: int | None = 10, mask: np.ndarray | None = None
+    ) -> pd.DataFrame:
+        """Best matching titles with their match tier, platforms and total sales.
+
+        With a boolean row *mask*, only rows in the mask count: titles without
+        any are left out, and releases and sales cover the masked rows.
+        """
+        key = fold_text(query)
+        ids, tiers = self._prefix_matches(key) if key else (np.empty(0, np.int64),) * 2
+        if len(key) >= 3:
+            substring = self._substring_matches(key)
+            ids = np.concatenate([ids, substring])
+            tiers = np.concatenate([tiers, np.full(len(substring), 3)])
+        tiers[np.isin(ids, self._by_key.get(key, []))] = 0
+
+        # Keep each title once, at its best tier.
+        order = np.lexsort((tiers, ids))
+        ids, tiers = ids[order], tiers[order]
+        first = np.r_[True, ids[1:] != ids[:-1]] if len(ids) else np.empty(0, dtype=bool)
+        ids, tiers = ids[first], tiers[first]
+
+        rows, sales = self._totals(mask)
+        keep = rows[ids] > 0
+        ids, tiers = ids[keep], tiers[keep]
+        ranked = np.lexsort((ids, -sales[ids], tiers))[:limit]
+        ids, tiers = ids[ranked], tiers[ranked]
+
+        platforms = []
+        for i in ids:
+            positions = self._order[self._starts[i] : self._starts[i + 1]]
+            if mask is not None:
+                positions = positions[mask[positions]]
+            found = self._platforms[positions] if self._platforms is not None else []
+            platforms.append(", ".join(sorted(map(str, set(found)))))
+        return pd.DataFrame(
+            {
+                "name": self.titles[ids],
+                "match": [MATCH_TIERS[t] for t in tiers],
+                "platforms": platforms,
+                "releases": rows[ids],
+                "total_sales": sales[ids],
+            }
+        )
+
+    def positions(self, title: str) -> np.ndarray:
+        """Row positions of *title* (an exact title, e.g. from :meth:`search`)."""
+        if title not in self._ids:
+            raise UnknownTitleError(f"Unknown title {title!r}")
+        i = self._ids[title]
+        return np.sort(self._order[self._starts[i] : self._starts[i + 1]])
+
+    def lookup(
+        self,
+        df: pd.DataFrame,
+        title: str,
+        columns: tuple[str, ...] = LOOKUP_COLUMNS,
+        mask: np.ndarray | None = None,
+    ) -> pd.DataFrame:
+        """Rows of *df* (the indexed frame) for *title*, best-selling release first."""
+        if len(df) != self.n_rows:
+            raise ValueError(f"Index built for {self.n_rows} rows, got {len(df)}")
+        positions = self.positions(title)
+        if mask is not None:
+            positions = positions[mask[positions]]
+        rows = df.iloc[positions][[c for c in columns if c in df.columns]]
+        if "total_sales" in rows:
+            rows = rows.sort_values("total_sales", ascending=False, kind="stable")
+        return rows.reset_index(drop=True)
@@ -0,0 +1,195 @@
+"""SQLite backend for the grouped aggregations in ``analysis/*``.
+
+The functions here take a :class:`~project_games.data.database.GameDatabase`
+(the processed dataset written by ``scripts/preprocess.py``, optionally
+filtered) instead of a DataFrame. They push the grouping, summing and counting
+down to SQLite, which reads only the indexed columns each query needs. Each
+returns the same structure as its pandas counterpart, which it is a drop-in
+replacement for. Only the grouped results, and the values of the groups the
+hypothesis tests compare, are loaded into Python.
+"""
+
+import numpy as np
+import pandas as pd
+
+from project_games.analysis.genre import _genre_tiers
+from project_games.analysis.hypothesis import configured_sample_keys, run_configured_tests
+from project_games.analysis.platform import _growth_table
+from project_games.analysis.regional import (
+    REGION_COLS,
+    _rating_table,
+    _share_table,
+    _top_by_region,
+)
+from project_games.analysis.temporal import relevant_period_filters
+from project_games.config import load_config
+from project_games.data.database import GameDatabase
+
+
+def games_per_year(db: GameDatabase) -> pd.Series:
+    """SQL equivalent of :func:`project_games.analysis.temporal.games_per_year`."""
+    counts = db.size("year_of_release")
+    counts.index = counts.index.astype(int)
+    return counts
+
+
+def significant_years(db: GameDatabase, threshold: float | None = None) -> pd.Series:
+    """SQL equivalent of :func:`project_games.analysis.temporal.significant_years`."""
+    counts = games_per_year(db)
+    if threshold is None:
+        threshold = counts.mean()
+    return counts[counts >= threshold]
+
+
+def evaluate_lookback_windows(
+    db: GameDatabase,
+    current_year: int = 2016,
+    lookback_years: list[int] | None = None,
+) -> pd.DataFrame:
+    """SQL equivalent of :func:`project_games.analysis.temporal.evaluate_lookback_windows`.
+
+    Every window is summed from the same per-year aggregates, so the table takes
+    three queries however many windows are compared.
+    """
+    if lookback_years is None:
+        lookback_years = [3, 4, 5, 6, 7, 8]
+
+    by_year = db.aggregate("year_of_release", ["total_sales"])
+    by_year["games"] = db.size("year_of_release")
+    year_platforms = db.size(["year_of_release", "platform"]).reset_index()
+
+    rows = []
+    for yb in lookback_years:
+        start = current_year - yb + 1
+        window = by_year[by_year.index >= start]
+        platforms = year_platforms[year_platforms["year_of_release"] >= start]["platform"]
+        rows.append(
+            {
+                "period": f"{start}-{current_year}",
+                "years": yb,
+                "games": int(window["games"].sum()),
+                "platforms": platforms.nunique(),
+                "total_sales": window["total_sales"].sum(),
+                "avg_games_per_year": window["games"].sum() / yb,
+            }
+        )
+    return pd.DataFrame(rows)
+
+
+def platform_total_sales(db: GameDatabase) -> pd.Series:
+    """SQL equivalent of :func:`project_games.analysis.platform.platform_total_sales`."""
+    sales = db.aggregate("platform", ["total_sales"])["total_sales"]
+    return sales.sort_values(ascending=False)
+
+
+def platform_yearly_sales(db: GameDatabase, top_platforms: list[str] | None = None) -> pd.DataFrame:
+    """SQL equivalent of :func:`project_games.analysis.platform.platform_yearly_sales`."""
+    if top_platforms is not None:
+        db = db.where([("platform", "in", top_platforms)])
+    sales = db.aggregate(["platform", "year_of_release"], ["total_sales"])["total_sales"]
+    return sales.unstack(fill_value=0)
+
+
+def platform_growth_analysis(db: GameDatabase) -> pd.DataFrame:
+    """SQL equivalent of :func:`project_games.analysis.platform.platform_growth_analysis`."""
+    return _growth_table(platform_total_sales(db), platform_yearly_sales(db))
+
+
+def genre_sales_summary(db: GameDatabase) -> pd.DataFrame:
+    """SQL equivalent of :func:`project_games.analysis.genre.genre_sales_summary`."""
+    agg = db.aggregate("genre", ["total_sales"], ("sum", "mean", "count"))
+    stats = pd.DataFrame(
+        {
+            "sum": agg["total_sales_sum"],
+            "mean": agg["total_sales_mean"],
+            "median": db.median("genre", "total_sales"),
+            "count": agg["total_sales_count"].astype("int64"),
+        }
+    ).sort_values("sum", ascending=False)
+    stats["avg_per_game"] = stats["sum"] / stats["count"]
+    return stats
+
+
+def classify_genres(db: GameDatabase) -> dict[str, list[str]]:
+    """SQL equivalent of :func:`project_games.analysis.genre.classify_genres`."""
+    return _genre_tiers(genre_sales_summary(db))
+
+
+def top_platforms_by_region(db: GameDatabase, top_n: int = 5) -> dict[str, pd.Series]:
+    """SQL equivalent of :func:`project_games.analysis.regional.top_platforms_by_region`."""
+    return _top_by_region(db.aggregate("platform", list(REGION_COLS.values())), top_n)
+
+
+def top_genres_by_region(db: GameDatabase, top_n: int = 5) -> dict[str, pd.Series]:
+    """SQL equivalent of :func:`project_games.analysis.regional.top_genres_by_region`."""
+    return _top_by_region(db.aggregate("genre", list(REGION_COLS.values())), top_n)
+
+
+def market_share_platforms(db: GameDatabase, top_n: int = 5) -> pd.DataFrame:
+    """SQL equivalent of :func:`project_games.analysis.regional.market_share_platforms`."""
+    cols = list(REGION_COLS.values())
+    return _share_table(db.aggregate("platform", cols), db.totals(cols), top_n)
+
+
+def market_share_genres(db: GameDatabase, top_n: int = 5) -> pd.DataFrame:
+    """SQL equivalent of :func:`project_games.analysis.regional.market_share_genres`."""
+    cols = list(REGION_COLS.values())
+    return _share_table(db.aggregate("genre", cols), db.totals(cols), top_n)
+
+
+def rating_sales_by_region(db: GameDatabase) -> pd.DataFrame:
+    """SQL equivalent of :func:`project_games.analysis.regional.rating_sales_by_region`."""
+    cols = list(REGION_COLS.values())
+    agg = db.aggregate("rating", cols, ("sum", "mean"))
+    sums = pd.DataFrame({col: agg[f"{col}_sum"] for col in cols})
+    means = pd.DataFrame({col: agg[f"{col}_mean"] for col in cols})
+    return _rating_table(sums, means)
+
+
+def collect_samples(
+    db: GameDatabase, keys: list[tuple[str, str, str]]
+) -> dict[tuple[str, str, str], np.ndarray]:
+    """SQL equivalent of :func:`project_games.analysis.hypothesis.collect_samples`.
+
+    Only the non-null values of the requested groups are read.
+    """
+    wanted: dict[tuple[str, str], set] = {}
+    for group_column, column, group in keys:
+        wanted.setdefault((group_column, column), set()).add(group)
+
+    samples = {}
+    for (group_column, column), groups in wanted.items():
+        rows = db.values(group_column, column, sorted(groups, key=str))
+        for group in groups:
+            chunk = rows.loc[rows[group_column] == group, column]
+            samples[(group_column, column, group)] = chunk.to_numpy(dtype=float)
+    return samples
+
+
+def run_sections(
+    db: GameDatabase, db_rel: GameDatabase, cfg: dict, skip_insufficient: bool = False
+) -> dict:
+    """SQL equivalent of :func:`project_games.analysis.results.run_sections`."""
+    samples = collect_samples(db_rel, configured_sample_keys(cfg))
+    return {
+        "games_per_year": games_per_year(db),
+        "significant_years": significant_years(db),
+        "platform_total_sales": platform_total_sales(db_rel),
+        "platform_yearly_sales": platform_yearly_sales(db_rel),
+        "platform_growth_analysis": platform_growth_analysis(db_rel),
+        "genre_sales_summary": genre_sales_summary(db_rel),
+        "classify_genres": classify_genres(db_rel),
+        "top_platforms_by_region": top_platforms_by_region(db_rel),
+        "top_genres_by_region": top_genres_by_region(db_rel),
+        "market_share_platforms": market_share_platforms(db_rel),
+        "market_share_genres": market_share_genres(db_rel),
+        "rating_sales_by_region": rating_sales_by_region(db_rel),
+        "hypothesis_tests": run_configured_tests(None, cfg, skip_insufficient, samples),
+    }
+
+
+def run_analysis(db: GameDatabase, cfg: dict | None = None) -> dict:
+    """SQL equivalent of :func:`project_games.analysis.results.run_analysis`."""
+    if cfg is None:
+        cfg = load_config()
+    return run_sections(db, db.where(relevant_period_filters(cfg)), cfg)
@@ -0,0 +1,232 @@
+"""Parameter sweeps of the analysis over a grid of config overrides.
+
+A grid maps dotted config keys (``analysis.relevant_period.start_year``) to the
+values to try; every combination of values is one grid point. Work is shared
+between points wherever their overrides allow:
+
+- the data is loaded once. Only grids with ``imputation.*`` keys re-impute, once
+  per distinct combination of those keys, starting from the cleaned raw data;
+- the relevant-period frame, its aggregates and the hypothesis-test samples are
+  computed once per group of points differing only in :data:`POINT_KEYS`. Each
+  point in the group only takes its ``top_n_*`` slice and re-runs the tests at
+  its significance level.
+
+Imputations and period groups each run as one task on a process pool. The
+results of every point are returned as one tidy table with a row per
+``(point, section, item, metric)`` and the override values as columns.
+"""
+
+import copy
+from itertools import product
+
+import pandas as pd
+
+from project_games.analysis.genre import _genre_tiers, genre_sales_summary
+from project_games.analysis.hypothesis import (
+    collect_samples,
+    configured_sample_keys,
+    run_configured_tests,
+)
+from project_games.analysis.platform import platform_total_sales
+from project_games.analysis.temporal import filter_relevant_period
+from project_games.config import load_config
+from project_games.workers import default_workers, process_pool
+
+SWEEP_PREFIXES = ("analysis.", "imputation.")
+# Settings applied after aggregation; every other key changes the shared work.
+POINT_KEYS = {
+    "analysis.significance_level",
+    "analysis.top_n_platforms",
+    "analysis.top_n_genres",
+}
+RESULT_COLUMNS = ["section", "item", "metric", "value"]
+
+Record = tuple[str, str, str, float]
+
+
+def expand_grid(grid: dict[str, list]) -> list[dict[str, object]]:
+    """Every combination of the *grid* values, as one override dict per point."""
+    keys = list(grid)
+    for key in keys:
+        if not isinstance(grid[key], (list, tuple)) or not grid[key]:
+            raise ValueError(f"Grid values for {key!r} must be a non-empty list")
+    return [dict(zip(keys, values)) for values in product(*(grid[k] for k in keys))]
+
+
+def apply_overrides(cfg: dict, overrides: dict[str, object]) -> dict:
+    """Copy of *cfg* with each dotted key of *overrides* set to its value.
+
+    Keys must already exist in *cfg*, so a misspelt key is an error rather than
+    a silently ignored setting.
+    """
+    cfg = copy.deepcopy(cfg)
+    for key, value in overrides.items():
+        *parents, leaf = key.split(".")
+        node = cfg
+        for part in parents:
+            node = node.get(part) if isinstance(node, dict) else None
+        if not isinstance(node, dict) or leaf not in node:
+            raise KeyError(f"Unknown config key {key!r}")
+        node[leaf] = value
+    return cfg
+
+
+def _impute(cleaned: pd.DataFrame, cfg: dict) -> pd.DataFrame:
+    # Imported here: only grids over imputation settings need the imputer.
+    from project_games.data.imputation import impute_dataset
+
+    return impute_dataset(cleaned, cfg)
+
+
+def _dataset_records(df: pd.DataFrame, df_rel: pd.DataFrame) -> list[Record]:
+    records = [
+        ("dataset", "all", "rows", float(len(df))),
+        ("dataset", "period", "rows", float(len(df_rel))),
+    ]
+    for column in ("critic_score", "user_score"):
+        if column in df:
+            records.append(("dataset", column, "missing", float(df[column].isna().sum())))
+    if "rating" in df:
+        records.append(("dataset", "rating", "tbd", float((df["rating"] == "TBD").sum())))
+    return records
+
+
+def _ranked_records(section: str, sales: pd.Series, top_n: int) -> list[Record]:
+    records = []
+    for rank, (item, value) in enumerate(sales.head(top_n).items(), start=1):
+        records.append((section, str(item), "rank", float(rank)))
+        records.append((section, str(item), "total_sales", float(value)))
+    return records
+
+
+def _tier_records(stats: pd.DataFrame) -> list[Record]:
+    """High/low sales tiers, split as in :func:`~project_games.analysis.genre.classify_genres`."""
+    return [
+        ("genre_tiers", str(genre), tier, 1.0)
+        for tier, genres in _genre_tiers(stats).items()
+        for genre in genres
+    ]
+
+
+def evaluate_period_group(
+    df: pd.DataFrame, points: list[tuple[int, dict]]
+) -> dict[int, list[Record]]:
+    """Result records of grid points sharing one dataset and relevant period.
+
+    *points* holds ``(point, cfg)`` pairs whose configs differ at most in
+    :data:`POINT_KEYS`.
+    """
+    cfg = points[0][1]
+    df_rel = filter_relevant_period(df, cfg)
+    shared = _dataset_records(df, df_rel)
+    platform_sales = platform_total_sales(df_rel)
+    genre_stats = genre_sales_summary(df_rel)
+    shared += _tier_records(genre_stats)
+    samples = collect_samples(
+        df_rel, {key for _, point_cfg in points for key in configured_sample_keys(point_cfg)}
+    )
+
+    out = {}
+    for point, point_cfg in points:
+        analysis = point_cfg["analysis"]
+        records = list(shared)
+        records += _ranked_records("platforms", platform_sales, analysis.get("top_n_platforms", 5))
+        records += _ranked_records("genres", genre_stats["sum"], analysis.get("top_n_genres", 5))
+        for result in run_configured_tests(df_rel, point_cfg, True, samples):
+            for metric in ("n_a", "n_b", "t_statistic", "p_value", "reject_null"):
+                records.append(("hypothesis", result.name, metric, float(getattr(result, metric))))
+        out[point] = records
+    return out
+
+
+def _run_tasks(func, tasks: list[tuple], n_workers: int | None) -> list:
+    """``func(*task)`` for every task, on a process pool unless there is one task."""
+    if n_workers == 1 or len(tasks) <= 1:
+        return [func(*task) for task in tasks]
+    with process_pool(min(n_workers or default_workers(), len(tasks))) as pool:
+        return list(pool.map(func, *zip(*tasks)))
+
+
+def run_sweep(
+    grid: dict[str, list],
+    processed: pd.DataFrame | None = None,
+    cleaned: pd.DataFrame | None = None,
+    cfg: dict | None = None,
+    n_workers: int | None = None,
+) -> pd.DataFrame:
+    """Run the analysis at every point of *grid* and collect one results table.
+
+    Grid keys must be ``analysis.*`` or ``imputation.*`` settings. *processed*
+    (default: the processed dataset) is analysed as is unless the grid has
+    ``imputation.*`` keys; then *cleaned* (default: the raw data, cleaned) is
+    re-imputed for each combination of them. ``n_workers=1`` runs in-process.
+
+    The table has a ``point`` column, one column per grid key and
+    :data:`RESULT_COLUMNS`; ``value`` is numeric (ranks, sales, counts, test
+    statistics, 1.0/0.0 for flags).
+    """
+    if cfg is None:
+        cfg = load_config()
+    unsupported = [k for k in grid if not k.startswith(SWEEP_PREFIXES)]
+    if unsupported:
+        raise ValueError(f"Cannot sweep {unsupported}; keys must start with {SWEEP_PREFIXES}")
+    points = expand_grid(grid)
+    configs = [apply_overrides(cfg, overrides) for overrides in points]
+
+    # Points that differ only in POINT_KEYS share a dataset and a period group.
+    groups: dict[tuple, dict[tuple, list[tuple[int, dict]]]] = {}
+    for point, overrides in enumerate(points):
+        imputation = tuple((k, v) for k, v in overrides.items() if k.startswith("imputation."))
+        shared = tuple((k, v) for k, v in overrides.items() if k not in POINT_KEYS)
+        groups.setdefault(imputation, {}).setdefault(shared, []).append((point, configs[point]))
+
+    if any(groups):
+        if cleaned is None:
+            from project_games.data.cleaning import clean_dataset
+            from project_games.data.loader import load_raw_data
+
+            cleaned = clean_dataset(load_raw_data(), fuzzy_names=cfg["matching"]["fuzzy_names"])
+        tasks = [(cleaned, next(iter(g.values()))[0][1]) for g in groups.values()]
+        datasets = dict(zip(groups, _run_tasks(_impute, tasks, n_workers)))
+    else:
+        if processed is None:
+            from project_games.data.loader import load_processed_data
+
+            processed = load_processed_data()
+        datasets = {(): processed}
+
+    tasks = [(datasets[key], members) for key, g in groups.items() for members in g.values()]
+    records: dict[int, list[Record]] = {}
+    for result in _run_tasks(evaluate_period_group, tasks, n_workers):
+        records.update(result)
+
+    tables = []
+    for point, overrides in enumerate(points):
+        table = pd.DataFrame(records[point], columns=RESULT_COLUMNS)
+        tables.append(table.assign(point=point, **overrides))
+    table = pd.concat(tables, ignore_index=True)
+    return table[["point", *grid, *RESULT_COLUMNS]]
+
+
+def _lookup(
+    table: pd.DataFrame, section: str, metric: str, item: str | None = None
+) -> pd.DataFrame:
+    rows = table[(table["section"] == section) & (table["metric"] == metric)]
+    if item is not None:
+        rows = rows[rows["item"] == item]
+    return rows.set_index("point")
+
+
+def sweep_summary(table: pd.DataFrame) -> pd.DataFrame:
+    """One row per grid point: period rows, top platform and genre, test decisions."""
+    keys = [c for c in table.columns if c not in RESULT_COLUMNS]
+    summary = table.drop_duplicates("point")[keys].set_index("point")
+    summary["period_rows"] = _lookup(table, "dataset", "rows", "period")["value"].astype(int)
+    for section in ("platforms", "genres"):
+        ranks = _lookup(table, section, "rank")
+        summary[f"top_{section[:-1]}"] = ranks[ranks["value"] == 1]["item"]
+    for name in _lookup(table, "hypothesis", "p_value")["item"].unique():
+        summary[f"{name}_p"] = _lookup(table, "hypothesis", "p_value", name)["value"]
+        reject = _lookup(table, "hypothesis", "reject_null", name)["value"]
+        summary[f"{name}_reject"] = reject.astype(bool)
+    return summary.reset_index()
@@ -1,7 +1,12 @@
+import numpy as np
 import pandas as pd
 
+from project_games.analysis.regional import REGION_COLS
 from project_games.config import load_config
 
+GROWTH_DIMENSIONS = ("platform", "genre", "rating", "region")
+GROWTH_COLUMNS = ["dimension", "group", "year", "sales", "yoy_pct", "rolling_avg", "cagr_pct"]
+
 
 def games_per_year(df: pd.DataFrame) -> pd.Series:
     """Count the number of games released per year."""
@@ -47,6 +52,13 @@ def evaluate_lookback_windows(
     return pd.DataFrame(rows)
 
 
+def relevant_period_filters(cfg: dict | None = None) -> list[tuple[str, str, int]]:
+    """Load filters for the relevant period, for ``load_processed_data(filters=...)``."""
+    if cfg is None:
+        cfg = load_config()
+    return [("year_of_release", ">=", cfg["analysis"]["relevant_period"]["start_year"])]
+
+
 def filter_relevant_period(
     df: pd.DataFrame,
     cfg: dict | None = None,
@@ -59,3 +71,91 @@ def filter_relevant_period(
     df_rel = df[df["year_of_release"].notna()].copy()
     df_rel["year_of_release"] = df_rel["year_of_release"].astype(int)
     return df_rel[df_rel["year_of_release"] >= start].reset_index(drop=True)
+
+
+def dimension_year_matrix(
+    df: pd.DataFrame, dimension: str, value: str = "total_sales"
+) -> pd.DataFrame:
+    """Summed *value* per group of *dimension* (rows) and year (columns).
+
+    Columns cover every year from the first to the last release, zero-filled, so
+    neighbouring columns are consecutive years. The ``region`` dimension has
+    one row per region of :data:`~project_games.analysis.regional.REGION_COLS`,
+    summing its sales column instead of *value*.
+    """
+    df_year = df[df["year_of_release"].notna()]
+    years = df_year["year_of_release"].astype(int)
+    if dimension == "region":
+        cols = list(REGION_COLS.values())
+        matrix = df_year[cols].groupby(years).sum().T.set_axis(list(REGION_COLS))
+    else:
+        matrix = df_year.groupby([df_year[dimension], years])[value].sum().unstack(fill_value=0)
+    span = range(int(years.min()), int(years.max()) + 1) if len(years) else []
+    return matrix.reindex(columns=span, fill_value=0).rename_axis(dimension).astype(float)
+
+
+def growth_panel(matrix: pd.DataFrame, window: int = 3) -> pd.DataFrame:
+    """Tidy growth table of a group × consecutive-year *matrix*.
+
+    One row per group and year from the group's first to its last year with sales:
+
+    - ``yoy_pct``: change on the previous year (%), NaN when that year had no sales;
+    - ``rolling_avg``: mean over the trailing *window* years, or over the years
+      since the first year with sales when there are fewer;
+    - ``cagr_pct``: compound annual growth rate (%) since the first year with
+      sales, NaN in that year.
+
+    All groups are computed at once from shifted and cumulative arrays.
+    """
+    values = matrix.to_numpy(dtype=float)
+    n_groups, n_years = values.shape
+    prev = np.full_like(values, np.nan)
+    prev[:, 1:] = values[:, :-1]
+    yoy = np.divide(values - prev, prev, out=np.full_like(values, np.nan), where=prev > 0) * 100
+
+    active = values > 0
+    any_active = active.any(axis=1)[:, None]
+    first = active.argmax(axis=1)
+    last = n_years - 1 - active[:, ::-1].argmax(axis=1)
+    periods = np.arange(n_years)[None, :] - first[:, None]
+
+    # Years before the first sale are zero, so only the divisor needs clipping.
+    csum = np.concatenate([np.zeros((n_groups, 1)), values.cumsum(axis=1)], axis=1)
+    lagged = np.zeros_like(values)
+    lagged[:, window:] = csum[:, 1 : n_years - window + 1]
+    rolling = (csum[:, 1:] - lagged) / np.clip(periods + 1, 1, window)
+
+    base = values[np.arange(n_groups), first][:, None]
+    cagr = np.full_like(values, np.nan)
+    grown = (periods > 0) & any_active
+    cagr[grown] = ((values / base) ** (1 / np.where(grown, periods, 1)))[grown] * 100 - 100
+
+    keep = (periods >= 0) & (np.arange(n_years)[None, :] <= last[:, None]) & any_active
+    groups = np.repeat(matrix.index.to_numpy(), n_years).reshape(n_groups, n_years)
+    years = np.broadcast_to(matrix.columns.to_numpy(dtype=np.int64), values.shape)
+    return pd.DataFrame(
+        {
+            "group": groups[keep],
+            "year": years[keep],
+            "sales": values[keep],
+            "yoy_pct": yoy[keep],
+            "rolling_avg": rolling[keep],
+            "cagr_pct": cagr[keep],
+        }
+    )
+
+
+def growth_panels(
+    df: pd.DataFrame,
+    dimensions: tuple[str, ...] = GROWTH_DIMENSIONS,
+    value: str = "total_sales",
+    window: int = 3,
+) -> pd.DataFrame:
+    """:func:`growth_panel` of every dimension in one long table (see :data:`GROWTH_COLUMNS`)."""
+    panels = [
+        growth_panel(dimension_year_matrix(df, dimension, value), window).assign(
+            dimension=dimension
+        )
+        for dimension in dimensions
+    ]
+    return pd.concat(panels, ignore_index=True)[GROWTH_COLUMNS]
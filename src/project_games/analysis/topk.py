@@ -0,0 +1,132 @@
+"""Top-K title queries over presorted row orders.
+
+:class:`TopKIndex` extends :class:`BitmapIndex` with, for every ranking metric,
+the row positions sorted by that metric (descending, missing values dropped),
+and the same order split by platform and by genre. A query turns its filters
+into a bitmap, picks the smallest set of presorted lists that covers the
+selection (one list per selected platform or genre, else the global list), and
+walks each list in growing blocks until it has K matching rows. The per-list
+candidates, at most K each, are merged with a small sort, so an answer costs
+roughly ``K / selectivity`` lookups instead of a filter and sort of the table.
+"""
+
+from collections.abc import Iterable
+
+import numpy as np
+import pandas as pd
+
+from project_games.analysis.filters import FILTER_COLUMNS, RANGE_COLUMNS, BitmapIndex
+
+TOP_K_METRICS = (
+    "total_sales",
+    "na_sales",
+    "eu_sales",
+    "jp_sales",
+    "other_sales",
+    "critic_score",
+    "user_score",
+)
+TOP_K_PARTITIONS = ("platform", "genre")
+TOP_K_COLUMNS = ("name", "platform", "year_of_release", "genre", "rating")
+
+
+class TopKIndex(BitmapIndex):
+    """Bitmap index plus per-metric sorted row orders for top-K queries."""
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        metrics: Iterable[str] = TOP_K_METRICS,
+        partition_by: Iterable[str] = TOP_K_PARTITIONS,
+        columns: Iterable[str] = FILTER_COLUMNS,
+        range_columns: Iterable[str] = RANGE_COLUMNS,
+    ):
+        super().__init__(df, columns, range_columns)
+        self.metrics = [m for m in metrics if m in df.columns]
+        self._values = {m: df[m].to_numpy(dtype=np.float64) for m in self.metrics}
+        self._orders: dict[str, np.ndarray] = {}
+        # (metric, column) -> that metric's order grouped by column value, with
+        # each value's (start, stop) slice of it; column -> rows per value.
+        self._partitioned: dict[tuple[str, str], np.ndarray] = {}
+        self._bounds: dict[tuple[str, str], dict] = {}
+        self._group_rows: dict[str, dict] = {}
+
+        for metric, values in self._values.items():
+            order = np.argsort(-values, kind="stable")
+            self._orders[metric] = order[~np.isnan(values[order])]
+
+        for col in partition_by:
+            col_codes, uniques = pd.factorize(df[col], sort=True)
+            counts = np.bincount(col_codes[col_codes >= 0], minlength=len(uniques))
+            self._group_rows[col] = dict(zip(uniques, counts))
+            for metric, order in self._orders.items():
+                # A stable sort by group keeps each group's rows in metric order.
+                grouped = col_codes[order]
+                self._partitioned[(metric, col)] = order[np.argsort(grouped, kind="stable")]
+                group_counts = np.bincount(grouped[grouped >= 0], minlength=len(uniques))
+                stops = np.cumsum(group_counts) + int((grouped < 0).sum())
+                self._bounds[(metric, col)] = dict(zip(uniques, zip(stops - group_counts, stops)))
+
+    def _streams(self, metric: str, selections: dict[str, Iterable]) -> list[np.ndarray]:
+        """Presorted position lists whose union covers every selected row."""
+        best = None
+        for col, accepted in selections.items():
+            if not accepted or col not in self._group_rows:
+                continue
+            rows = sum(self._group_rows[col].get(v, 0) for v in accepted)
+            if best is None or rows < best[0]:
+                best = (rows, col, accepted)
+        if best is None:
+            return [self._orders[metric]]
+        _, col, accepted = best
+        partitioned = self._partitioned[(metric, col)]
+        bounds = self._bounds[(metric, col)]
+        return [partitioned[slice(*bounds[v])] for v in set(accepted) if v in bounds]
+
+    def query(
+        self,
+        metric: str = "total_sales",
+        k: int = 10,
+        selections: dict[str, Iterable] | None = None,
+        ranges: dict[str, tuple] | None = None,
+    ) -> np.ndarray:
+        """Row positions of the top *k* rows by *metric* matching the filters.
+
+        Rows are ranked by descending *metric*, ties by row position; rows with a
+        missing *metric* are never returned.
+        """
+        if metric not in self._orders:
+            raise ValueError(f"Unknown metric {metric!r}; expected one of {self.metrics}")
+        selections = selections or {}
+        mask = np.unpackbits(self.bitmap(selections, ranges), count=self.n_rows).astype(bool)
+
+        candidates = []
+        for stream in self._streams(metric, selections):
+            found, start, block = [], 0, max(4 * k, 256)
+            while start < len(stream) and sum(len(f) for f in found) < k:
+                chunk = stream[start : start + block]
+                found.append(chunk[mask[chunk]])
+                start, block = start + block, block * 2
+            candidates.append(np.concatenate(found)[:k] if found else stream[:0])
+
+        positions = np.concatenate(candidates) if candidates else np.empty(0, dtype=np.intp)
+        ranked = np.lexsort((positions, -self._values[metric][positions]))
+        return positions[ranked[:k]]
+
+    def top(
+        self,
+        df: pd.DataFrame,
+        metric: str = "total_sales",
+        k: int = 10,
+        selections: dict[str, Iterable] | None = None,
+        ranges: dict[str, tuple] | None = None,
+        columns: Iterable[str] = TOP_K_COLUMNS,
+    ) -> pd.DataFrame:
+        """Top-*k* rows of *df* (the indexed frame) as a table with a ``rank`` column."""
+        if len(df) != self.n_rows:
+            raise ValueError(f"Index built for {self.n_rows} rows, got {len(df)}")
+        positions = self.query(metric, k, selections, ranges)
+        columns = [c for c in columns if c in df.columns and c != metric] + [metric]
+        table = df.iloc[positions][columns].reset_index(drop=True)
+        table.insert(0, "rank", np.arange(1, len(table) + 1))
+        return table
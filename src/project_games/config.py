@@ -1,19 +1,46 @@
+import copy
+import os
+from functools import cache
 from pathlib import Path
 
 import yaml
-from dotenv import load_dotenv
-
-load_dotenv()
 
 _PROJECT_ROOT = Path(__file__).resolve().parents[2]
 _DEFAULT_CONFIG = _PROJECT_ROOT / "config" / "default.yaml"
 
+# Parsed config files keyed by path, with the (mtime, size) they were read at.
+_CONFIG_CACHE: dict[Path, tuple[tuple[int, int], dict]] = {}
+
 
 def load_config(path: Path | str | None = None) -> dict:
-    """Load YAML configuration, defaulting to config/default.yaml."""
+    """Load YAML configuration, defaulting to config/default.yaml.
+
+    The parsed file is cached and only re-read when its modification time or
+    size changes. Each call returns a separate copy, so callers may modify it.
+    """
     config_path = Path(path) if path else _DEFAULT_CONFIG
-    with open(config_path) as f:
-        return yaml.safe_load(f)
+    stat = config_path.stat()
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    cached = _CONFIG_CACHE.get(config_path)
+    if cached is None or cached[0] != stamp:
+        with open(config_path) as f:
+            cached = (stamp, yaml.safe_load(f))
+        _CONFIG_CACHE[config_path] = cached
+    return copy.deepcopy(cached[1])
+
+
+@cache
+def load_env() -> None:
+    """Load variables from a ``.env`` file into ``os.environ`` (once per process)."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+def getenv(name: str, default: str | None = None) -> str | None:
+    """``os.getenv`` after loading ``.env``."""
+    load_env()
+    return os.getenv(name, default)
 
 
 def get_project_root() -> Path:
@@ -1,6 +1,8 @@
 import numpy as np
 import pandas as pd
 
+from project_games.data.matching import name_keys
+
 
 def standardize_columns(df: pd.DataFrame) -> pd.DataFrame:
     """Lowercase all column names."""
@@ -17,34 +19,44 @@ def cast_types(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def _assign_year_from_name(row: pd.Series) -> int | None:
-    """Try to extract a 4-digit year from the game name."""
-    if pd.isna(row["name"]):
-        return None
-    for word in str(row["name"]).split():
-        if word.isdigit() and len(word) == 4:
-            return int(word)
-        if word.isdigit() and len(word) == 2:
-            return int("20" + word) if int(word) < 20 else int("19" + word)
-    return None
+# First whitespace-delimited word of exactly four or two digits.
+_YEAR_WORD = r"(?<!\S)(\d{4}|\d{2})(?!\S)"
+
+
+def _years_from_names(names: pd.Series) -> pd.Series:
+    """Year taken from the first 4- or 2-digit word of each name (2-digit: 19xx/20xx)."""
+    digits = names.str.extract(_YEAR_WORD, expand=False)
+    year = pd.to_numeric(digits, errors="coerce")
+    two_digit = digits.str.len() == 2
+    year[two_digit] = np.where(year[two_digit] < 20, 2000, 1900) + year[two_digit]
+    return year
+
+
+def _most_common_year(keys: pd.Series, years: pd.Series) -> pd.Series:
+    """Most frequent known year per key, the earliest one on ties."""
+    known = pd.DataFrame({"key": keys, "year": years}).dropna()
+    counts = known.value_counts().reset_index()
+    counts = counts.sort_values(["count", "year"], ascending=[False, True])
+    return counts.drop_duplicates("key").set_index("key")["year"]
 
 
-def fill_year_of_release(df: pd.DataFrame) -> pd.DataFrame:
-    """Fill missing year_of_release using name heuristics and cross-platform lookup."""
+def fill_year_of_release(df: pd.DataFrame, fuzzy: bool = False) -> pd.DataFrame:
+    """Fill missing year_of_release using name heuristics and cross-platform lookup.
+
+    With *fuzzy*, the cross-platform lookup matches titles by
+    :func:`~project_games.data.matching.name_keys` instead of exact names.
+    """
     df = df.copy()
 
     # 1. Extract year from game name
     mask = df["year_of_release"].isna() | (df["year_of_release"] == 0)
-    df.loc[mask, "year_of_release"] = df.loc[mask].apply(_assign_year_from_name, axis=1)
+    df.loc[mask, "year_of_release"] = _years_from_names(df.loc[mask, "name"])
 
     # 2. Fill from same game on another platform
-    year_by_game = (
-        df.groupby("name")["year_of_release"]
-        .apply(lambda x: x.dropna().mode().iloc[0] if not x.dropna().empty else np.nan)
-        .to_dict()
-    )
+    keys = name_keys(df["name"]) if fuzzy else df["name"]
+    year_by_game = _most_common_year(keys, df["year_of_release"])
     mask_nan = df["year_of_release"].isna()
-    df.loc[mask_nan, "year_of_release"] = df.loc[mask_nan, "name"].map(year_by_game)
+    df.loc[mask_nan, "year_of_release"] = keys[mask_nan].map(year_by_game)
 
     return df
 
@@ -65,24 +77,34 @@ def add_total_sales(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def drop_duplicates(df: pd.DataFrame) -> pd.DataFrame:
-    """Remove duplicate games keeping the entry with highest total_sales."""
+def drop_duplicates(df: pd.DataFrame, fuzzy: bool = False) -> pd.DataFrame:
+    """Remove duplicate games keeping the entry with highest total_sales.
+
+    With *fuzzy*, titles are compared by their fuzzy match key instead of exactly.
+    """
     df = df.copy()
     if "total_sales" not in df.columns:
         df = add_total_sales(df)
+    name_col = "name"
+    if fuzzy:
+        name_col = "_name_key"
+        df[name_col] = name_keys(df["name"])
     df = (
         df.sort_values("total_sales", ascending=False)
-        .drop_duplicates(subset=["name", "platform", "genre", "year_of_release"], keep="first")
+        .drop_duplicates(subset=[name_col, "platform", "genre", "year_of_release"], keep="first")
     )
-    return df
+    return df.drop(columns="_name_key", errors="ignore")
+
 
+def clean_dataset(df: pd.DataFrame, fuzzy_names: bool = False) -> pd.DataFrame:
+    """Run the full cleaning pipeline (no imputation).
 
-def clean_dataset(df: pd.DataFrame) -> pd.DataFrame:
-    """Run the full cleaning pipeline (no imputation)."""
+    *fuzzy_names* enables fuzzy title matching for year recovery and deduplication.
+    """
     df = standardize_columns(df)
     df = cast_types(df)
-    df = fill_year_of_release(df)
+    df = fill_year_of_release(df, fuzzy=fuzzy_names)
     df = drop_incomplete_rows(df)
     df = add_total_sales(df)
-    df = drop_duplicates(df)
+    df = drop_duplicates(df, fuzzy=fuzzy_names)
     return df.reset_index(drop=True)
@@ -0,0 +1,274 @@
+"""Fixed-width columnar dataset files opened with ``numpy.memmap``.
+
+A dataset is a directory holding ``meta.json`` and one or more raw files per
+column:
+
+- numeric and boolean columns: the values as a fixed-width array;
+- text columns: ``int64`` offsets (``rows + 1``), a UTF-8 byte blob and an
+  optional validity bitmap, the layout of an Arrow ``large_string`` array;
+- low-cardinality text columns additionally: integer codes, with the
+  categories in ``meta.json``, for opening them as a ``pd.Categorical``.
+
+:func:`open_columnar` maps the files copy-on-write and wraps the arrays in a
+DataFrame without copying, so processes opening the same dataset share one copy
+in the page cache and opening costs about the same whatever the row count.
+Text is only copied when the pandas text dtype is not Arrow-backed (``object``
+before pandas 3), as Python strings cannot live in a mapped file. Writes to the
+frame stay private to the process. A rewrite builds the new files in a sibling
+directory and swaps it in, so files still mapped by other processes are never
+truncated.
+"""
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+FORMAT_VERSION = 1
+META_FILE = "meta.json"
+
+
+def text_dtype():
+    """The dtype pandas gives text by default, as :func:`pandas.read_csv` returns it.
+
+    ``str`` (Arrow-backed) on pandas 3, ``object`` on pandas 2 unless the
+    ``future.infer_string`` option is set.
+    """
+    return pd.Series(["a"]).dtype
+
+
+def _is_arrow_text(dtype) -> bool:
+    return isinstance(dtype, pd.StringDtype) and dtype.storage == "pyarrow"
+
+
+def _is_text(values: pd.Series) -> bool:
+    if isinstance(values.dtype, pd.CategoricalDtype) or pd.api.types.is_string_dtype(values):
+        return True
+    # pandas 2 keeps text in object columns, which may also hold NaN.
+    return values.dtype == object and pd.api.types.infer_dtype(values) in ("string", "empty")
+
+
+def dictionary_categories(df: pd.DataFrame, max_ratio: float = 0.5) -> dict[str, list[str]]:
+    """Sorted categories of the text columns worth dictionary-encoding.
+
+    A column qualifies when its distinct values number at most *max_ratio* of
+    the rows.
+    """
+    categories = {}
+    for name in df.columns:
+        if _is_text(df[name]):
+            values = pd.Categorical(df[name]).categories
+            if len(values) <= max_ratio * max(len(df), 1):
+                categories[name] = [str(v) for v in values]
+    return categories
+
+
+def write_columnar(
+    df: pd.DataFrame,
+    path: str | Path,
+    dictionary_max_ratio: float = 0.5,
+    categories: dict[str, list[str]] | None = None,
+) -> Path:
+    """Write *df* as a columnar dataset directory at *path*.
+
+    Text columns whose distinct values number at most *dictionary_max_ratio* of
+    the rows are dictionary-encoded; the rest are stored as offsets and bytes.
+    Passing *categories* (see :func:`dictionary_categories`) fixes the encoding
+    instead: listed columns use exactly those categories, other text columns are
+    stored as strings. Datasets written in parts use this to stay consistent.
+
+    The dataset is written to a sibling directory and then renamed to *path*,
+    replacing any existing dataset there. Readers that already mapped the old
+    files keep them intact.
+    """
+    target = Path(path)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    path = target.with_name(target.name + ".tmp")
+    if path.exists():
+        shutil.rmtree(path)
+    path.mkdir()
+    if categories is None:
+        categories = dictionary_categories(df, dictionary_max_ratio)
+    columns = []
+    for i, name in enumerate(df.columns):
+        values = df[name]
+        stem = f"{i:03d}"
+        if _is_text(values):
+            column = {"name": name, "kind": "string", **_write_strings(values, path, stem)}
+            if name in categories:
+                categorical = pd.Categorical(values, categories=categories[name])
+                codes = categorical.codes
+                codes.tofile(path / f"{stem}.codes")
+                column.update(
+                    kind="dictionary",
+                    dtype=codes.dtype.str,
+                    codes=f"{stem}.codes",
+                    categories=[str(c) for c in categorical.categories],
+                )
+            columns.append(column)
+        elif values.dtype.kind in "biuf":
+            array = values.to_numpy()
+            array.tofile(path / f"{stem}.values")
+            columns.append(
+                {
+                    "name": name,
+                    "kind": "numeric",
+                    "dtype": array.dtype.str,
+                    "values": f"{stem}.values",
+                }
+            )
+        else:
+            raise TypeError(f"Column {name!r} has unsupported dtype {values.dtype}")
+
+    meta = {"format": FORMAT_VERSION, "rows": len(df), "columns": columns}
+    (path / META_FILE).write_text(json.dumps(meta, indent=1))
+    _swap_directory(path, target)
+    return target
+
+
+def _write_strings(values: pd.Series, path: Path, stem: str) -> dict:
+    """Write *values* as offsets, bytes and validity files; their ``meta.json`` keys."""
+    valid = values.notna().to_numpy()
+    encoded = [str(v).encode() if ok else b"" for v, ok in zip(values.tolist(), valid)]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(e) for e in encoded], out=offsets[1:])
+    offsets.tofile(path / f"{stem}.offsets")
+    (path / f"{stem}.data").write_bytes(b"".join(encoded))
+    files = {"offsets": f"{stem}.offsets", "data": f"{stem}.data", "validity": None}
+    if not valid.all():
+        np.packbits(valid, bitorder="little").tofile(path / f"{stem}.valid")
+        files["validity"] = f"{stem}.valid"
+    return files
+
+
+def _swap_directory(new: Path, target: Path) -> None:
+    """Move the finished directory *new* to *target*, removing the old *target*.
+
+    Old files are unlinked, never truncated, so existing memory maps stay valid.
+    """
+    if not target.exists():
+        os.replace(new, target)
+        return
+    old = target.with_name(target.name + ".old")
+    if old.exists():
+        shutil.rmtree(old)
+    os.replace(target, old)
+    os.replace(new, target)
+    shutil.rmtree(old)
+
+
+def _map(path: Path, dtype: str | np.dtype, length: int) -> np.ndarray:
+    """Copy-on-write memory map of a raw array file (empty files cannot be mapped)."""
+    if length == 0:
+        return np.empty(0, dtype=dtype)
+    return np.memmap(path, dtype=dtype, mode="c", shape=(length,))
+
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+    except ImportError:
+        return None
+    return pa
+
+
+def _string_array(path: Path, column: dict, rows: int, dtype, copy: bool = True):
+    """Array of *dtype* over a text column's files.
+
+    An Arrow-backed *dtype* wraps the mapped buffers without copying. Otherwise
+    the strings are decoded into Python objects, unless *copy* is false: then
+    ``None`` is returned and the caller decodes the column another way.
+    """
+    pa = _pyarrow()
+    zero_copy = pa is not None and _is_arrow_text(dtype)
+    if not zero_copy and not copy:
+        return None
+    offsets = _map(path / column["offsets"], np.int64, rows + 1)
+    data_size = int(offsets[-1]) if rows else 0
+    data = _map(path / column["data"], np.uint8, data_size)
+    validity = None
+    if column["validity"]:
+        validity = _map(path / column["validity"], np.uint8, (rows + 7) // 8)
+    if not zero_copy:
+        blob = data.tobytes()
+        valid = (
+            np.ones(rows, dtype=bool)
+            if validity is None
+            else np.unpackbits(validity, count=rows, bitorder="little").astype(bool)
+        )
+        strings = [
+            blob[start:stop].decode() if ok else np.nan
+            for start, stop, ok in zip(offsets[:-1], offsets[1:], valid)
+        ]
+        return pd.array(strings, dtype=dtype)
+
+    array = pa.LargeStringArray.from_buffers(
+        rows,
+        pa.py_buffer(offsets),
+        pa.py_buffer(data),
+        None if validity is None else pa.py_buffer(validity),
+    )
+    return pd.arrays.ArrowStringArray(array, dtype=dtype)
+
+
+def decode_dictionaries(df: pd.DataFrame) -> pd.DataFrame:
+    """*df* with its categorical columns decoded to the default text dtype."""
+    categorical = [name for name in df.columns if isinstance(df[name].dtype, pd.CategoricalDtype)]
+    if not categorical:
+        return df
+    # Built column by column: ``assign`` would copy the other columns on pandas 2.
+    dtype = text_dtype()
+    columns = {name: df[name] for name in df.columns}
+    columns.update({name: df[name].astype(dtype) for name in categorical})
+    return pd.DataFrame(columns, index=df.index, copy=False)
+
+
+def open_columnar(
+    path: str | Path, columns: list[str] | None = None, categorical: bool = False
+) -> pd.DataFrame:
+    """Open a dataset written by :func:`write_columnar` as a DataFrame.
+
+    Only the requested *columns* (default: all) are mapped. Text columns get the
+    dtype :func:`pandas.read_csv` gives them (see :func:`text_dtype`); with
+    pandas 3's Arrow-backed ``str`` they are mapped without copying, dictionary
+    columns included. If *categorical* is set, dictionary-encoded columns are
+    instead ``pd.Categorical`` over the mapped codes.
+    """
+    path = Path(path)
+    meta_path = path / META_FILE
+    if not meta_path.exists():
+        raise FileNotFoundError(f"Columnar dataset not found: {path}")
+    meta = json.loads(meta_path.read_text())
+    if meta["format"] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported columnar format {meta['format']} in {path}")
+
+    rows = meta["rows"]
+    text = text_dtype()
+    by_name = {column["name"]: column for column in meta["columns"]}
+    if columns is not None:
+        missing = [c for c in columns if c not in by_name]
+        if missing:
+            raise KeyError(f"Columns not in dataset: {missing}")
+    data = {}
+    for name in columns if columns is not None else by_name:
+        column = by_name[name]
+        if column["kind"] == "numeric":
+            data[name] = _map(path / column["values"], column["dtype"], rows)
+        elif column["kind"] == "dictionary":
+            strings = None
+            if not categorical and "data" in column:
+                strings = _string_array(path, column, rows, text, copy=False)
+            if strings is not None:
+                data[name] = strings
+                continue
+            # Decoding the few categories beats decoding every row's bytes.
+            codes = _map(path / column["codes"], column["dtype"], rows)
+            categories = pd.Index(column["categories"], dtype=text)
+            data[name] = pd.Categorical.from_codes(codes, categories=categories, validate=False)
+        else:
+            data[name] = _string_array(path, column, rows, text)
+    df = pd.DataFrame(data, index=pd.RangeIndex(rows), copy=False)
+    return df if categorical else decode_dictionaries(df)
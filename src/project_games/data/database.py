@@ -0,0 +1,191 @@
+"""Processed dataset as an indexed SQLite table, queried with SQL aggregates.
+
+:func:`write_database` stores the processed frame as one ``games`` table with an
+index per grouping column. :class:`GameDatabase` is a read-only view of that
+table, optionally restricted by filters in the ``(column, op, value)``
+convention of :mod:`project_games.data.partitioned`. Its queries run the
+grouping and summing inside SQLite, so only the grouped rows come back to Python.
+"""
+
+import os
+import sqlite3
+from contextlib import closing
+from pathlib import Path
+
+import pandas as pd
+
+from project_games.config import get_project_root, load_config
+from project_games.data.partitioned import Filters
+
+TABLE = "games"
+INDEX_COLUMNS = ("platform", "genre", "rating", "year_of_release")
+# Appended to every index, so grouped sums over a year range never touch the table.
+COVERED_COLUMNS = (
+    "year_of_release",
+    "platform",
+    "na_sales",
+    "eu_sales",
+    "jp_sales",
+    "other_sales",
+    "total_sales",
+)
+
+# SQL aggregate per statistic name; TOTAL sums to 0.0 over no values, like pandas.
+AGGREGATES = {"sum": "TOTAL", "mean": "AVG", "count": "COUNT"}
+
+
+def _quote(name: str) -> str:
+    return '"' + name.replace('"', '""') + '"'
+
+
+def write_database(
+    df: pd.DataFrame,
+    path: str | Path,
+    table: str = TABLE,
+    index_columns: tuple[str, ...] = INDEX_COLUMNS,
+    covered_columns: tuple[str, ...] = COVERED_COLUMNS,
+) -> Path:
+    """Write *df* as *table* of a SQLite database at *path*, indexed on *index_columns*.
+
+    Each index leads with its column and also holds *covered_columns*, making it
+    a covering index for the aggregates of :class:`GameDatabase`. The database
+    is built next to *path* and moved into place, so readers never see a
+    half-written file. An existing database at *path* is replaced.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.unlink(missing_ok=True)
+    with closing(sqlite3.connect(tmp)) as conn, conn:
+        df.to_sql(table, conn, index=False)
+        for column in index_columns:
+            if column not in df.columns:
+                continue
+            covered = [c for c in covered_columns if c in df.columns and c != column]
+            conn.execute(
+                f"CREATE INDEX {_quote(f'{table}_{column}')} "
+                f"ON {_quote(table)} ({', '.join(_quote(c) for c in [column, *covered])})"
+            )
+        conn.execute("ANALYZE")
+    os.replace(tmp, path)
+    return path
+
+
+def _predicate(column: str, op: str, value) -> tuple[str, list]:
+    """SQL for one filter, with ``NaN``/``NULL`` treated as :func:`filter_mask` treats them."""
+    col = _quote(column)
+    if op in ("in", "not in"):
+        values = list(value)
+        marks = ", ".join("?" * len(values))
+        if op == "in":
+            return (f"{col} IN ({marks})", values) if values else ("0", [])
+        return (f"({col} IS NULL OR {col} NOT IN ({marks}))", values) if values else ("1", [])
+    if op == "!=":
+        return f"{col} IS NOT ?", [value]
+    if op in ("==", "<", "<=", ">", ">="):
+        return f"{col} {'=' if op == '==' else op} ?", [value]
+    raise ValueError(f"Unknown filter operator {op!r}")
+
+
+class GameDatabase:
+    """Read-only, optionally filtered view of the games table in a SQLite file."""
+
+    def __init__(self, path: str | Path, table: str = TABLE, filters: Filters | None = None):
+        self.path = Path(path)
+        self.table = table
+        self.filters = list(filters or [])
+        if not self.path.exists():
+            raise FileNotFoundError(f"Database not found: {self.path}")
+
+    def where(self, filters: Filters | None) -> "GameDatabase":
+        """View of the rows that also match *filters*."""
+        return GameDatabase(self.path, self.table, [*self.filters, *(filters or [])])
+
+    def _where(self, extra: list[str] = ()) -> tuple[str, list]:
+        clauses, params = list(extra), []
+        for column, op, value in self.filters:
+            clause, values = _predicate(column, op, value)
+            clauses.append(clause)
+            params += values
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def query(self, sql: str, params: list | tuple = ()) -> pd.DataFrame:
+        """Run *sql* on a read-only connection and return the result rows."""
+        uri = f"{self.path.resolve().as_uri()}?mode=ro"
+        with closing(sqlite3.connect(uri, uri=True)) as conn:
+            return pd.read_sql_query(sql, conn, params=params)
+
+    def count(self) -> int:
+        """Number of rows in the view."""
+        where, params = self._where()
+        return int(
+            self.query(f"SELECT COUNT(*) AS n FROM {_quote(self.table)}{where}", params)["n"][0]
+        )
+
+    def totals(self, columns: list[str]) -> pd.Series:
+        """Sum of each of *columns* over the view (NULLs skipped)."""
+        select = ", ".join(f"TOTAL({_quote(c)}) AS {_quote(c)}" for c in columns)
+        where, params = self._where()
+        return self.query(f"SELECT {select} FROM {_quote(self.table)}{where}", params).iloc[0]
+
+    def size(self, by: str | list[str]) -> pd.Series:
+        """Number of rows per group, indexed by the keys in sorted order."""
+        by = [by] if isinstance(by, str) else list(by)
+        keys = ", ".join(_quote(k) for k in by)
+        where, params = self._where([f"{_quote(k)} IS NOT NULL" for k in by])
+        sql = f"SELECT {keys}, COUNT(*) AS size FROM {_quote(self.table)}{where} GROUP BY {keys}"
+        return self.query(sql, params).set_index(by)["size"].sort_index().rename(None)
+
+    def aggregate(
+        self, by: str | list[str], columns: list[str], stats: tuple[str, ...] = ("sum",)
+    ) -> pd.DataFrame:
+        """Per-group *stats* of *columns*, computed in SQLite.
+
+        Rows with a missing key are dropped (as in ``groupby``) and NULL values
+        are excluded from the statistics of their column. With a single
+        statistic the columns keep their names, else they are ``{column}_{stat}``.
+        The result is indexed by the keys in sorted order.
+        """
+        by = [by] if isinstance(by, str) else list(by)
+        selects = [_quote(k) for k in by]
+        for column in columns:
+            for stat in stats:
+                name = column if len(stats) == 1 else f"{column}_{stat}"
+                selects.append(f"{AGGREGATES[stat]}({_quote(column)}) AS {_quote(name)}")
+        keys = ", ".join(_quote(k) for k in by)
+        where, params = self._where([f"{_quote(k)} IS NOT NULL" for k in by])
+        sql = f"SELECT {', '.join(selects)} FROM {_quote(self.table)}{where} GROUP BY {keys}"
+        return self.query(sql, params).set_index(by).sort_index()
+
+    def median(self, by: str, column: str) -> pd.Series:
+        """Per-group median of *column*, from the middle ranks of each group."""
+        key, col = _quote(by), _quote(column)
+        where, params = self._where([f"{key} IS NOT NULL", f"{col} IS NOT NULL"])
+        sql = f"""
+            SELECT {key}, AVG({col}) AS {col} FROM (
+                SELECT {key}, {col},
+                    ROW_NUMBER() OVER (PARTITION BY {key} ORDER BY {col}) AS k,
+                    COUNT(*) OVER (PARTITION BY {key}) AS n
+                FROM {_quote(self.table)}{where}
+            )
+            WHERE k IN ((n + 1) / 2, (n + 2) / 2)
+            GROUP BY {key}
+        """
+        return self.query(sql, params).set_index(by)[column].sort_index()
+
+    def values(self, by: str, column: str, groups: list) -> pd.DataFrame:
+        """Non-null ``(by, column)`` rows for *groups*, in table order."""
+        marks = ", ".join("?" * len(groups))
+        key, col = _quote(by), _quote(column)
+        where, params = self._where([f"{key} IN ({marks})", f"{col} IS NOT NULL"])
+        sql = f"SELECT {key}, {col} FROM {_quote(self.table)}{where} ORDER BY rowid"
+        return self.query(sql, [*groups, *params])
+
+
+def open_database(path: str | Path | None = None, cfg: dict | None = None) -> GameDatabase:
+    """The processed dataset's database, by default at ``data.sqlite_path``."""
+    if path is None:
+        if cfg is None:
+            cfg = load_config()
+        path = get_project_root() / cfg["data"]["sqlite_path"]
+    return GameDatabase(path)
@@ -0,0 +1,39 @@
+import hashlib
+import json
+from pathlib import Path
+
+import pandas as pd
+
+
+def dataset_fingerprint(df: pd.DataFrame) -> str:
+    """Content hash of a DataFrame (column names, dtypes and row values)."""
+    h = hashlib.sha256()
+    h.update(json.dumps([[str(c), str(t)] for c, t in df.dtypes.items()]).encode())
+    h.update(pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes())
+    return h.hexdigest()[:16]
+
+
+def config_fingerprint(
+    cfg: dict, sections: tuple[str, ...] = ("analysis", "hypothesis_tests")
+) -> str:
+    """Hash of the config sections that affect analysis results."""
+    payload = json.dumps({k: cfg.get(k) for k in sections}, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def file_fingerprint(path: str | Path, chunk_size: int = 1 << 20) -> str:
+    """Content hash of a file, read in fixed-size chunks.
+
+    For a directory (e.g. a columnar dataset) the names and contents of its
+    files are hashed in sorted order.
+    """
+    path = Path(path)
+    files = sorted(p for p in path.rglob("*") if p.is_file()) if path.is_dir() else [path]
+    h = hashlib.sha256()
+    for file in files:
+        if path.is_dir():
+            h.update(file.relative_to(path).as_posix().encode() + b"\0")
+        with open(file, "rb") as f:
+            while chunk := f.read(chunk_size):
+                h.update(chunk)
+    return h.hexdigest()[:16]
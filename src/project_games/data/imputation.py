@@ -1,15 +1,78 @@
+from collections.abc import Iterable
+
 import numpy as np
 import pandas as pd
 
 from project_games.config import load_config
+from project_games.data.matching import name_keys
+from project_games.data.sketches import GroupedKLL
+
+STRATEGIES = ("median", "approx_median", "mode")
+NUMERIC_STRATEGIES = ("median", "approx_median")
+
+# Group columns per imputation level; None is the global level.
+LEVEL_GROUPS = {
+    0: ["name"],
+    1: ["platform", "genre", "year_of_release"],
+    2: ["genre", "year_of_release"],
+    3: ["genre"],
+    4: None,
+}
+
+
+def _group_keys(df: pd.DataFrame, group_cols: list[str] | None) -> pd.Index:
+    """Group key of every row (a constant for the global level)."""
+    if group_cols is None:
+        return pd.Index(np.zeros(len(df), dtype=np.int64))
+    if len(group_cols) == 1:
+        return pd.Index(df[group_cols[0]])
+    return pd.MultiIndex.from_frame(df[group_cols])
+
+
+def build_median_sketches(
+    chunks: Iterable[pd.DataFrame], column: str, max_level: int = 4, k: int = 200
+) -> dict[int, GroupedKLL]:
+    """Per-level grouped quantile sketches of *column* built from *chunks*.
+
+    The chunks can be partitions of the dataset or a streaming reader; sketches
+    from separate runs combine with :meth:`GroupedKLL.merge`. With ``k`` items per
+    compactor the rank error of a group's median is about ``1.7 / k`` of its size,
+    and groups with at most ``k`` values are kept whole.
+    """
+    sketches = {level: GroupedKLL(k) for level in range(max_level + 1)}
+    for chunk in chunks:
+        for level, sketch in sketches.items():
+            group_cols = LEVEL_GROUPS[level]
+            if group_cols is None:
+                values = chunk[column].to_numpy(float)
+            elif all(col in chunk.columns for col in group_cols):
+                # Like groupby, rows with a missing key belong to no group.
+                values = chunk[column].where(chunk[group_cols].notna().all(axis=1))
+                values = values.to_numpy(float)
+            else:
+                continue
+            sketch.update(_group_keys(chunk, group_cols), values)
+    return sketches
 
 
-def _agg_func(column: str, df: pd.DataFrame):
-    """Return the appropriate aggregation callable (mode for categorical, median for numeric)."""
-    is_categorical = df[column].dtype == "object" or column == "rating"
-    if is_categorical:
-        return lambda x: x.mode().iloc[0] if len(x.mode()) > 0 else np.nan
-    return "median"
+def _group_stats(
+    df: pd.DataFrame, group_cols: list[str], column: str, strategy: str
+) -> pd.DataFrame:
+    """Per-group imputation value and non-null count of *column*."""
+    grouped = df.groupby(group_cols)[column]
+    if strategy == "median":
+        return grouped.agg(value="median", count="count")
+    # Mode as Series.mode().iloc[0] picks it: most frequent, smallest value on ties.
+    counts = grouped.value_counts().rename("n").reset_index()
+    counts = counts.sort_values(
+        [*group_cols, "n", column], ascending=[True] * len(group_cols) + [False, True]
+    )
+    modes = counts.drop_duplicates(group_cols).set_index(group_cols)[column]
+    return pd.DataFrame({"value": modes, "count": grouped.count()})
+
+
+def _sketch_stats(sketch: GroupedKLL) -> pd.DataFrame:
+    return pd.DataFrame({"value": sketch.quantile(0.5), "count": sketch.counts()})
 
 
 def impute_hierarchical(
@@ -17,6 +80,9 @@ def impute_hierarchical(
     column: str,
     min_samples: int = 5,
     max_level: int = 4,
+    name_key: pd.Series | None = None,
+    strategy: str | None = None,
+    sketches: dict[int, GroupedKLL] | None = None,
 ) -> tuple[pd.Series, pd.Series]:
     """Impute missing values using a hierarchical grouping strategy.
 
@@ -27,36 +93,52 @@ def impute_hierarchical(
         3. genre
         4. Global (median or mode)
 
+    When *name_key* (e.g. from :func:`~project_games.data.matching.name_keys`) is
+    given, level 0 matches on it instead of the exact name.
+
+    *strategy* is one of :data:`STRATEGIES`; by default ``"mode"`` for text
+    columns and ``rating``, ``"median"`` otherwise. The median strategies need a
+    numeric column. ``"approx_median"`` takes
+    group medians from quantile sketches: pass *sketches* built over chunks or
+    partitions with :func:`build_median_sketches`, or they are built from *df*.
+
     Returns:
         (imputed_values, imputation_levels)
     """
+    if name_key is not None:
+        df = df.assign(name=name_key)
+    numeric = pd.api.types.is_numeric_dtype(df[column])
+    if strategy is None:
+        strategy = "median" if numeric and column != "rating" else "mode"
+    if strategy in NUMERIC_STRATEGIES and not numeric:
+        raise ValueError(
+            f"Strategy {strategy!r} needs a numeric column, but {column!r} has dtype "
+            f"{df[column].dtype}; use 'mode'"
+        )
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy {strategy!r}; expected one of {STRATEGIES}")
+    is_categorical = strategy == "mode"
+    if strategy == "approx_median" and sketches is None:
+        sketches = build_median_sketches([df], column, max_level)
+
     imputed_col = df[column].copy()
     imputation_level = pd.Series("original", index=df.index)
     imputation_level[df[column].isna()] = "not_imputed"
 
-    is_categorical = df[column].dtype == "object" or column == "rating"
-    agg_func = _agg_func(column, df)
-
-    hierarchies = {
-        0: ["name"],
-        1: ["platform", "genre", "year_of_release"],
-        2: ["genre", "year_of_release"],
-        3: ["genre"],
-        4: None,  # global
-    }
-
     for level in range(max_level + 1):
         mask = imputed_col.isna()
         if not mask.any():
             break
 
-        group_cols = hierarchies[level]
+        group_cols = LEVEL_GROUPS[level]
 
         if group_cols is None:
             # Global level
             if is_categorical:
                 mode = df[column].mode()
                 global_value = mode.iloc[0] if len(mode) > 0 else np.nan
+            elif strategy == "approx_median":
+                global_value = sketches[level].quantile(0.5).get(0, np.nan)
             else:
                 global_value = df[column].median()
 
@@ -67,20 +149,18 @@ def impute_hierarchical(
             if not all(col in df.columns for col in group_cols):
                 continue
 
-            level_stats = df.groupby(group_cols)[column].agg(value=agg_func, count="count")
+            if strategy == "approx_median":
+                level_stats = _sketch_stats(sketches[level])
+            else:
+                level_stats = _group_stats(df, group_cols, column, strategy)
             level_stats = level_stats[level_stats["count"] >= min_samples]
 
-            for idx in df[mask].index:
-                group_key = (
-                    tuple(df.loc[idx, col] for col in group_cols)
-                    if len(group_cols) > 1
-                    else df.loc[idx, group_cols[0]]
-                )
-                if group_key in level_stats.index:
-                    value = level_stats.loc[group_key, "value"]
-                    if pd.notna(value):
-                        imputed_col.at[idx] = value
-                        imputation_level.at[idx] = f"level_{level}"
+            # Look up every missing row's group at once.
+            keys = _group_keys(df[mask], group_cols)
+            values = pd.Series(level_stats["value"].reindex(keys).to_numpy(), index=df.index[mask])
+            values = values[values.notna()]
+            imputed_col[values.index] = values
+            imputation_level[values.index] = f"level_{level}"
 
     # Mark remaining nulls as TBD for categorical columns
     remaining = imputed_col.isna()
@@ -94,18 +174,30 @@ def impute_hierarchical(
 def impute_dataset(df: pd.DataFrame, cfg: dict | None = None) -> pd.DataFrame:
     """Run hierarchical imputation on critic_score, user_score, and rating.
 
+    Each column uses its ``imputation.strategy`` from config (see
+    :data:`STRATEGIES`); a group needs ``imputation.min_samples`` known values
+    (default 5) to be used.
+
     Returns a new DataFrame with imputed values (imputation-level columns are dropped).
     """
     if cfg is None:
         cfg = load_config()
 
     df = df.copy()
-
-    # critic_score and user_score: all levels (0-4)
-    df["critic_score"], _ = impute_hierarchical(df, "critic_score", min_samples=5, max_level=4)
-    df["user_score"], _ = impute_hierarchical(df, "user_score", min_samples=5, max_level=4)
-
-    # rating: levels 0-2 only, rest becomes TBD
-    df["rating"], _ = impute_hierarchical(df, "rating", min_samples=5, max_level=2)
+    name_key = name_keys(df["name"]) if cfg.get("matching", {}).get("fuzzy_names") else None
+
+    strategies = cfg["imputation"].get("strategy", {})
+    min_samples = cfg["imputation"].get("min_samples", 5)
+
+    # critic_score and user_score: all levels (0-4); rating: levels 0-2, rest becomes TBD
+    for column, max_level in [("critic_score", 4), ("user_score", 4), ("rating", 2)]:
+        df[column], _ = impute_hierarchical(
+            df,
+            column,
+            min_samples=min_samples,
+            max_level=max_level,
+            name_key=name_key,
+            strategy=strategies.get(column),
+        )
 
     return df
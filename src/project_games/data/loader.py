@@ -1,9 +1,10 @@
-import os
 from pathlib import Path
 
 import pandas as pd
 
-from project_games.config import get_project_root, load_config
+from project_games.config import get_project_root, getenv, load_config
+from project_games.data.columnar import META_FILE, open_columnar
+from project_games.data.partitioned import DATASET_FILE, Filters, apply_filters, open_partitioned
 
 
 def load_raw_data(path: str | Path | None = None) -> pd.DataFrame:
@@ -11,11 +12,11 @@ def load_raw_data(path: str | Path | None = None) -> pd.DataFrame:
 
     Resolution order:
     1. Explicit *path* argument
-    2. ``DATA_PATH`` environment variable
+    2. ``DATA_PATH`` environment variable (``.env`` is read on first use)
     3. ``data.raw_path`` from config/default.yaml
     """
     if path is None:
-        path = os.getenv("DATA_PATH")
+        path = getenv("DATA_PATH")
     if path is None:
         cfg = load_config()
         path = get_project_root() / cfg["data"]["raw_path"]
@@ -27,14 +28,57 @@ def load_raw_data(path: str | Path | None = None) -> pd.DataFrame:
     return pd.read_csv(path)
 
 
-def load_processed_data(path: str | Path | None = None) -> pd.DataFrame:
-    """Load the processed (cleaned + imputed) dataset."""
+def _default_processed_path(cfg: dict, filtered: bool) -> Path:
+    """Best existing copy of the processed data for a filtered or full load.
+
+    Filtered loads prefer the partitioned dataset, full loads the single
+    memory-mapped columnar copy (no concatenation); the CSV is the fallback.
+    """
+    root = get_project_root()
+    partitioned = cfg["data"].get("partitioned_path")
+    columnar = cfg["data"].get("columnar_path")
+    candidates = [(partitioned, DATASET_FILE), (columnar, META_FILE)]
+    if not filtered:
+        candidates.reverse()
+    for directory, marker in candidates:
+        if directory and (root / directory / marker).exists():
+            return root / directory
+    return root / cfg["data"]["processed_path"]
+
+
+def load_processed_data(
+    path: str | Path | None = None,
+    filters: Filters | None = None,
+    columns: list[str] | None = None,
+) -> pd.DataFrame:
+    """Load the processed (cleaned + imputed) dataset.
+
+    *path* may be a partitioned dataset (see :mod:`project_games.data.partitioned`),
+    a memory-mapped columnar directory (see :mod:`project_games.data.columnar`)
+    or a CSV file. By default filtered loads use ``data.partitioned_path`` and
+    full loads ``data.columnar_path`` when they exist, else ``data.processed_path``.
+
+    *filters* is a list of ``(column, op, value)`` predicates, e.g.
+    ``[("year_of_release", ">=", 2014)]``, and *columns* selects the columns
+    returned. A partitioned dataset only reads the partitions and columns these
+    need; other formats are filtered after loading.
+    """
     if path is None:
-        cfg = load_config()
-        path = get_project_root() / cfg["data"]["processed_path"]
+        path = _default_processed_path(load_config(), filtered=bool(filters))
 
     path = Path(path)
     if not path.exists():
         raise FileNotFoundError(f"Processed dataset not found: {path}")
 
-    return pd.read_csv(path)
+    if (path / DATASET_FILE).exists():
+        return open_partitioned(path, filters, columns)
+
+    needed = None
+    if columns is not None:
+        needed = list(dict.fromkeys([*columns, *(f[0] for f in filters or [])]))
+    if path.is_dir():
+        df = open_columnar(path, columns=needed)
+    else:
+        df = pd.read_csv(path, usecols=needed)[needed] if needed else pd.read_csv(path)
+    df = apply_filters(df, filters)
+    return df if columns is None else df[columns]
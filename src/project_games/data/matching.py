@@ -0,0 +1,190 @@
+"""Fuzzy matching of game titles across platforms.
+
+Titles are first normalised (case, accents, punctuation, sales-source suffixes such
+as ``"(JP sales)"`` and trailing edition words). Distinct normalised titles are
+then blocked with MinHash signatures over character n-grams and banded
+locality-sensitive hashing, so only titles sharing a band bucket are compared and
+the cost stays near-linear in the number of titles. Candidates whose n-gram
+Jaccard similarity reaches the threshold, whose markers (sequel numbers, years,
+roman numerals, single letters) agree and whose words are the same, in the same
+order, apart from stop words, spacing and one-letter spelling variants of long
+words ("traveler"/"traveller"), are merged into one key with union-find.
+A pair is only merged if the titles representing both clusters match as well,
+so a cluster cannot grow by a chain of near-misses.
+"""
+
+import re
+import unicodedata
+import zlib
+
+import numpy as np
+import pandas as pd
+
+DEFAULT_THRESHOLD = 0.85
+
+# Parenthesised notes about the sales source or build, e.g. "(JP weekly sales)".
+_SOURCE_NOTE = re.compile(r"\([^)]*\b(?:sales|version|region)\b[^)]*\)", re.IGNORECASE)
+_EDITION_QUALIFIERS = {
+    "special", "limited", "collectors", "deluxe", "ultimate", "definitive",
+    "complete", "gold", "anniversary", "goty",
+}
+_ROMAN = re.compile(r"^[ivx]{1,4}$")
+# Words whose presence alone does not make two titles different games.
+_STOP_WORDS = {"a", "an", "and", "of", "the"}
+
+
+def fold_text(text: str) -> str:
+    """Lower-case ASCII words of *text*, without accents, apostrophes or punctuation."""
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode()
+    text = text.lower().replace("&", " and ").replace("'", "")
+    return " ".join(re.sub(r"[^a-z0-9]+", " ", text).split())
+
+
+def normalize_name(name: str) -> str:
+    """Canonical form of a title used as the exact-match key."""
+    tokens = fold_text(_SOURCE_NOTE.sub(" ", name)).split()
+    if tokens[-1:] == ["edition"]:
+        tokens.pop()
+        if tokens[-1:] and tokens[-1] in _EDITION_QUALIFIERS:
+            tokens.pop()
+    elif tokens[-1:] == ["goty"]:
+        tokens.pop()
+    return " ".join(tokens)
+
+
+def _markers(text: str) -> tuple[str, ...]:
+    """Tokens that tell sequels and ports apart: numbers, roman numerals, letters."""
+    return tuple(
+        t for t in text.split() if any(c.isdigit() for c in t) or _ROMAN.match(t) or len(t) == 1
+    )
+
+
+def _content_words(text: str) -> list[str]:
+    return [t for t in text.split() if t not in _STOP_WORDS]
+
+
+def _one_edit_apart(a: str, b: str) -> bool:
+    """Whether *a* becomes *b* by one inserted, deleted or replaced letter."""
+    if len(a) > len(b):
+        a, b = b, a
+    if len(b) - len(a) > 1:
+        return False
+    i = next((k for k, (x, y) in enumerate(zip(a, b)) if x != y), len(a))
+    return a[i + (len(a) == len(b)) :] == b[i + 1 :]
+
+
+def _same_words(a: str, b: str, min_length: int = 5) -> bool:
+    """Same content words in the same order, up to spacing and long-word typos."""
+    wa, wb = _content_words(a), _content_words(b)
+    if "".join(wa) == "".join(wb):
+        return True
+    return len(wa) == len(wb) and all(
+        x == y or (min(len(x), len(y)) >= min_length and _one_edit_apart(x, y))
+        for x, y in zip(wa, wb)
+    )
+
+
+def same_title(a: str, b: str, threshold: float = DEFAULT_THRESHOLD) -> bool:
+    """Whether normalised titles *a* and *b* name the same game."""
+    return _markers(a) == _markers(b) and _same_words(a, b) and jaccard(a, b) >= threshold
+
+
+def _ngrams(text: str, ngram: int = 3) -> set[str]:
+    padded = f" {text} "
+    return {padded[j : j + ngram] for j in range(max(len(padded) - ngram + 1, 1))}
+
+
+def jaccard(a: str, b: str, ngram: int = 3) -> float:
+    """Exact Jaccard similarity of the character n-gram sets of *a* and *b*."""
+    ga, gb = _ngrams(a, ngram), _ngrams(b, ngram)
+    return len(ga & gb) / len(ga | gb)
+
+
+def _mix(x: np.ndarray) -> np.ndarray:
+    """splitmix64 finaliser: a well-mixed 64-bit hash of each element."""
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def minhash_signatures(
+    texts: list[str], num_perm: int = 64, ngram: int = 3, seed: int = 0
+) -> np.ndarray:
+    """MinHash signatures (``len(texts) x num_perm``) of character n-gram sets."""
+    ids, hashes = [], []
+    for i, text in enumerate(texts):
+        grams = _ngrams(text, ngram)
+        ids.extend([i] * len(grams))
+        hashes.extend(zlib.crc32(g.encode()) for g in grams)
+    ids = np.asarray(ids, dtype=np.int64)
+    hashes = np.asarray(hashes, dtype=np.uint64)
+    starts = np.flatnonzero(np.r_[True, ids[1:] != ids[:-1]]) if len(ids) else ids
+
+    seeds = np.random.default_rng(seed).integers(0, 1 << 63, num_perm, dtype=np.uint64)
+    signatures = np.empty((len(texts), num_perm), dtype=np.uint64)
+    # Permutation blocks keep the (n-grams x permutations) matrix small.
+    for lo in range(0, num_perm, 16):
+        permuted = _mix(hashes[:, None] ^ seeds[lo : lo + 16])
+        signatures[:, lo : lo + 16] = np.minimum.reduceat(permuted, starts, axis=0)
+    return signatures
+
+
+def candidate_pairs(signatures: np.ndarray, bands: int = 16) -> np.ndarray:
+    """Pairs ``(i, j)`` of rows sharing at least one LSH band bucket.
+
+    Each row is paired with the first row of its bucket rather than with every
+    bucket member, which keeps the candidate count linear in the number of rows.
+    """
+    n, num_perm = signatures.shape
+    rows = num_perm // bands
+    pairs = []
+    for band in range(bands):
+        block = np.ascontiguousarray(signatures[:, band * rows : (band + 1) * rows])
+        _, first, inverse = np.unique(block, axis=0, return_index=True, return_inverse=True)
+        rep = first[inverse.ravel()]
+        linked = np.flatnonzero(rep != np.arange(n))
+        pairs.append(np.column_stack([linked, rep[linked]]))
+    if not pairs:
+        return np.empty((0, 2), dtype=np.int64)
+    return np.unique(np.concatenate(pairs), axis=0)
+
+
+def _find(parent: np.ndarray, i: int) -> int:
+    root = i
+    while parent[root] != root:
+        root = parent[root]
+    while parent[i] != root:
+        parent[i], i = root, parent[i]
+    return root
+
+
+def name_keys(
+    names: pd.Series,
+    threshold: float = DEFAULT_THRESHOLD,
+    num_perm: int = 64,
+    bands: int = 16,
+) -> pd.Series:
+    """Integer match key per title; sibling titles share a key, missing names get NA."""
+    present = names.notna()
+    normalized = names[present].astype(str).map(normalize_name)
+    codes, uniques = pd.factorize(normalized)
+    texts = list(uniques)
+
+    parent = np.arange(len(texts))
+    if len(texts) > 1:
+        signatures = minhash_signatures(texts, num_perm=num_perm)
+        pairs = candidate_pairs(signatures, bands=bands)
+        # The signature agreement estimates Jaccard; a looser cut-off than the
+        # threshold keeps borderline pairs for the exact check.
+        estimate = (signatures[pairs[:, 0]] == signatures[pairs[:, 1]]).mean(axis=1)
+        for i, j in pairs[estimate >= threshold - 0.1]:
+            if not same_title(texts[i], texts[j], threshold):
+                continue
+            ri, rj = _find(parent, i), _find(parent, j)
+            if ri != rj and same_title(texts[ri], texts[rj], threshold):
+                parent[max(ri, rj)] = min(ri, rj)
+    roots = np.array([_find(parent, i) for i in range(len(texts))], dtype=np.int64)
+
+    keys = pd.Series(pd.NA, index=names.index, dtype="Int64")
+    keys[present] = roots[codes]
+    return keys
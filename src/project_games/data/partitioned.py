@@ -0,0 +1,154 @@
+"""Processed dataset split into partitions by year (and optionally platform).
+
+Each partition is a columnar dataset (see :mod:`project_games.data.columnar`) in a
+``column=value`` sub-directory; ``dataset.json`` lists the partitions with their
+key values and row counts. Readers prune partitions against the filters before
+opening anything, so a slice of the years costs I/O proportional to the slice.
+
+Filters use the ``read_parquet`` convention: a list of ``(column, op, value)``
+predicates that must all hold, with ``op`` one of ``==``, ``!=``, ``<``, ``<=``,
+``>``, ``>=``, ``in`` and ``not in``.
+"""
+
+import json
+import shutil
+from pathlib import Path
+from urllib.parse import quote
+
+import numpy as np
+import pandas as pd
+
+from project_games.data.columnar import (
+    decode_dictionaries,
+    dictionary_categories,
+    open_columnar,
+    write_columnar,
+)
+
+DATASET_FILE = "dataset.json"
+ROW_COLUMN = "__row__"
+
+Filters = list[tuple[str, str, object]]
+
+_OPS = {
+    "==": lambda s, v: s == v,
+    "!=": lambda s, v: s != v,
+    "<": lambda s, v: s < v,
+    "<=": lambda s, v: s <= v,
+    ">": lambda s, v: s > v,
+    ">=": lambda s, v: s >= v,
+    "in": lambda s, v: s.isin(list(v)),
+    "not in": lambda s, v: ~s.isin(list(v)),
+}
+
+
+def filter_mask(df: pd.DataFrame, filters: Filters | None) -> np.ndarray:
+    """Boolean mask of the rows of *df* matching every predicate in *filters*."""
+    mask = np.ones(len(df), dtype=bool)
+    for column, op, value in filters or []:
+        if op not in _OPS:
+            raise ValueError(f"Unknown filter operator {op!r}; expected one of {list(_OPS)}")
+        mask &= _OPS[op](df[column], value).fillna(False).to_numpy(dtype=bool)
+    return mask
+
+
+def apply_filters(df: pd.DataFrame, filters: Filters | None) -> pd.DataFrame:
+    """Rows of *df* matching *filters*, renumbered from 0."""
+    if not filters:
+        return df
+    return df[filter_mask(df, filters)].reset_index(drop=True)
+
+
+def _partition_dir(columns: list[str], values: tuple) -> str:
+    parts = []
+    for column, value in zip(columns, values):
+        label = "__null__" if pd.isna(value) else quote(str(value), safe="")
+        parts.append(f"{column}={label}")
+    return "/".join(parts)
+
+
+def _jsonable(value):
+    if pd.isna(value):
+        return None
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def write_partitioned(
+    df: pd.DataFrame,
+    path: str | Path,
+    partition_by: list[str] | tuple[str, ...] = ("year_of_release",),
+) -> Path:
+    """Write *df* as a dataset partitioned by *partition_by* at *path*.
+
+    An existing dataset at *path* is replaced.
+    """
+    path = Path(path)
+    partition_by = list(partition_by)
+    if path.exists():
+        if not (path / DATASET_FILE).exists() and any(path.iterdir()):
+            raise FileExistsError(f"Not a partitioned dataset, refusing to overwrite: {path}")
+        shutil.rmtree(path)
+    path.mkdir(parents=True)
+
+    # Shared categories keep dictionary columns identical across partitions, and
+    # the original row numbers let readers restore the row order.
+    categories = dictionary_categories(df)
+    data = df.assign(**{ROW_COLUMN: np.arange(len(df), dtype=np.int64)})
+    partitions = []
+    for values, part in data.groupby(partition_by, dropna=False, sort=True, observed=True):
+        values = values if isinstance(values, tuple) else (values,)
+        directory = _partition_dir(partition_by, values)
+        write_columnar(part, path / directory, categories=categories)
+        partitions.append(
+            {"path": directory, "values": [_jsonable(v) for v in values], "rows": len(part)}
+        )
+
+    meta = {
+        "partition_by": partition_by,
+        "columns": list(df.columns),
+        "rows": len(df),
+        "partitions": partitions,
+    }
+    (path / DATASET_FILE).write_text(json.dumps(meta, indent=1))
+    return path
+
+
+def open_partitioned(
+    path: str | Path,
+    filters: Filters | None = None,
+    columns: list[str] | None = None,
+    categorical: bool = False,
+) -> pd.DataFrame:
+    """Rows of a partitioned dataset matching *filters*, in their original order.
+
+    Partitions whose key values fail a predicate on a partition column are never
+    opened; the remaining predicates are applied to the rows read. Only *columns*
+    (default: all) and the columns the filters need are mapped. Dictionary
+    columns are decoded to strings once the partitions are combined, unless
+    *categorical* is set (see :func:`~project_games.data.columnar.open_columnar`).
+    """
+    path = Path(path)
+    meta = json.loads((path / DATASET_FILE).read_text())
+    partition_by = meta["partition_by"]
+
+    keys = pd.DataFrame([p["values"] for p in meta["partitions"]], columns=partition_by)
+    pruning = [f for f in filters or [] if f[0] in partition_by]
+    selected = [p for p, keep in zip(meta["partitions"], filter_mask(keys, pruning)) if keep]
+
+    wanted = list(meta["columns"]) if columns is None else list(columns)
+    missing = [c for c in wanted if c not in meta["columns"]]
+    if missing:
+        raise KeyError(f"Columns not in dataset: {missing}")
+    needed = list(dict.fromkeys([*wanted, *(f[0] for f in filters or []), ROW_COLUMN]))
+
+    if not meta["partitions"]:
+        return pd.DataFrame(columns=wanted)
+    parts = [open_columnar(path / p["path"], needed, categorical=True) for p in selected]
+    if not parts:
+        # An empty slice of one partition gives the result the right dtypes.
+        empty = open_columnar(path / meta["partitions"][0]["path"], needed, categorical=True)
+        parts = [empty.iloc[:0]]
+    df = pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0]
+    df = df[filter_mask(df, filters)]
+    df = df.sort_values(ROW_COLUMN, kind="stable")[wanted].reset_index(drop=True)
+    return df if categorical else decode_dictionaries(df)
@@ -0,0 +1,227 @@
+"""Missing-value and column profiles of the games dataset.
+
+Null rates for several groupings come from one ``isna()`` indicator matrix: each
+grouping factorizes its key column once and sums the indicator per group with
+``bincount``, so no Python code runs per group.
+
+:class:`StreamingProfiler` profiles every column in one pass over a chunked
+reader, using fixed-size sketches from :mod:`project_games.data.sketches` so its
+memory does not grow with the number of rows.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from project_games.data.sketches import HyperLogLog, KLLSketch, SpaceSaving
+
+NULL_ATTRIBUTES = ["critic_score", "user_score", "rating"]
+PROFILE_GROUPS = ("genre", "platform", "year_of_release")
+OTHER_LABEL = "Other"
+
+
+def _group_codes(
+    keys: pd.Series, max_categories: int | None
+) -> tuple[np.ndarray, pd.Index]:
+    """Group codes of *keys* (-1 for missing) and their labels.
+
+    Beyond *max_categories* distinct values, numeric keys are bucketed into
+    contiguous ranges of equal width and other keys keep the most frequent
+    ``max_categories - 1`` values, folding the rest into ``"Other"``.
+    """
+    codes, uniques = pd.factorize(keys, sort=True)
+    uniques = pd.Index(uniques, name=keys.name)
+    if max_categories is None or len(uniques) <= max_categories:
+        return codes, uniques
+
+    valid = codes >= 0
+    if pd.api.types.is_numeric_dtype(uniques):
+        values = uniques.to_numpy(dtype=float)
+        lo, hi = values.min(), values.max()
+        width = int(np.ceil((hi - lo + 1) / max_categories))
+        bucket_of = ((values - lo) // width).astype(int)
+        starts = lo + width * np.arange(bucket_of.max() + 1)
+        ends = np.minimum(starts + width - 1, hi)
+        labels = [f"{int(s)}–{int(e)}" if e > s else f"{int(s)}" for s, e in zip(starts, ends)]
+        new_codes = np.where(valid, bucket_of[codes], -1)
+        return new_codes, pd.Index(labels, name=keys.name)
+
+    counts = np.bincount(codes[valid], minlength=len(uniques))
+    keep = np.sort(np.argsort(-counts, kind="stable")[: max_categories - 1])
+    remap = np.full(len(uniques), len(keep))
+    remap[keep] = np.arange(len(keep))
+    new_codes = np.where(valid, remap[codes], -1)
+    labels = [*uniques[keep], OTHER_LABEL]
+    return new_codes, pd.Index(labels, name=keys.name)
+
+
+def _grouped_rates(
+    indicator: np.ndarray, codes: np.ndarray, labels: pd.Index, attributes: list[str]
+) -> pd.DataFrame:
+    valid = codes >= 0
+    codes = codes[valid]
+    n_groups = len(labels)
+    counts = np.bincount(codes, minlength=n_groups)
+    nulls = np.zeros((n_groups, len(attributes)))
+    for j in range(len(attributes)):
+        nulls[:, j] = np.bincount(codes, weights=indicator[valid, j], minlength=n_groups)
+    present = counts > 0
+    rates = nulls[present] / counts[present, None] * 100
+    return pd.DataFrame(rates, index=labels[present], columns=attributes)
+
+
+def null_rates(
+    df: pd.DataFrame,
+    by: str,
+    attributes: list[str] | None = None,
+    max_categories: int | None = None,
+) -> pd.DataFrame:
+    """Percentage of missing values of each attribute per value of *by*.
+
+    Rows with a missing *by* key are ignored. See :func:`null_profiles` for the
+    effect of *max_categories*.
+    """
+    return null_profiles(df, [by], attributes, max_categories)[by]
+
+
+def null_profiles(
+    df: pd.DataFrame,
+    by: list[str] | tuple[str, ...] = PROFILE_GROUPS,
+    attributes: list[str] | None = None,
+    max_categories: int | None = None,
+) -> dict[str, pd.DataFrame]:
+    """Null-percentage tables of *attributes* for every grouping in *by*.
+
+    The ``isna()`` indicator matrix is built once and reused for each grouping.
+    When a grouping has more than *max_categories* values, numeric keys (years)
+    are bucketed into ranges and categorical keys keep their most frequent values
+    plus an ``"Other"`` row.
+    """
+    if attributes is None:
+        attributes = NULL_ATTRIBUTES
+    indicator = df[attributes].isna().to_numpy(dtype=float)
+    profiles = {}
+    for col in by:
+        codes, labels = _group_codes(df[col], max_categories)
+        profiles[col] = _grouped_rates(indicator, codes, labels, list(attributes))
+    return profiles
+
+
+PROFILE_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+# Space-Saving counters per column; enough for the top titles of a full dataset.
+FREQUENT_CAPACITY = 1_000
+
+
+@dataclass
+class ColumnSketch:
+    """Running counts and sketches of one column."""
+
+    rows: int = 0
+    nulls: int = 0
+    numeric_count: int = 0
+    total: float = 0.0
+    minimum: float = np.inf
+    maximum: float = -np.inf
+    distinct: HyperLogLog = field(default_factory=HyperLogLog)
+    quantiles: KLLSketch = field(default_factory=KLLSketch)
+    frequent: SpaceSaving = field(default_factory=SpaceSaving)
+
+    def update(self, values: pd.Series) -> None:
+        present = values.dropna()
+        self.rows += len(values)
+        self.nulls += len(values) - len(present)
+        if pd.api.types.is_numeric_dtype(present):
+            numbers = present.astype(np.float64)
+        else:
+            # Numeric text such as "8.5" next to "tbd": parse what parses.
+            numbers = pd.to_numeric(present, errors="coerce")
+        parsed = numbers.notna()
+        numbers = numbers[parsed].to_numpy(dtype=np.float64)
+
+        # Values are counted by a canonical label, so 8, 8.0 and "8" agree
+        # whichever dtype a chunk happened to be read with.
+        labels = present.astype(str)
+        labels[parsed] = numbers.astype(str)
+        self.distinct.update(labels.to_numpy())
+        self.frequent.update(labels.to_numpy())
+
+        if len(numbers):
+            self.numeric_count += len(numbers)
+            self.total += float(numbers.sum())
+            self.minimum = min(self.minimum, float(numbers.min()))
+            self.maximum = max(self.maximum, float(numbers.max()))
+            self.quantiles.update(numbers)
+
+    @property
+    def is_numeric(self) -> bool:
+        """Whether most non-null values are numbers."""
+        return self.numeric_count > 0 and self.numeric_count >= (self.rows - self.nulls) / 2
+
+
+def _frequency_label(value, count: int, error: int) -> str:
+    if error:
+        return f"{value} ({count}, error ≤ {error})"
+    return f"{value} ({count})"
+
+
+class StreamingProfiler:
+    """One-pass column profiler over DataFrame chunks."""
+
+    def __init__(self, quantiles: Iterable[float] = PROFILE_QUANTILES, top_k: int = 5):
+        self.qs = tuple(quantiles)
+        self.top_k = top_k
+        self.columns: dict[str, ColumnSketch] = {}
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        for col in chunk.columns:
+            if col not in self.columns:
+                frequent = SpaceSaving(max(FREQUENT_CAPACITY, 10 * self.top_k))
+                self.columns[col] = ColumnSketch(frequent=frequent)
+            self.columns[col].update(chunk[col])
+
+    def result(self) -> pd.DataFrame:
+        """One row per column: null rate, approximate distinct count, numeric
+        summary with approximate quantiles, and the most frequent values.
+
+        Counts of the frequent values are upper bounds, followed by their
+        possible over-count where it is not zero. A column with no value frequent
+        enough to be certain of (e.g. mostly unique titles) lists none.
+        """
+        rows = []
+        for col, sketch in self.columns.items():
+            numeric = sketch.is_numeric
+            quantiles = sketch.quantiles.quantiles(self.qs) if numeric else [np.nan] * len(self.qs)
+            rows.append(
+                {
+                    "column": col,
+                    "rows": sketch.rows,
+                    "nulls": sketch.nulls,
+                    "null_pct": 100 * sketch.nulls / sketch.rows if sketch.rows else np.nan,
+                    "distinct_approx": round(sketch.distinct.count()),
+                    "min": sketch.minimum if numeric else np.nan,
+                    "mean": sketch.total / sketch.numeric_count if numeric else np.nan,
+                    "max": sketch.maximum if numeric else np.nan,
+                    **{f"q{round(q * 100):02d}": v for q, v in zip(self.qs, quantiles)},
+                    "top_values": "; ".join(
+                        _frequency_label(*item) for item in sketch.frequent.top(self.top_k)
+                    ),
+                }
+            )
+        return pd.DataFrame(rows)
+
+
+def profile_csv(
+    path: str | Path,
+    chunksize: int = 50_000,
+    quantiles: Iterable[float] = PROFILE_QUANTILES,
+    top_k: int = 5,
+) -> pd.DataFrame:
+    """Profile a CSV file in one chunked pass (see :class:`StreamingProfiler`)."""
+    profiler = StreamingProfiler(quantiles, top_k)
+    with pd.read_csv(path, chunksize=chunksize) as reader:
+        for chunk in reader:
+            profiler.update(chunk)
+    return profiler.result()
@@ -0,0 +1,237 @@
+"""Fixed-memory streaming sketches used by the dataset profiler.
+
+Each sketch is fed whole arrays (one chunk of a column at a time), keeps state
+whose size does not depend on the number of rows seen, and can be merged with
+another sketch of the same kind.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def hash_values(values: np.ndarray) -> np.ndarray:
+    """Stable 64-bit hashes; numbers hash by float value so 1 and 1.0 agree."""
+    if values.dtype.kind in "iufb":
+        values = values.astype(np.float64)
+    else:
+        values = values.astype(str).astype(object)
+    return pd.util.hash_array(values, categorize=False)
+
+
+class HyperLogLog:
+    """HyperLogLog distinct counter with ``2**p`` registers (~1.04/sqrt(2**p) error)."""
+
+    def __init__(self, p: int = 12):
+        self.p = p
+        self.registers = np.zeros(1 << p, dtype=np.uint8)
+
+    def update(self, values: np.ndarray) -> None:
+        if len(values) == 0:
+            return
+        hashes = hash_values(values)
+        index = (hashes >> np.uint64(64 - self.p)).astype(np.int64)
+        rest = hashes & np.uint64((1 << (64 - self.p)) - 1)
+        # Rank = position of the leftmost 1-bit in the remaining 64 - p bits.
+        width = 64 - self.p
+        bits = np.zeros(len(rest), dtype=np.int64)
+        nonzero = rest > 0
+        bits[nonzero] = np.floor(np.log2(rest[nonzero].astype(np.float64))).astype(np.int64) + 1
+        rank = np.where(nonzero, width - bits + 1, width + 1).astype(np.uint8)
+        np.maximum.at(self.registers, index, rank)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        np.maximum(self.registers, other.registers, out=self.registers)
+
+    def count(self) -> float:
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(np.exp2(-self.registers.astype(np.float64)))
+        zeros = int((self.registers == 0).sum())
+        if estimate <= 2.5 * m and zeros:
+            # Small-range correction: linear counting over empty registers.
+            estimate = m * np.log(m / zeros)
+        return float(estimate)
+
+
+class KLLSketch:
+    """KLL quantile sketch: compactors of geometrically shrinking capacity.
+
+    Items at level ``h`` stand for ``2**h`` original values. When a level
+    overflows it is sorted and every other item (random offset) is promoted.
+    """
+
+    def __init__(self, k: int = 200, seed: int = 0):
+        self.k = k
+        self.n = 0
+        self.levels: list[np.ndarray] = [np.empty(0)]
+        self._rng = np.random.default_rng(seed)
+
+    def _capacity(self, level: int) -> int:
+        depth = len(self.levels) - level - 1
+        return max(2, int(np.ceil(self.k * (2 / 3) ** depth)))
+
+    def update(self, values: np.ndarray) -> None:
+        values = np.asarray(values, dtype=np.float64)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+        self.n += len(values)
+        self.levels[0] = np.concatenate([self.levels[0], values])
+        self._compress()
+
+    def _compress(self) -> None:
+        level = 0
+        while level < len(self.levels):
+            items = self.levels[level]
+            if len(items) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                items = np.sort(items)
+                # An odd item out stays behind so the promoted weight is exact.
+                keep = items[len(items) - len(items) % 2 :]
+                pairs = items[: len(items) - len(items) % 2]
+                promoted = pairs[self._rng.integers(2) :: 2]
+                self.levels[level] = keep
+                self.levels[level + 1] = np.concatenate([self.levels[level + 1], promoted])
+            level += 1
+
+    def merge(self, other: "KLLSketch") -> None:
+        while len(self.levels) < len(other.levels):
+            self.levels.append(np.empty(0))
+        for level, items in enumerate(other.levels):
+            self.levels[level] = np.concatenate([self.levels[level], items])
+        self.n += other.n
+        self._compress()
+
+    def quantiles(self, qs) -> np.ndarray:
+        """Approximate values at quantiles *qs* (in ``[0, 1]``)."""
+        qs = np.atleast_1d(np.asarray(qs, dtype=np.float64))
+        if self.n == 0:
+            return np.full(len(qs), np.nan)
+        if len(self.levels) == 1:
+            # Nothing compacted yet: the quantiles are exact.
+            return np.quantile(self.levels[0], qs)
+        items = np.concatenate(self.levels)
+        weights = np.concatenate(
+            [np.full(len(items_h), 2.0**h) for h, items_h in enumerate(self.levels)]
+        )
+        order = np.argsort(items, kind="stable")
+        items, cumulative = items[order], np.cumsum(weights[order])
+        ranks = qs * cumulative[-1]
+        position = np.searchsorted(cumulative, ranks, side="left")
+        return items[np.minimum(position, len(items) - 1)]
+
+    def size(self) -> int:
+        return sum(len(items) for items in self.levels)
+
+
+class SpaceSaving:
+    """Weighted Space-Saving heavy hitters with *capacity* counters.
+
+    Each chunk is counted exactly and combined with the counters; values new to
+    the counters are charged the smallest tracked count as possible error, then
+    only the *capacity* largest counters are kept. Any value with frequency above
+    ``n / capacity`` stays tracked, and reported counts over-estimate by at most
+    the value's ``error``. A value that is not tracked occurred at most
+    :meth:`floor` times.
+    """
+
+    def __init__(self, capacity: int = 100):
+        self.capacity = capacity
+        self.counts = pd.Series(dtype=np.int64)
+        self.errors = pd.Series(dtype=np.int64)
+
+    def floor(self) -> int:
+        """Upper bound on the count of any value that is not tracked."""
+        return int(self.counts.min()) if len(self.counts) >= self.capacity else 0
+
+    def _combine(self, counts: pd.Series, errors: pd.Series, floor: int) -> None:
+        own_floor = self.floor()
+        combined = self.counts.add(counts, fill_value=0)
+        combined_errors = self.errors.add(errors, fill_value=0)
+        only_new = counts.index.difference(self.counts.index)
+        only_own = self.counts.index.difference(counts.index)
+        combined.loc[only_new] += own_floor
+        combined_errors.loc[only_new] += own_floor
+        combined.loc[only_own] += floor
+        combined_errors.loc[only_own] += floor
+        keep = combined.sort_values(ascending=False, kind="stable").index[: self.capacity]
+        self.counts = combined[keep].astype(np.int64)
+        self.errors = combined_errors[keep].astype(np.int64)
+
+    def update(self, values: np.ndarray) -> None:
+        if len(values) == 0:
+            return
+        counts = pd.Series(values).value_counts()
+        self._combine(counts, pd.Series(0, index=counts.index), 0)
+
+    def merge(self, other: "SpaceSaving") -> None:
+        self._combine(other.counts, other.errors, other.floor())
+
+    def top(self, k: int = 10) -> list[tuple[object, int, int]]:
+        """Up to *k* ``(value, count, error)`` triples, most frequent first.
+
+        Values are ranked by their guaranteed count ``count - error``, and only
+        values guaranteed to occur at least :meth:`floor` times are returned, so
+        none of them can be outnumbered by a value that was evicted. The true
+        count of each lies between ``count - error`` and ``count``.
+        """
+        guaranteed = self.counts - self.errors
+        floor = self.floor()
+        ranked = sorted(
+            (
+                (value, int(count), int(self.errors[value]))
+                for value, count in self.counts.items()
+                if guaranteed[value] >= floor
+            ),
+            key=lambda item: (item[2] - item[1], -item[1], str(item[0])),
+        )
+        return ranked[:k]
+
+
+class GroupedKLL:
+    """One :class:`KLLSketch` per group key, fed chunk by chunk and mergeable.
+
+    Keys are scalars or tuples (for several group columns). :meth:`merge` takes
+    over the other object's sketches, so it should not be used afterwards.
+    """
+
+    def __init__(self, k: int = 200, seed: int = 0):
+        self.k = k
+        self.seed = seed
+        self.sketches: dict = {}
+
+    def update(self, keys: pd.Index, values: np.ndarray) -> None:
+        """Add *values*, grouped by the aligned *keys*; NaN values are skipped."""
+        values = np.asarray(values, dtype=np.float64)
+        present = ~np.isnan(values)
+        codes, uniques = pd.factorize(keys[present])
+        values = values[present]
+        valid = codes >= 0
+        codes, values = codes[valid], values[valid]
+        order = np.argsort(codes, kind="stable")
+        bounds = np.flatnonzero(np.diff(codes[order])) + 1
+        for code, chunk in zip(np.unique(codes), np.split(values[order], bounds)):
+            key = uniques[code]
+            if key not in self.sketches:
+                self.sketches[key] = KLLSketch(self.k, self.seed)
+            self.sketches[key].update(chunk)
+
+    def merge(self, other: "GroupedKLL") -> None:
+        for key, sketch in other.sketches.items():
+            if key in self.sketches:
+                self.sketches[key].merge(sketch)
+            else:
+                self.sketches[key] = sketch
+
+    def _index(self) -> pd.Index:
+        return pd.Index(list(self.sketches))
+
+    def counts(self) -> pd.Series:
+        """Number of values seen per group."""
+        return pd.Series([s.n for s in self.sketches.values()], index=self._index(), dtype=np.int64)
+
+    def quantile(self, q: float) -> pd.Series:
+        """Approximate *q*-quantile per group."""
+        values = [s.quantiles([q])[0] for s in self.sketches.values()]
+        return pd.Series(values, index=self._index(), dtype=np.float64)
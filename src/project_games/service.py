@@ -0,0 +1,404 @@
+"""Local HTTP/JSON API over the analysis package.
+
+The dataset is loaded once and indexed with a :class:`TopKIndex` (a bitmap index
+with presorted per-metric row orders). Each request is answered from a shared
+:class:`AnalysisCache`; on a miss the pandas work runs on a thread pool so the
+event loop keeps serving other clients, and concurrent identical requests wait
+on the same computation instead of repeating it.
+
+Every endpoint is a ``GET`` and accepts the same filter parameters:
+``start_year``, ``end_year`` and ``platform``/``genre``/``rating`` (repeated or
+comma-separated). Indexed endpoints such as ``/titles/top`` answer from the
+:class:`TopKIndex` directly instead of a filtered copy of the frame. Title
+endpoints (``/titles/search``, ``/titles/lookup``) answer from a
+:class:`TitleIndex` and, unlike the others, cover every year unless filters are
+given explicitly.
+"""
+
+import asyncio
+import json
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlsplit
+
+import numpy as np
+import pandas as pd
+
+from project_games.analysis.filters import BitmapIndex
+from project_games.analysis.genre import classify_genres, genre_sales_summary
+from project_games.analysis.hypothesis import HypothesisResult, run_ttest
+from project_games.analysis.memo import AnalysisCache
+from project_games.analysis.platform import platform_total_sales
+from project_games.analysis.regional import (
+    market_share_genres,
+    market_share_platforms,
+    rating_sales_by_region,
+    top_genres_by_region,
+    top_platforms_by_region,
+)
+from project_games.analysis.search import TitleIndex, UnknownTitleError
+from project_games.analysis.temporal import games_per_year
+from project_games.analysis.topk import TopKIndex
+from project_games.config import load_config
+from project_games.data.loader import load_processed_data
+
+SELECTION_PARAMS = ("platform", "genre", "rating")
+ENDPOINTS: dict[str, Callable[..., object]] = {}
+INDEXED_ENDPOINTS: set[str] = set()
+TITLE_ENDPOINTS: set[str] = set()
+
+
+def endpoint(path: str, indexed: bool = False, titles: bool = False):
+    """Register ``func(df_view, params, cfg)`` as the handler of *path*.
+
+    Handlers of *indexed* endpoints are called as
+    ``func(df, index, selections, ranges, params, cfg)`` with the full frame,
+    handlers of *titles* endpoints as ``func(df, titles, mask, params)`` with the
+    title index and a boolean row mask (``None`` when no filter was given).
+    """
+
+    def register(func):
+        ENDPOINTS[path] = func
+        if indexed:
+            INDEXED_ENDPOINTS.add(path)
+        if titles:
+            TITLE_ENDPOINTS.add(path)
+        return func
+
+    return register
+
+
+def _count(params: dict, key: str, default: int) -> int:
+    """Read a row count, rejecting values a slice would misread (``-1`` means all but one)."""
+    n = int(params.get(key, default))
+    if n < 1:
+        raise ValueError(f"{key} must be at least 1, got {n}")
+    return n
+
+
+def _top_n(params: dict, default: int) -> int:
+    return _count(params, "top", default)
+
+
+@endpoint("/games-per-year")
+def _games_per_year(df, params, cfg):
+    return games_per_year(df)
+
+
+@endpoint("/platforms/total-sales")
+def _platform_total_sales(df, params, cfg):
+    ps = platform_total_sales(df)
+    return ps.head(_top_n(params, len(ps)))
+
+
+@endpoint("/regional/top")
+def _regional_top(df, params, cfg):
+    kind = params.get("kind", "platforms")
+    top_n = _top_n(params, 5)
+    if kind == "platforms":
+        return top_platforms_by_region(df, top_n)
+    if kind == "genres":
+        return top_genres_by_region(df, top_n)
+    raise ValueError(f"Unknown kind {kind!r}; expected 'platforms' or 'genres'")
+
+
+@endpoint("/regional/shares")
+def _regional_shares(df, params, cfg):
+    kind = params.get("kind", "platforms")
+    top_n = _top_n(params, 5)
+    if kind == "platforms":
+        return market_share_platforms(df, top_n)
+    if kind == "genres":
+        return market_share_genres(df, top_n)
+    raise ValueError(f"Unknown kind {kind!r}; expected 'platforms' or 'genres'")
+
+
+@endpoint("/regional/ratings")
+def _regional_ratings(df, params, cfg):
+    return rating_sales_by_region(df)
+
+
+@endpoint("/genres/summary")
+def _genre_summary(df, params, cfg):
+    return genre_sales_summary(df)
+
+
+@endpoint("/genres/tiers")
+def _genre_tiers(df, params, cfg):
+    return classify_genres(df)
+
+
+@endpoint("/hypothesis/ttest")
+def _ttest(df, params, cfg):
+    missing = [p for p in ("group_a", "group_b") if p not in params]
+    if missing:
+        raise ValueError(f"Missing query parameters: {', '.join(missing)}")
+    column = params.get("column", "user_score")
+    group_column = params.get("group_column", "platform")
+    if column not in df.columns or group_column not in df.columns:
+        raise ValueError(f"Unknown column in {column!r}, {group_column!r}")
+    return run_ttest(
+        df,
+        column,
+        group_column,
+        params["group_a"],
+        params["group_b"],
+        alpha=float(params.get("alpha", cfg["analysis"]["significance_level"])),
+        test=params.get("test", "welch"),
+        alternative=params.get("alternative", "two-sided"),
+    )
+
+
+@endpoint("/titles/top", indexed=True)
+def _top_titles(df, index, selections, ranges, params, cfg):
+    if not isinstance(index, TopKIndex):
+        raise ValueError("Top-K queries need a TopKIndex")
+    metric = params.get("metric", "total_sales")
+    return index.top(df, metric, _top_n(params, 10), selections, ranges)
+
+
+@endpoint("/titles/search", titles=True)
+def _search_titles(df, titles, mask, params):
+    if "q" not in params:
+        raise ValueError("Missing query parameter: q")
+    return titles.search(params["q"], _count(params, "limit", 10), mask)
+
+
+@endpoint("/titles/lookup", titles=True)
+def _lookup_title(df, titles, mask, params):
+    if "name" not in params:
+        raise ValueError("Missing query parameter: name")
+    return titles.lookup(df, params["name"], mask=mask)
+
+
+def _jsonable(obj):
+    """Plain JSON structure of an analysis result."""
+    if isinstance(obj, pd.Series):
+        obj = obj.rename(obj.name or "value").to_frame()
+    if isinstance(obj, pd.DataFrame):
+        if obj.index.name is not None or not isinstance(obj.index, pd.RangeIndex):
+            obj = obj.reset_index()
+        return json.loads(obj.to_json(orient="records"))
+    if isinstance(obj, HypothesisResult):
+        return {
+            f.name: _jsonable(getattr(obj, f.name))
+            for f in fields(obj)
+            if f.name not in ("sample_a", "sample_b")
+        }
+    if isinstance(obj, dict):
+        return {str(k): _jsonable(v) for k, v in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [_jsonable(v) for v in obj]
+    if isinstance(obj, np.generic):
+        return obj.item()
+    return obj
+
+
+def parse_query(query: str) -> tuple[tuple[str, str | tuple[str, ...]], ...]:
+    """Normalised, hashable query parameters.
+
+    Selection parameters become sorted tuples of values; any other parameter
+    keeps its last value.
+    """
+    params: dict[str, str | tuple[str, ...]] = {}
+    for key, values in parse_qs(query).items():
+        if key in SELECTION_PARAMS:
+            items = {v.strip() for value in values for v in value.split(",") if v.strip()}
+            params[key] = tuple(sorted(items))
+        else:
+            params[key] = values[-1]
+    return tuple(sorted(params.items()))
+
+
+def compute_response(
+    df: pd.DataFrame,
+    index: BitmapIndex,
+    cfg: dict,
+    path: str,
+    query: tuple,
+    titles: TitleIndex | None = None,
+) -> bytes:
+    """JSON body for *path*: filter *df* with *index*, run the handler, serialise."""
+    params = dict(query)
+    if path in TITLE_ENDPOINTS:
+        return _title_response(df, index, titles, path, params)
+    start = int(params.get("start_year", cfg["analysis"]["relevant_period"]["start_year"]))
+    end = int(params.get("end_year", df["year_of_release"].max()))
+    selections = {col: params.get(col, ()) for col in SELECTION_PARAMS}
+    ranges = {"year_of_release": (start, end)}
+
+    if path in INDEXED_ENDPOINTS:
+        result = ENDPOINTS[path](df, index, selections, ranges, params, cfg)
+        rows = index.count(selections, ranges)
+    else:
+        df_view = index.filter(df, selections, ranges)
+        result = ENDPOINTS[path](df_view, params, cfg)
+        rows = len(df_view)
+    payload = {
+        "endpoint": path,
+        "filters": {
+            "start_year": start,
+            "end_year": end,
+            **{col: list(v) for col, v in selections.items() if v},
+        },
+        "rows": rows,
+        "result": _jsonable(result),
+    }
+    return json.dumps(payload).encode()
+
+
+def _title_response(
+    df: pd.DataFrame, index: BitmapIndex, titles: TitleIndex | None, path: str, params: dict
+) -> bytes:
+    if titles is None:
+        raise ValueError("Title queries need a TitleIndex")
+    selections = {col: params[col] for col in SELECTION_PARAMS if params.get(col)}
+    filters: dict = {col: list(v) for col, v in selections.items()}
+    ranges = {}
+    if "start_year" in params or "end_year" in params:
+        filters["start_year"] = int(params.get("start_year", df["year_of_release"].min()))
+        filters["end_year"] = int(params.get("end_year", df["year_of_release"].max()))
+        ranges["year_of_release"] = (filters["start_year"], filters["end_year"])
+    mask = None
+    if filters:
+        bitmap = index.bitmap(selections, ranges)
+        mask = np.unpackbits(bitmap, count=index.n_rows).astype(bool)
+    result = ENDPOINTS[path](df, titles, mask, params)
+    payload = {
+        "endpoint": path,
+        "filters": filters,
+        "rows": len(result),
+        "result": _jsonable(result),
+    }
+    return json.dumps(payload).encode()
+
+
+class AnalyticsService:
+    """Request dispatcher holding the dataset, its index and the response cache."""
+
+    def __init__(
+        self,
+        df: pd.DataFrame,
+        cfg: dict | None = None,
+        max_workers: int | None = None,
+        cache_size: int = 512,
+    ):
+        self.cfg = cfg if cfg is not None else load_config()
+        self.df = df
+        self.index = TopKIndex(df)
+        self.titles = TitleIndex(df)
+        self.cache = AnalysisCache(maxsize=cache_size)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._inflight: dict[tuple, asyncio.Future] = {}
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _body(self, path: str, query: tuple) -> bytes:
+        key = (path, query)
+        future = self._inflight.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(
+                self._executor,
+                self.cache.call,
+                compute_response,
+                self.df,
+                self.index,
+                self.cfg,
+                path,
+                query,
+                self.titles,
+            )
+            self._inflight[key] = future
+            future.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # Shielded so a client disconnecting does not cancel other waiters.
+        return await asyncio.shield(future)
+
+    async def dispatch(self, method: str, target: str) -> tuple[HTTPStatus, bytes]:
+        """Status and JSON body for one request."""
+        if method != "GET":
+            return HTTPStatus.METHOD_NOT_ALLOWED, _error("Only GET is supported")
+        url = urlsplit(target)
+        if url.path == "/health":
+            return HTTPStatus.OK, json.dumps({"status": "ok", "rows": len(self.df)}).encode()
+        if url.path not in ENDPOINTS:
+            body = {"error": f"Unknown endpoint {url.path}", "endpoints": sorted(ENDPOINTS)}
+            return HTTPStatus.NOT_FOUND, json.dumps(body).encode()
+        try:
+            return HTTPStatus.OK, await self._body(url.path, parse_query(url.query))
+        except UnknownTitleError as exc:
+            return HTTPStatus.NOT_FOUND, _error(exc.args[0])
+        except (KeyError, ValueError) as exc:
+            return HTTPStatus.BAD_REQUEST, _error(str(exc))
+
+    async def handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Serve HTTP/1.1 requests on one connection until it is closed."""
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                headers = {}
+                while (line := await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                if length := int(headers.get("content-length") or 0):
+                    await reader.readexactly(length)
+
+                parts = request_line.decode("latin-1").split()
+                if len(parts) != 3:
+                    writer.write(_response(HTTPStatus.BAD_REQUEST, _error("Bad request"), False))
+                    break
+                method, target, version = parts
+                keep_alive = (
+                    version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+                )
+                status, body = await self.dispatch(method, target)
+                writer.write(_response(status, body, keep_alive))
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+def _error(message: str) -> bytes:
+    return json.dumps({"error": message}).encode()
+
+
+def _response(status: HTTPStatus, body: bytes, keep_alive: bool) -> bytes:
+    head = (
+        f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+        "Content-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n"
+        f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+    )
+    return head.encode("latin-1") + body
+
+
+async def serve(service: AnalyticsService, host: str = "127.0.0.1", port: int = 8765) -> None:
+    """Serve *service* on ``host:port`` until cancelled."""
+    server = await asyncio.start_server(service.handle_connection, host, port)
+    async with server:
+        await server.serve_forever()
+
+
+def run(
+    host: str = "127.0.0.1",
+    port: int = 8765,
+    cfg: dict | None = None,
+    max_workers: int | None = None,
+) -> None:
+    """Load processed data once and serve the API until interrupted."""
+    service = AnalyticsService(load_processed_data(), cfg, max_workers=max_workers)
+    try:
+        asyncio.run(serve(service, host, port))
+    finally:
+        service.close()
@@ -0,0 +1,113 @@
+"""Server-side distribution summaries for box plots and histograms.
+
+Figures built from these summaries carry a fixed number of points per group, so
+their size does not grow with the dataset.
+"""
+
+import numpy as np
+import pandas as pd
+
+
+def _interpolated_quantile(
+    sorted_values: np.ndarray, starts: np.ndarray, counts: np.ndarray, q: float
+) -> np.ndarray:
+    """Per-group quantile with linear interpolation (as ``Series.quantile``)."""
+    pos = starts + q * (counts - 1)
+    lo = np.floor(pos).astype(int)
+    hi = np.ceil(pos).astype(int)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (pos - lo)
+
+
+def box_summary(
+    df: pd.DataFrame,
+    group_col: str,
+    value_col: str,
+    groups: list[str] | None = None,
+    max_outliers: int = 50,
+) -> pd.DataFrame:
+    """Tukey box-plot statistics of *value_col* per *group_col* value.
+
+    All groups are summarised in one sort: quartiles, whisker ends (the most
+    extreme values within 1.5 IQR of the box), mean, count, and an evenly spaced
+    sample of about *max_outliers* outliers per group that always keeps both
+    extremes. Rows follow *groups* when given, otherwise sorted group order.
+    """
+    if groups is not None:
+        df = df[df[group_col].isin(groups)]
+    values = df[value_col].to_numpy(dtype=float)
+    codes, uniques = pd.factorize(df[group_col], sort=True)
+    keep = (codes >= 0) & ~np.isnan(values)
+    values, codes = values[keep], codes[keep]
+
+    order = np.lexsort((values, codes))
+    v, c = values[order], codes[order]
+    counts = np.bincount(c, minlength=len(uniques))
+    present = counts > 0
+    starts = np.cumsum(counts) - counts
+
+    n, s = counts[present], starts[present]
+    q1 = _interpolated_quantile(v, s, n, 0.25)
+    median = _interpolated_quantile(v, s, n, 0.5)
+    q3 = _interpolated_quantile(v, s, n, 0.75)
+    iqr = q3 - q1
+
+    fence_lo = np.full(len(uniques), np.nan)
+    fence_hi = np.full(len(uniques), np.nan)
+    fence_lo[present] = q1 - 1.5 * iqr
+    fence_hi[present] = q3 + 1.5 * iqr
+    inside = (v >= fence_lo[c]) & (v <= fence_hi[c])
+    whisker_lo = np.minimum.reduceat(np.where(inside, v, np.inf), s)
+    whisker_hi = np.maximum.reduceat(np.where(inside, v, -np.inf), s)
+    mean = np.bincount(c, weights=v, minlength=len(uniques))[present] / n
+
+    out_pos = np.flatnonzero(~inside)
+    out_codes = c[out_pos]
+    out_counts = np.bincount(out_codes, minlength=len(uniques))
+    out_rank = np.arange(len(out_pos)) - (np.cumsum(out_counts) - out_counts)[out_codes]
+    stride = np.maximum(1, np.ceil(out_counts / max(max_outliers, 1)).astype(int))
+    sampled = (out_rank % stride[out_codes] == 0) | (out_rank == out_counts[out_codes] - 1)
+    outliers: list[list[float]] = [[] for _ in uniques]
+    for code, value in zip(out_codes[sampled], v[out_pos][sampled]):
+        outliers[code].append(float(value))
+
+    summary = pd.DataFrame(
+        {
+            "count": n,
+            "mean": mean,
+            "q1": q1,
+            "median": median,
+            "q3": q3,
+            "lower_whisker": whisker_lo,
+            "upper_whisker": whisker_hi,
+            "n_outliers": out_counts[present],
+            "outliers": [outliers[i] for i in np.flatnonzero(present)],
+        },
+        index=pd.Index(uniques[present], name=group_col),
+    )
+    if groups is not None:
+        summary = summary.reindex([g for g in groups if g in summary.index])
+    return summary
+
+
+def histogram_counts(
+    samples: dict[str, np.ndarray], bins: int = 25
+) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    """Counts of every sample over one shared set of *bins* equal-width bins.
+
+    Returns ``(edges, counts_by_label)``; the counts come from a single
+    ``bincount`` over (sample, bin) pairs.
+    """
+    labels = list(samples)
+    arrays = [np.asarray(samples[label], dtype=float) for label in labels]
+    arrays = [a[~np.isnan(a)] for a in arrays]
+    combined = np.concatenate(arrays) if arrays else np.array([])
+    if combined.size == 0:
+        edges = np.linspace(0.0, 1.0, bins + 1)
+    else:
+        edges = np.histogram_bin_edges(combined, bins=bins)
+
+    sample_ids = np.repeat(np.arange(len(arrays)), [len(a) for a in arrays])
+    bin_ids = np.clip(np.searchsorted(edges, combined, side="right") - 1, 0, bins - 1)
+    flat = np.bincount(sample_ids * bins + bin_ids, minlength=len(arrays) * bins)
+    counts = flat.reshape(len(arrays), bins)
+    return edges, dict(zip(labels, counts))
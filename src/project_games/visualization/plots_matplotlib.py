@@ -1,36 +1,32 @@
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
-import seaborn as sns
+
+from project_games.data.profiling import PROFILE_GROUPS, null_profiles
 
 
 def plot_null_heatmaps(
     df: pd.DataFrame,
     attributes: list[str] | None = None,
     figsize: tuple[int, int] = (24, 14),
+    max_categories: int | None = 40,
+    annotate_max_rows: int = 40,
 ) -> plt.Figure:
-    """Heatmaps of null-percentage by genre, platform, and year."""
-    if attributes is None:
-        attributes = ["critic_score", "user_score", "rating"]
-
-    pivot_genre = df.groupby("genre")[attributes].apply(
-        lambda x: (x.isna().sum() / len(x)) * 100
-    ).sort_index()
-    pivot_platform = df.groupby("platform")[attributes].apply(
-        lambda x: (x.isna().sum() / len(x)) * 100
-    ).sort_index()
-    pivot_year = df.groupby("year_of_release")[attributes].apply(
-        lambda x: (x.isna().sum() / len(x)) * 100
-    ).sort_index()
+    """Heatmaps of null-percentage by genre, platform, and year.
+
+    Groupings with more than *max_categories* values are bucketed (see
+    :func:`~project_games.data.profiling.null_profiles`); cells are only
+    annotated on heatmaps with at most *annotate_max_rows* rows.
+    """
+    import seaborn as sns  # slow to import; only the heatmap builders need it
+
+    profiles = null_profiles(df, PROFILE_GROUPS, attributes, max_categories)
 
     fig, axes = plt.subplots(1, 3, figsize=figsize)
-    for ax, pivot, title in zip(
-        axes,
-        [pivot_genre, pivot_platform, pivot_year],
-        ["Genre", "Platform", "Year"],
-    ):
+    for ax, col, title in zip(axes, PROFILE_GROUPS, ["Genre", "Platform", "Year"]):
+        pivot = profiles[col]
         sns.heatmap(
-            pivot, annot=True, fmt=".1f", cmap="RdYlGn_r", ax=ax,
+            pivot, annot=len(pivot) <= annotate_max_rows, fmt=".1f", cmap="RdYlGn_r", ax=ax,
             cbar_kws={"label": "% Nulls"}, linewidths=0.5, vmin=0, vmax=100,
         )
         ax.set_title(f"Null % by {title}", fontweight="bold")
@@ -59,6 +55,8 @@ def plot_platform_evolution(
     figsize: tuple[int, int] = (16, 12),
 ) -> plt.Figure:
     """Line chart + heatmap of platform sales over time."""
+    import seaborn as sns
+
     if top_platforms is None:
         top_platforms = platform_year_sales.sum(axis=1).nlargest(10).index.tolist()
 
@@ -98,7 +96,8 @@ def plot_boxplot_by_group(
 
     fig, ax = plt.subplots(figsize=figsize)
     box_data = [df[df[group_col] == g][value_col].values for g in groups]
-    bp = ax.boxplot(box_data, labels=groups, patch_artist=True, showmeans=True, meanline=True)
+    bp = ax.boxplot(box_data, patch_artist=True, showmeans=True, meanline=True)
+    ax.set_xticks(range(1, len(groups) + 1), groups)
     for patch in bp["boxes"]:
         patch.set_facecolor("lightblue")
         patch.set_alpha(0.7)
@@ -155,7 +154,8 @@ def plot_hypothesis_result(
     axes[0].legend()
     axes[0].grid(True, alpha=0.3)
 
-    axes[1].boxplot([scores_a, scores_b], labels=[label_a, label_b])
+    axes[1].boxplot([scores_a, scores_b])
+    axes[1].set_xticks([1, 2], [label_a, label_b])
     axes[1].set_ylabel("Score")
     axes[1].set_title(f"Boxplot: {label_a} vs {label_b}")
     axes[1].grid(True, alpha=0.3)
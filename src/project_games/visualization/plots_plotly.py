@@ -1,8 +1,11 @@
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 
+from project_games.visualization.aggregates import box_summary, histogram_counts
+
 
 def fig_games_per_year(games_per_year: pd.Series) -> go.Figure:
     """Interactive area chart of games released per year."""
@@ -17,6 +20,29 @@ def fig_games_per_year(games_per_year: pd.Series) -> go.Figure:
     return fig
 
 
+GROWTH_LABELS = {
+    "sales": "Total Sales ($M)",
+    "yoy_pct": "Year-over-Year Change (%)",
+    "rolling_avg": "Rolling Average Sales ($M)",
+    "cagr_pct": "CAGR Since Launch (%)",
+}
+
+
+def fig_growth(panel: pd.DataFrame, metric: str = "yoy_pct") -> go.Figure:
+    """Line chart of one growth metric per group from a tidy growth panel."""
+    fig = px.line(
+        panel,
+        x="year",
+        y=metric,
+        color="group",
+        markers=True,
+        labels={"year": "Year", metric: GROWTH_LABELS.get(metric, metric), "group": ""},
+        title=GROWTH_LABELS.get(metric, metric),
+    )
+    fig.update_layout(hovermode="x unified")
+    return fig
+
+
 def fig_platform_sales(platform_sales: pd.Series, top_n: int = 15) -> go.Figure:
     """Horizontal bar chart of total sales by platform."""
     top = platform_sales.head(top_n)
@@ -89,20 +115,54 @@ def fig_genre_sales(genre_stats: pd.DataFrame) -> go.Figure:
     return fig
 
 
+def _summary_box_traces(
+    summary: pd.DataFrame, color: str | None = None
+) -> list:
+    """Precomputed box trace plus an outlier-sample scatter from :func:`box_summary`."""
+    labels = summary.index.astype(str).tolist()
+    box = go.Box(
+        x=labels,
+        q1=summary["q1"],
+        median=summary["median"],
+        q3=summary["q3"],
+        lowerfence=summary["lower_whisker"],
+        upperfence=summary["upper_whisker"],
+        mean=summary["mean"],
+        boxpoints=False,
+        marker_color=color,
+        showlegend=False,
+    )
+    out_x = [label for label, points in zip(labels, summary["outliers"]) for _ in points]
+    out_y = [y for points in summary["outliers"] for y in points]
+    points = go.Scatter(
+        x=out_x, y=out_y, mode="markers", marker=dict(size=4, color=color),
+        name="outliers (sample)", showlegend=False,
+    )
+    return [box, points]
+
+
 def fig_boxplot_by_group(
     df: pd.DataFrame,
     group_col: str,
     value_col: str = "total_sales",
     groups: list[str] | None = None,
+    aggregate: bool = False,
 ) -> go.Figure:
-    """Interactive box plot of value_col by group_col."""
+    """Interactive box plot of value_col by group_col.
+
+    With *aggregate*, box statistics and an outlier sample are computed
+    server-side and only those are sent to the browser.
+    """
+    title = f"Distribution of {value_col.replace('_', ' ').title()} by {group_col.title()}"
+    if aggregate:
+        fig = go.Figure(_summary_box_traces(box_summary(df, group_col, value_col, groups)))
+        fig.update_layout(title=title, xaxis_title=group_col, yaxis_title=value_col)
+        return fig
+
     subset = df.copy()
     if groups is not None:
         subset = subset[subset[group_col].isin(groups)]
-    fig = px.box(
-        subset, x=group_col, y=value_col,
-        title=f"Distribution of {value_col.replace('_', ' ').title()} by {group_col.title()}",
-    )
+    fig = px.box(subset, x=group_col, y=value_col, title=title)
     return fig
 
 
@@ -145,12 +205,38 @@ def fig_hypothesis_comparison(
     scores_b: pd.Series,
     label_a: str,
     label_b: str,
+    aggregate: bool = False,
 ) -> go.Figure:
-    """Overlaid histograms + box plots for hypothesis test visualization."""
+    """Overlaid histograms + box plots for hypothesis test visualization.
+
+    With *aggregate*, histogram counts and box statistics are computed server-side
+    and sent as bar and precomputed box traces.
+    """
     fig = make_subplots(
         rows=1, cols=2,
         subplot_titles=(f"Distribution: {label_a} vs {label_b}", "Box Plot"),
     )
+    if aggregate:
+        edges, counts = histogram_counts({label_a: scores_a, label_b: scores_b}, bins=25)
+        centers = (edges[:-1] + edges[1:]) / 2
+        colors = dict(zip([label_a, label_b], px.colors.qualitative.Plotly))
+        for label, bin_counts in counts.items():
+            fig.add_trace(
+                go.Bar(x=centers, y=bin_counts, width=np.diff(edges), name=label,
+                       opacity=0.7, marker_color=colors[label]),
+                row=1, col=1,
+            )
+        stacked = pd.DataFrame({
+            "group": np.repeat([label_a, label_b], [len(scores_a), len(scores_b)]),
+            "score": np.concatenate([np.asarray(scores_a), np.asarray(scores_b)]),
+        })
+        summary = box_summary(stacked, "group", "score", groups=[label_a, label_b])
+        for label in summary.index:
+            for trace in _summary_box_traces(summary.loc[[label]], colors[label]):
+                fig.add_trace(trace, row=1, col=2)
+        fig.update_layout(barmode="overlay", bargap=0, title_text="Hypothesis Test Visualization")
+        return fig
+
     fig.add_trace(
         go.Histogram(x=scores_a, name=label_a, opacity=0.7, nbinsx=25),
         row=1, col=1,
@@ -0,0 +1,187 @@
+"""Batch rendering of the static report figures.
+
+The inputs of every figure are computed once in the parent process and hashed.
+Figures whose input hash matches the manifest from the previous run are skipped;
+the rest are rendered with the Agg backend on a process pool and written to the
+figures directory as PNG and/or SVG.
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from project_games.analysis.hypothesis import run_configured_tests
+from project_games.analysis.platform import platform_total_sales, platform_yearly_sales
+from project_games.analysis.regional import top_genres_by_region, top_platforms_by_region
+from project_games.analysis.temporal import filter_relevant_period, games_per_year
+from project_games.config import get_project_root, load_config
+from project_games.workers import process_pool
+
+MANIFEST = "manifest.json"
+
+
+@dataclass
+class FigureSpec:
+    """One report figure: a ``plots_matplotlib`` builder and its inputs."""
+
+    name: str
+    builder: str
+    args: tuple = ()
+    kwargs: dict = field(default_factory=dict)
+
+    def input_hash(self) -> str:
+        h = hashlib.sha256(self.builder.encode())
+        for value in (*self.args, *sorted(self.kwargs.items())):
+            _update_hash(h, value)
+        return h.hexdigest()[:16]
+
+
+def _update_hash(h, value) -> None:
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        columns = value.columns.tolist() if isinstance(value, pd.DataFrame) else [value.name]
+        h.update(repr((value.index.tolist(), columns)).encode())
+        h.update(pd.util.hash_pandas_object(value, index=False).to_numpy().tobytes())
+    elif isinstance(value, np.ndarray):
+        h.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (tuple, list)):
+        for item in value:
+            _update_hash(h, item)
+    elif isinstance(value, dict):
+        for key in sorted(value):
+            h.update(repr(key).encode())
+            _update_hash(h, value[key])
+    else:
+        h.update(repr(value).encode())
+
+
+def report_figures(
+    df: pd.DataFrame, cfg: dict | None = None, raw_df: pd.DataFrame | None = None
+) -> list[FigureSpec]:
+    """Specs for every report figure of the processed dataset.
+
+    The null heatmaps need pre-imputation data and are only included when the
+    cleaned raw frame is passed as *raw_df*.
+    """
+    if cfg is None:
+        cfg = load_config()
+
+    df_rel = filter_relevant_period(df, cfg)
+    top_platforms = platform_total_sales(df_rel).head(10).index.tolist()
+    top_genres = df_rel["genre"].value_counts().head(10).index.tolist()
+
+    specs = []
+    if raw_df is not None:
+        specs.append(FigureSpec("null_heatmaps", "plot_null_heatmaps", (raw_df,)))
+    specs += [
+        FigureSpec("games_per_year", "plot_games_per_year", (games_per_year(df),)),
+        FigureSpec(
+            "platform_evolution", "plot_platform_evolution", (platform_yearly_sales(df),)
+        ),
+        FigureSpec(
+            "platform_sales_boxplot",
+            "plot_boxplot_by_group",
+            (df_rel[["platform", "total_sales"]], "platform"),
+            {"groups": top_platforms},
+        ),
+        FigureSpec(
+            "genre_sales_boxplot",
+            "plot_boxplot_by_group",
+            (df_rel[["genre", "total_sales"]], "genre"),
+            {"groups": top_genres},
+        ),
+        FigureSpec(
+            "top_platforms_by_region",
+            "plot_regional_bars",
+            (top_platforms_by_region(df_rel),),
+            {"title": "Top Platforms"},
+        ),
+        FigureSpec(
+            "top_genres_by_region",
+            "plot_regional_bars",
+            (top_genres_by_region(df_rel),),
+            {"title": "Top Genres"},
+        ),
+    ]
+    for r in run_configured_tests(df_rel, cfg, skip_insufficient=True):
+        specs.append(
+            FigureSpec(
+                f"hypothesis_{r.name}",
+                "plot_hypothesis_result",
+                (r.sample_a, r.sample_b, r.group_a_label, r.group_b_label),
+            )
+        )
+    return specs
+
+
+def _render(spec: FigureSpec, out_dir: Path, formats: tuple[str, ...]) -> list[str]:
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    from project_games.visualization import plots_matplotlib
+
+    fig = getattr(plots_matplotlib, spec.builder)(*spec.args, **spec.kwargs)
+    files = []
+    for fmt in formats:
+        path = out_dir / f"{spec.name}.{fmt}"
+        fig.savefig(path, format=fmt, dpi=100, bbox_inches="tight")
+        files.append(path.name)
+    plt.close(fig)
+    return files
+
+
+def render_report(
+    specs: list[FigureSpec],
+    out_dir: str | Path,
+    formats: tuple[str, ...] = ("png",),
+    n_workers: int | None = None,
+    force: bool = False,
+) -> dict[str, str]:
+    """Render *specs* into *out_dir*, skipping figures whose inputs are unchanged.
+
+    Returns a mapping of figure name to ``"rendered"`` or ``"skipped"``.
+    """
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    manifest_path = out_dir / MANIFEST
+    manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+
+    status: dict[str, str] = {}
+    pending: list[tuple[FigureSpec, str]] = []
+    for spec in specs:
+        digest = spec.input_hash()
+        entry = manifest.get(spec.name, {})
+        up_to_date = (
+            not force
+            and entry.get("hash") == digest
+            and all((out_dir / f"{spec.name}.{fmt}").exists() for fmt in formats)
+        )
+        if up_to_date:
+            status[spec.name] = "skipped"
+        else:
+            pending.append((spec, digest))
+
+    if pending:
+        with process_pool(min(n_workers or len(pending), len(pending))) as pool:
+            futures = [
+                (spec, digest, pool.submit(_render, spec, out_dir, formats))
+                for spec, digest in pending
+            ]
+            for spec, digest, future in futures:
+                manifest[spec.name] = {"hash": digest, "files": future.result()}
+                status[spec.name] = "rendered"
+
+    manifest_path.write_text(json.dumps(manifest, indent=2, sort_keys=True))
+    return status
+
+
+def default_figures_dir(cfg: dict | None = None) -> Path:
+    """Figures directory under ``data.reports_dir`` from config."""
+    if cfg is None:
+        cfg = load_config()
+    return get_project_root() / cfg["data"]["reports_dir"] / "figures"
@@ -0,0 +1,32 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+
+def default_workers() -> int:
+    """Number of worker processes to use when none is requested."""
+    return os.cpu_count() or 1
+
+
+def process_pool(
+    max_workers: int | None = None, initializer=None, initargs: tuple = ()
+) -> ProcessPoolExecutor:
+    """Process pool that is safe to start from threaded hosts such as Streamlit.
+
+    Workers are forked from a clean server process where the platform supports it,
+    so the parent's threads and locks are never copied into them. *initializer*
+    runs once in each worker with *initargs*, e.g. to receive shared data once
+    instead of with every task.
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        # Import the heavy scientific stack once in the server instead of per worker.
+        context.set_forkserver_preload(["numpy", "pandas"])
+    else:
+        context = multiprocessing.get_context("spawn")
+    return ProcessPoolExecutor(
+        max_workers=max_workers or default_workers(),
+        mp_context=context,
+        initializer=initializer,
+        initargs=initargs,
+    )
@@ -0,0 +1,41 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+
+@pytest.fixture
+def games_df():
+    rng = np.random.default_rng(1)
+    n = 300
+    df = pd.DataFrame(
+        {
+            "name": [f"Game {i}" for i in range(n)],
+            "platform": rng.choice(["PS4", "XOne", "PC"], n),
+            "genre": rng.choice(["Action", "Sports", "Shooter", "Puzzle"], n),
+            "rating": rng.choice(["E", "M", "T"], n),
+            "year_of_release": rng.integers(2010, 2017, n),
+            "na_sales": rng.gamma(1.0, 0.5, n),
+            "eu_sales": rng.gamma(1.0, 0.4, n),
+            "jp_sales": rng.gamma(1.0, 0.1, n),
+            "other_sales": rng.gamma(1.0, 0.05, n),
+            "user_score": rng.uniform(3, 9, n),
+        }
+    )
+    df["total_sales"] = df[["na_sales", "eu_sales", "jp_sales", "other_sales"]].sum(axis=1)
+    return df
+
+
+@pytest.fixture
+def cfg():
+    return {
+        "analysis": {"relevant_period": {"start_year": 2013}, "significance_level": 0.05},
+        "hypothesis_tests": [
+            {
+                "name": "xone_vs_pc",
+                "column": "user_score",
+                "group_column": "platform",
+                "group_a": "XOne",
+                "group_b": "PC",
+            }
+        ],
+    }
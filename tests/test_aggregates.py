@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+
+from project_games.visualization.aggregates import box_summary, histogram_counts
+
+
+def test_box_summary_matches_pandas(games_df):
+    summary = box_summary(games_df, "genre", "total_sales")
+    grouped = games_df.groupby("genre")["total_sales"]
+    quartiles = grouped.quantile([0.25, 0.5, 0.75]).unstack()
+
+    np.testing.assert_allclose(summary["q1"], quartiles[0.25])
+    np.testing.assert_allclose(summary["median"], quartiles[0.5])
+    np.testing.assert_allclose(summary["q3"], quartiles[0.75])
+    np.testing.assert_allclose(summary["mean"], grouped.mean())
+    assert (summary["count"] == grouped.count()).all()
+
+
+def test_box_summary_whiskers_and_outliers():
+    df = pd.DataFrame({"g": ["a"] * 11, "v": list(range(10)) + [100.0]})
+    summary = box_summary(df, "g", "v")
+    assert summary.loc["a", "upper_whisker"] == 9
+    assert summary.loc["a", "lower_whisker"] == 0
+    assert summary.loc["a", "outliers"] == [100.0]
+
+
+def test_box_summary_caps_outlier_sample():
+    df = pd.DataFrame({"g": ["a"] * 1000, "v": np.r_[np.zeros(900), np.arange(100) + 10.0]})
+    summary = box_summary(df, "g", "v", max_outliers=20)
+    outliers = summary.loc["a", "outliers"]
+    assert len(outliers) <= 21
+    assert outliers[0] == 10.0 and outliers[-1] == 109.0
+    assert summary.loc["a", "n_outliers"] == 100
+
+
+def test_box_summary_respects_group_order(games_df):
+    summary = box_summary(games_df, "platform", "total_sales", groups=["PC", "PS4", "Wii"])
+    assert summary.index.tolist() == ["PC", "PS4"]
+
+
+def test_histogram_counts_match_numpy():
+    rng = np.random.default_rng(3)
+    a, b = rng.normal(size=400), rng.normal(1, 2, size=300)
+    edges, counts = histogram_counts({"a": a, "b": b}, bins=15)
+    np.testing.assert_array_equal(counts["a"], np.histogram(a, bins=edges)[0])
+    np.testing.assert_array_equal(counts["b"], np.histogram(b, bins=edges)[0])
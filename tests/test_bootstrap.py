@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from project_games.analysis.bootstrap import (
+    bootstrap_intervals,
+    group_design,
+    replicate_sums,
+)
+from project_games.analysis.genre import genre_sales_summary
+from project_games.analysis.regional import market_share_genres, market_share_platforms
+
+
+@pytest.fixture
+def boot_cfg(cfg):
+    cfg["bootstrap"] = {"n_boot": 400, "ci": 0.9, "seed": 3, "chunk_size": 150}
+    return cfg
+
+
+def test_design_sums_by_group():
+    codes = np.array([0, 2, -1, 0, 1])
+    values = np.array([[1.0, 10.0], [2.0, 20.0], [5.0, 50.0], [3.0, np.nan], [4.0, 40.0]])
+    design = group_design(codes, 3, values)
+    assert design.shape == (5, 6)
+    np.testing.assert_array_equal(design.sum(axis=0).A1, [4, 4, 2, 10, 40, 20])
+
+
+def test_replicates_are_unbiased_and_seeded():
+    design = group_design(np.arange(200) % 4, 4, np.ones(200))
+    replicates = replicate_sums(design, n_boot=2000, chunk_size=300, seed=1)
+    assert replicates.shape == (2000, 4)
+    # Poisson(1) weights: each group sum has mean 50 and variance 50.
+    np.testing.assert_allclose(replicates.mean(axis=0), 50, rtol=0.02)
+    np.testing.assert_allclose(replicates.var(axis=0), 50, rtol=0.15)
+    np.testing.assert_array_equal(replicates, replicate_sums(design, 2000, 300, seed=1))
+
+
+def test_point_estimates_match_the_analysis(games_df, boot_cfg):
+    out = bootstrap_intervals(games_df, cfg=boot_cfg)
+    assert set(out) == {"platform_shares", "genre_shares", "genre_averages"}
+
+    for key, reference in [
+        ("platform_shares", market_share_platforms(games_df, top_n=10)),
+        ("genre_shares", market_share_genres(games_df, top_n=10)),
+    ]:
+        table = out[key]
+        by = table.columns[0]
+        wide = table.pivot(index=by, columns="region", values="share")
+        pd.testing.assert_frame_equal(
+            wide.loc[reference.index, reference.columns],
+            reference,
+            check_names=False,
+        )
+        assert (table["low"] <= table["share"]).all() and (table["share"] <= table["high"]).all()
+        assert table.groupby("region")["share"].sum().round(6).eq(100).all()
+
+    averages = out["genre_averages"]
+    summary = genre_sales_summary(games_df)
+    pd.testing.assert_series_equal(
+        averages["avg_per_game"], summary["avg_per_game"], check_names=False
+    )
+    assert (averages["low"] < averages["avg_per_game"]).all()
+    assert (averages["avg_per_game"] < averages["high"]).all()
+    assert averages[["p_high_sales", "p_low_sales"]].apply(lambda s: s.between(0, 1)).all().all()
+
+
+def test_tier_probabilities_follow_clear_gaps(games_df, boot_cfg):
+    df = games_df.copy()
+    df.loc[df["genre"] == "Shooter", "total_sales"] += 10
+    df.loc[df["genre"] == "Puzzle", "total_sales"] *= 0.01
+    averages = bootstrap_intervals(df, cfg=boot_cfg)["genre_averages"]
+    assert averages.loc["Shooter", "p_high_sales"] == 1.0
+    assert averages.loc["Puzzle", "p_low_sales"] == 1.0
+    assert averages.index[0] == "Shooter"
+
+    narrow = bootstrap_intervals(df, ci=0.5, cfg=boot_cfg)["genre_averages"]
+    assert ((narrow["high"] - narrow["low"]) < (averages["high"] - averages["low"])).all()
+
+
+def test_empty_frame_gives_empty_tables(games_df, boot_cfg):
+    full = bootstrap_intervals(games_df, cfg=boot_cfg)
+    empty = bootstrap_intervals(games_df.iloc[:0], cfg=boot_cfg)
+    for name, table in empty.items():
+        assert table.empty
+        assert list(table.columns) == list(full[name].columns)
@@ -97,3 +97,32 @@ def test_clean_dataset_end_to_end(raw_df):
     assert result["name"].isna().sum() == 0
     assert result["genre"].isna().sum() == 0
     assert all(c == c.lower() for c in result.columns)
+
+
+def test_fuzzy_year_recovery_and_dedup():
+    df = pd.DataFrame(
+        {
+            "name": [
+                "Brave Story: New Traveler (US sales)",
+                "Brave Story: New Traveller (jp sales)",
+                "Halo 3",
+                "Halo 3: ODST",
+                "Halo 2",
+            ],
+            "platform": ["PSP", "PSP", "X360", "X360", "XB"],
+            "genre": ["Role-Playing"] * 2 + ["Shooter"] * 3,
+            "year_of_release": pd.array([2006, pd.NA, 2007, 2009, pd.NA], dtype="Int64"),
+            "total_sales": [0.5, 0.2, 12.0, 6.0, 8.0],
+        }
+    )
+    exact = fill_year_of_release(df)
+    assert exact["year_of_release"].isna().sum() == 2
+
+    fuzzy = fill_year_of_release(df, fuzzy=True)
+    assert fuzzy.loc[1, "year_of_release"] == 2006
+    # Different sequel numbers never match.
+    assert pd.isna(fuzzy.loc[4, "year_of_release"])
+
+    deduped = drop_duplicates(fuzzy.dropna(subset=["year_of_release"]), fuzzy=True)
+    assert len(deduped) == 3
+    assert "_name_key" not in deduped.columns
@@ -0,0 +1,152 @@
+import json
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal, assert_series_equal
+
+from project_games.analysis.results import run_analysis
+from project_games.data import columnar
+from project_games.data.columnar import META_FILE, open_columnar, text_dtype, write_columnar
+from project_games.data.loader import load_processed_data
+
+
+@pytest.fixture
+def frame(games_df):
+    df = games_df.copy()
+    df.loc[[3, 7], "name"] = np.nan
+    df.loc[5, "name"] = "Pokémon Ruby/Sapphire"
+    df.loc[[1, 2], "rating"] = np.nan
+    df["user_score"] = df["user_score"].where(df.index % 4 > 0)
+    df["is_new"] = df["year_of_release"] >= 2015
+    return df
+
+
+def _assert_same_values(a: pd.DataFrame, b: pd.DataFrame) -> None:
+    assert list(a.columns) == list(b.columns)
+    for col in a.columns:
+        left = a[col].astype(object).where(a[col].notna(), None).tolist()
+        right = b[col].astype(object).where(b[col].notna(), None).tolist()
+        assert left == right, col
+
+
+def test_round_trip(frame, tmp_path):
+    opened = open_columnar(write_columnar(frame, tmp_path / "games.cols"))
+    _assert_same_values(frame, opened)
+    assert (opened.dtypes == frame.dtypes).all()
+
+
+def test_categorical_keeps_dictionary_codes(frame, tmp_path):
+    opened = open_columnar(write_columnar(frame, tmp_path / "games.cols"), categorical=True)
+    _assert_same_values(frame, opened)
+    assert isinstance(opened["platform"].dtype, pd.CategoricalDtype)
+    assert opened["name"].dtype == frame["name"].dtype
+
+
+def _is_mapped(array: np.ndarray) -> bool:
+    while isinstance(array, np.ndarray):
+        if isinstance(array, np.memmap):
+            return True
+        array = array.base
+    return False
+
+
+def test_numeric_columns_are_memory_mapped(frame, tmp_path):
+    opened = open_columnar(write_columnar(frame, tmp_path / "games.cols"))
+    for col in ["na_sales", "year_of_release"]:
+        assert _is_mapped(opened[col].to_numpy())
+    categorical = open_columnar(tmp_path / "games.cols", categorical=True)
+    assert _is_mapped(categorical["genre"].array.codes)
+    # Writes stay in the process; the file keeps the original values.
+    opened.loc[0, "na_sales"] = -1.0
+    assert open_columnar(tmp_path / "games.cols").loc[0, "na_sales"] == frame.loc[0, "na_sales"]
+
+
+def test_text_columns_are_memory_mapped(frame, tmp_path, monkeypatch):
+    pa = pytest.importorskip("pyarrow")
+    if text_dtype() == object:
+        pytest.skip("text is decoded into Python objects without an Arrow-backed str dtype")
+    path = write_columnar(frame, tmp_path / "games.cols")
+    addresses = []
+    original = columnar._map
+
+    def tracking(*args):
+        array = original(*args)
+        addresses.append(array.ctypes.data)
+        return array
+
+    monkeypatch.setattr(columnar, "_map", tracking)
+    opened = open_columnar(path)
+    for col in ["name", "genre", "rating"]:
+        assert opened[col].dtype == frame[col].dtype
+        assert pa.array(opened[col].array).buffers()[2].address in addresses
+
+
+def test_dictionary_columns_without_strings_are_decoded(frame, tmp_path):
+    # Datasets written before dictionary columns stored their strings.
+    path = write_columnar(frame, tmp_path / "games.cols")
+    meta = json.loads((path / META_FILE).read_text())
+    for column in meta["columns"]:
+        if column["kind"] == "dictionary":
+            for key in ("offsets", "data", "validity"):
+                column.pop(key)
+    (path / META_FILE).write_text(json.dumps(meta))
+    opened = open_columnar(path)
+    _assert_same_values(frame, opened)
+    assert (opened.dtypes == frame.dtypes).all()
+
+
+def test_open_selected_columns(frame, tmp_path):
+    path = write_columnar(frame, tmp_path / "games.cols")
+    opened = open_columnar(path, columns=["genre", "total_sales"])
+    _assert_same_values(frame[["genre", "total_sales"]], opened)
+    with pytest.raises(KeyError, match="not_a_column"):
+        open_columnar(path, columns=["not_a_column"])
+
+
+def test_strings_decode_without_pyarrow(frame, tmp_path, monkeypatch):
+    path = write_columnar(frame, tmp_path / "games.cols")
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    _assert_same_values(frame[["name"]], open_columnar(path, columns=["name"]))
+
+
+def test_empty_frame(frame, tmp_path):
+    opened = open_columnar(write_columnar(frame.iloc[:0], tmp_path / "empty.cols"))
+    assert len(opened) == 0
+    assert list(opened.columns) == list(frame.columns)
+
+
+def test_load_processed_data_opens_directories(frame, tmp_path):
+    path = write_columnar(frame, tmp_path / "games.cols")
+    _assert_same_values(frame, load_processed_data(path))
+
+
+def test_rewrite_keeps_mapped_files_intact(frame, tmp_path):
+    path = write_columnar(frame, tmp_path / "games.cols")
+    opened = open_columnar(path)
+    write_columnar(frame.iloc[:10].assign(na_sales=-1.0), path)
+    assert opened["na_sales"].tolist() == frame["na_sales"].tolist()
+    reopened = open_columnar(path)
+    assert len(reopened) == 10
+    assert (reopened["na_sales"] == -1.0).all()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["games.cols"]
+
+
+def test_columnar_and_csv_results_match(games_df, cfg, tmp_path):
+    csv_path = tmp_path / "games.csv"
+    games_df.to_csv(csv_path, index=False)
+    from_csv = load_processed_data(csv_path)
+    from_cols = load_processed_data(write_columnar(from_csv, tmp_path / "games.cols"))
+    assert (from_cols.dtypes == from_csv.dtypes).all()
+    _assert_same_values(from_csv, from_cols)
+
+    expected, result = run_analysis(from_csv, cfg), run_analysis(from_cols, cfg)
+    for name, value in expected.items():
+        if isinstance(value, pd.Series):
+            assert_series_equal(result[name], value)
+        elif isinstance(value, pd.DataFrame):
+            assert_frame_equal(result[name], value)
+        elif name.startswith("top_"):
+            for region, series in value.items():
+                assert_series_equal(result[name][region], series)
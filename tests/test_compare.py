@@ -0,0 +1,36 @@
+from project_games.analysis.compare import analyze_snapshot, diff_snapshots, snapshot_labels
+from project_games.analysis.results import pack_sections, run_analysis
+
+
+def test_analyze_snapshot_uses_cache_for_unchanged_file(games_df, cfg, tmp_path):
+    path = tmp_path / "snapshot.csv"
+    games_df.to_csv(path, index=False)
+    store_path = tmp_path / "results.sqlite"
+
+    first, cached_first = analyze_snapshot(path, cfg, store_path)
+    second, cached_second = analyze_snapshot(path, cfg, store_path)
+    assert not cached_first
+    assert cached_second
+    assert list(second["platform_total_sales"]["platform"]) == list(
+        first["platform_total_sales"]["platform"]
+    )
+
+
+def test_diff_snapshots_side_by_side(games_df, cfg):
+    older = games_df[games_df["platform"] != "PS4"]
+    tables = {
+        "jan": pack_sections(run_analysis(games_df, cfg)),
+        "feb": pack_sections(run_analysis(older, cfg)),
+    }
+    diff = diff_snapshots(tables, cfg)
+
+    top = diff["top_platforms"]
+    assert list(top.columns) == ["jan", "feb", "delta"]
+    assert top.loc["PS4", "feb"] == 0
+    assert top.loc["PS4", "delta"] == -top.loc["PS4", "jan"]
+    assert set(diff["genre_tiers"].columns) == {"jan", "feb", "changed"}
+
+
+def test_snapshot_labels_fall_back_to_paths_on_clash():
+    assert snapshot_labels(["a/2024.csv", "b/2025.csv"]) == ["2024", "2025"]
+    assert snapshot_labels(["a/s.csv", "b/s.csv"]) == ["a/s.csv", "b/s.csv"]
@@ -0,0 +1,89 @@
+from itertools import product
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from project_games.analysis.cooccurrence import (
+    cooccurrence,
+    cosine_similarity,
+    genre_similarity_by_region,
+    incidence_matrix,
+    jaccard_similarity,
+    sales_overlap,
+    top_pairs,
+)
+
+
+@pytest.fixture
+def releases():
+    return pd.DataFrame(
+        {
+            "name": ["A", "A", "A", "B", "B", "C", "D", "D", None],
+            "platform": ["PS4", "XOne", "PC", "PS4", "XOne", "PC", "PS4", "PS4", "PS4"],
+            "total_sales": [4.0, 2.0, 1.0, 3.0, 0.0, 5.0, 1.0, 1.5, 9.0],
+        }
+    )
+
+
+def _titles(df, platform):
+    return set(df.loc[df["platform"] == platform, "name"].dropna())
+
+
+def test_incidence_codes_and_duplicates(releases):
+    counts = incidence_matrix(releases)
+    assert counts.rows.tolist() == ["A", "B", "C", "D"]
+    assert counts.columns.tolist() == ["PC", "PS4", "XOne"]
+    assert counts.matrix.nnz == 7
+    assert counts.matrix.max() == 1
+
+    sales = incidence_matrix(releases, weight="total_sales")
+    # Repeated pairs sum; a zero-sales release is still present.
+    assert sales.matrix[3, 1] == 2.5
+    assert sales.matrix.nnz == 7
+    np.testing.assert_array_equal(sales.binary().matrix.toarray(), counts.matrix.toarray())
+
+
+def test_measures_match_set_arithmetic(releases):
+    incidence = incidence_matrix(releases)
+    shared, jaccard = cooccurrence(incidence), jaccard_similarity(incidence)
+    cosine = cosine_similarity(incidence)
+    for a, b in product(incidence.columns, repeat=2):
+        ta, tb = _titles(releases, a), _titles(releases, b)
+        assert shared.loc[a, b] == len(ta & tb)
+        assert jaccard.loc[a, b] == pytest.approx(len(ta & tb) / len(ta | tb))
+        assert cosine.loc[a, b] == pytest.approx(len(ta & tb) / np.sqrt(len(ta) * len(tb)))
+
+
+def test_sales_overlap_is_directional(releases):
+    overlap = sales_overlap(incidence_matrix(releases, weight="total_sales"))
+    # PS4 sells 4 + 3 + 2.5; titles A and B (7.0) are also on XOne, only A (4.0) on PC.
+    assert overlap.loc["PS4", "XOne"] == pytest.approx(7.0 / 9.5)
+    assert overlap.loc["PS4", "PC"] == pytest.approx(4.0 / 9.5)
+    assert overlap.loc["XOne", "PS4"] == pytest.approx(1.0)
+    assert overlap.loc["PC", "PS4"] == pytest.approx(1.0 / 6.0)
+    assert np.diag(overlap).tolist() == [1.0, 1.0, 1.0]
+
+
+def test_top_pairs(releases):
+    pairs = top_pairs(cooccurrence(incidence_matrix(releases)), 2)
+    assert pairs[["a", "b"]].values.tolist() == [["PS4", "XOne"], ["PC", "PS4"]]
+    assert pairs["value"].tolist() == [2, 1]
+    directed = top_pairs(sales_overlap(incidence_matrix(releases, weight="total_sales")), 6, False)
+    assert len(directed) == 6
+    assert not (directed["a"] == directed["b"]).any()
+
+
+def test_genre_similarity_by_region(games_df):
+    similarity = genre_similarity_by_region(games_df)
+    assert list(similarity) == ["NA", "EU", "JP"]
+    eu = similarity["EU"]
+    assert np.allclose(np.diag(eu), 1.0)
+    assert np.allclose(eu, eu.T)
+    by_platform = games_df.pivot_table("eu_sales", "platform", "genre", aggfunc="sum")
+    expected = (
+        by_platform["Action"]
+        @ by_platform["Sports"]
+        / (np.linalg.norm(by_platform["Action"]) * np.linalg.norm(by_platform["Sports"]))
+    )
+    assert eu.loc["Action", "Sports"] == pytest.approx(expected)
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from project_games.analysis.filters import BitmapIndex
+
+
+def _expected(df, selections, year_range=None):
+    mask = pd.Series(True, index=df.index)
+    for col, values in selections.items():
+        if values:
+            mask &= df[col].isin(values)
+    if year_range is not None:
+        mask &= df["year_of_release"].between(*year_range)
+    return df[mask].reset_index(drop=True)
+
+
+def test_selection_matches_boolean_masks(games_df):
+    index = BitmapIndex(games_df)
+    selections = {"platform": ["PS4", "PC"], "genre": ["Action"], "rating": []}
+    result = index.filter(games_df, selections, {"year_of_release": (2012, 2015)})
+    pd.testing.assert_frame_equal(result, _expected(games_df, selections, (2012, 2015)))
+
+
+@pytest.mark.parametrize("year_range", [(2010, 2016), (2013, 2013), (2000, 2011), (2016, 2030)])
+def test_year_ranges(games_df, year_range):
+    index = BitmapIndex(games_df)
+    expected = _expected(games_df, {}, year_range)
+    assert index.count(ranges={"year_of_release": year_range}) == len(expected)
+
+
+def test_empty_and_unknown_selections(games_df):
+    index = BitmapIndex(games_df)
+    assert index.count() == len(games_df)
+    assert index.count({"platform": ["Dreamcast"]}) == 0
+    assert index.count(ranges={"year_of_release": (1990, 1995)}) == 0
+
+
+def test_missing_values_are_never_selected(games_df):
+    games_df.loc[:4, "rating"] = np.nan
+    index = BitmapIndex(games_df)
+    assert index.count({"rating": index.values("rating")}) == len(games_df) - 5
+
+
+def test_filter_rejects_other_frames(games_df):
+    index = BitmapIndex(games_df)
+    with pytest.raises(ValueError):
+        index.filter(games_df.head(10), {"platform": ["PS4"]})
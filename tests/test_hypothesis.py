@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+from scipy import stats
+
+from project_games.analysis.hypothesis import group_samples, run_configured_tests, run_ttest
+
+
+def test_group_samples_match_boolean_masks(games_df):
+    games_df.loc[:9, "user_score"] = np.nan
+    samples = group_samples(games_df, "platform", "user_score")
+    assert set(samples) == set(games_df["platform"])
+    for platform, values in samples.items():
+        expected = games_df.loc[games_df["platform"] == platform, "user_score"].dropna()
+        np.testing.assert_array_equal(values, expected.to_numpy())
+
+
+def test_configured_tests_keep_samples(games_df, cfg):
+    (result,) = run_configured_tests(games_df, cfg)
+    assert result.column == "user_score"
+    assert result.group_column == "platform"
+    assert len(result.sample_a) == result.n_a
+    assert result.sample_b.mean() == pytest.approx(result.mean_b)
+
+    direct = run_ttest(games_df, "user_score", "platform", "XOne", "PC", name="xone_vs_pc")
+    assert direct.p_value == pytest.approx(result.p_value)
+
+
+def test_missing_group_raises(games_df):
+    with pytest.raises(ValueError, match="Insufficient data"):
+        run_ttest(games_df, "user_score", "platform", "XOne", "Dreamcast")
+
+
+def test_configured_test_and_alternative_are_honoured(games_df, cfg):
+    cfg["hypothesis_tests"] = [
+        {**cfg["hypothesis_tests"][0], "name": name, "test": test, "alternative": alternative}
+        for name, test, alternative in [
+            ("levene", "levene_then_ttest", "two-sided"),
+            ("student_less", "student", "less"),
+            ("mwu_greater", "mannwhitney", "greater"),
+        ]
+    ]
+    levene, student, mwu = run_configured_tests(games_df, cfg)
+
+    a = games_df.loc[games_df["platform"] == "XOne", "user_score"]
+    b = games_df.loc[games_df["platform"] == "PC", "user_score"]
+    assert levene.levene_p == pytest.approx(stats.levene(a, b).pvalue)
+    assert levene.test == ("student" if levene.levene_p >= 0.05 else "welch")
+    assert student.p_value == pytest.approx(stats.ttest_ind(a, b, alternative="less").pvalue)
+    assert mwu.test == "mannwhitney"
+    assert mwu.p_value == pytest.approx(stats.mannwhitneyu(a, b, alternative="greater").pvalue)
+
+
+def test_unknown_test_raises(games_df):
+    with pytest.raises(ValueError, match="Unknown test"):
+        run_ttest(games_df, "user_score", "platform", "XOne", "PC", test="anova")
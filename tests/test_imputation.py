@@ -2,7 +2,8 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from project_games.data.imputation import impute_hierarchical
+from project_games.data.imputation import build_median_sketches, impute_hierarchical
+from project_games.data.matching import name_keys
 
 
 @pytest.fixture
@@ -74,3 +75,88 @@ def test_impute_rating_max_level_2(sample_df):
     assert imputed.isna().sum() == 0
     # All should be filled (either imputed or TBD)
     assert (imputed == "").sum() == 0
+
+
+def test_impute_level_0_uses_name_key():
+    df = pd.DataFrame(
+        {
+            "name": ["Game A", "Game A (JP sales)"],
+            "platform": ["PS4", "PC"],
+            "genre": ["Action", "Action"],
+            "year_of_release": [2015, 2015],
+            "critic_score": [80.0, np.nan],
+        }
+    )
+    _, exact_levels = impute_hierarchical(df, "critic_score", min_samples=1, max_level=0)
+    assert exact_levels.iloc[1] == "not_imputed"
+
+    imputed, levels = impute_hierarchical(
+        df, "critic_score", min_samples=1, max_level=0, name_key=name_keys(df["name"])
+    )
+    assert imputed.iloc[1] == 80.0
+    assert levels.iloc[1] == "level_0"
+
+
+@pytest.fixture
+def large_df():
+    rng = np.random.default_rng(0)
+    n = 6_000
+    df = pd.DataFrame(
+        {
+            "name": [f"Game {i}" for i in range(n)],
+            "platform": rng.choice(["PS4", "PC"], n),
+            "genre": rng.choice(["Action", "Sports", "Puzzle"], n),
+            "year_of_release": rng.integers(2014, 2017, n).astype(float),
+            "critic_score": rng.normal(70, 10, n).round(),
+        }
+    )
+    df.loc[rng.random(n) < 0.3, "critic_score"] = np.nan
+    return df
+
+
+def test_approx_median_close_to_exact_median(large_df):
+    exact, exact_levels = impute_hierarchical(large_df, "critic_score", min_samples=5)
+    approx, levels = impute_hierarchical(
+        large_df, "critic_score", min_samples=5, strategy="approx_median"
+    )
+    assert levels.equals(exact_levels)
+    # ~1% rank error on a normal(70, 10) column is well under two points.
+    assert (approx - exact).abs().max() <= 2
+
+
+def test_approx_median_is_exact_for_small_groups(sample_df):
+    exact, _ = impute_hierarchical(sample_df, "critic_score", min_samples=1)
+    approx, _ = impute_hierarchical(
+        sample_df, "critic_score", min_samples=1, strategy="approx_median"
+    )
+    pd.testing.assert_series_equal(approx, exact)
+
+
+def test_median_sketches_merge_across_partitions(large_df):
+    chunks = np.array_split(np.arange(len(large_df)), 6)
+    sketches = build_median_sketches((large_df.iloc[c] for c in chunks[:3]), "critic_score")
+    rest = build_median_sketches((large_df.iloc[c] for c in chunks[3:]), "critic_score")
+    for level, sketch in sketches.items():
+        sketch.merge(rest[level])
+
+    by_group = large_df.groupby(["platform", "genre", "year_of_release"])["critic_score"]
+    counts = sketches[1].counts()
+    assert counts.sort_index().tolist() == by_group.count().sort_index().tolist()
+    medians = sketches[1].quantile(0.5).reindex(by_group.median().index)
+    assert (medians - by_group.median()).abs().max() <= 2
+
+    imputed, _ = impute_hierarchical(
+        large_df, "critic_score", strategy="approx_median", sketches=sketches
+    )
+    assert imputed.notna().all()
+
+
+def test_unknown_strategy_raises(sample_df):
+    with pytest.raises(ValueError, match="Unknown strategy"):
+        impute_hierarchical(sample_df, "critic_score", strategy="mean")
+
+
+@pytest.mark.parametrize("strategy", ["median", "approx_median"])
+def test_numeric_strategy_on_text_column_raises(sample_df, strategy):
+    with pytest.raises(ValueError, match="'rating' has dtype"):
+        impute_hierarchical(sample_df, "rating", strategy=strategy)
@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from project_games.data.imputation_eval import (
+    evaluate_fold,
+    evaluate_imputation,
+    fold_positions,
+    summarize_evaluation,
+)
+
+
+@pytest.fixture
+def scored_df(games_df):
+    df = games_df.copy()
+    df["critic_score"] = np.where(df["genre"] == "Action", 80.0, 60.0)
+    df.loc[::7, "critic_score"] = np.nan
+    df["rating"] = np.where(df["genre"] == "Shooter", "M", "E")
+    return df
+
+
+def test_folds_partition_known_values(scored_df):
+    folds = fold_positions(scored_df, "critic_score", 4)
+    combined = np.sort(np.concatenate(folds))
+    np.testing.assert_array_equal(combined, np.flatnonzero(scored_df["critic_score"].notna()))
+
+
+def test_genre_determined_values_are_recovered(scored_df):
+    positions = fold_positions(scored_df, "critic_score", 3)[0]
+    table = evaluate_fold(scored_df, "critic_score", positions, min_samples=1, max_level=4)
+    overall = table.set_index("level").loc["all"]
+    assert overall["n"] == overall["n_imputed"] == len(positions)
+    assert overall["abs_error"] == 0
+    assert overall["seconds"] >= 0
+
+
+def test_grid_summary(scored_df):
+    table = evaluate_imputation(
+        scored_df, ["critic_score", "rating"], n_folds=2, max_levels=(1, 4), n_workers=1
+    )
+    assert len(table.groupby(["column", "max_level", "fold"])) == 8
+
+    summary = summarize_evaluation(table).set_index(["column", "max_level", "level"])
+    assert summary.loc[("rating", 4, "all"), "accuracy"] == pytest.approx(1.0)
+    assert summary.loc[("critic_score", 4, "all"), "mae"] == pytest.approx(0.0)
+    assert summary.loc[("critic_score", 4, "all"), "coverage"] == 1.0
+
+
+def test_pool_matches_in_process(scored_df):
+    kwargs = dict(columns=["critic_score"], n_folds=2, max_levels=(1, 4))
+    serial = evaluate_imputation(scored_df, n_workers=1, **kwargs).drop(columns="seconds")
+    pooled = evaluate_imputation(scored_df, n_workers=2, **kwargs).drop(columns="seconds")
+    assert pooled.equals(serial)
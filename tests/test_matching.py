@@ -0,0 +1,81 @@
+import pandas as pd
+
+from project_games.data.matching import jaccard, name_keys, normalize_name
+
+
+def test_normalize_name_strips_noise():
+    assert normalize_name("Pokémon Yellow: Special Pikachu Edition") == (
+        "pokemon yellow special pikachu"
+    )
+    assert normalize_name("Ratchet & Clank: Going Commando (JP weekly sales)") == (
+        "ratchet and clank going commando"
+    )
+    assert normalize_name("Bully: Scholarship Edition") == "bully scholarship"
+    assert normalize_name("Gears of War: Ultimate Edition") == "gears of war"
+    # Years in parentheses distinguish remakes and are kept.
+    assert normalize_name("Tomb Raider (2013)") == "tomb raider 2013"
+
+
+def test_name_keys_group_variants_only():
+    names = pd.Series(
+        [
+            "The Fairly OddParents: Breakin' Da Rules",
+            "The Fairly Odd Parents: Breakin Da Rules",
+            "FIFA 14",
+            "FIFA 15",
+            "Tetris",
+            None,
+        ]
+    )
+    keys = name_keys(names)
+    assert keys[0] == keys[1]
+    assert keys[2] != keys[3]
+    assert keys[4] not in (keys[0], keys[2], keys[3])
+    assert pd.isna(keys[5])
+
+
+def test_name_keys_keep_distinct_games_apart():
+    names = pd.Series(
+        [
+            "Mission: Impossible",
+            "Impossible Mission",
+            "Super Robot Taisen EX",
+            "Super Robot Taisen UX",
+            "Super Robot Taisen XO",
+            "Super Robot Taisen α",
+            "Super Monkey Ball",
+            "Super Monkey Ball Jr.",
+            "Pokemon Mystery Dungeon: Red/Blue Rescue Team",
+            "Pokémon Mystery Dungeon: Blue Rescue Team",
+            "Pokémon Mystery Dungeon: Red Rescue Team (US weekly sales)",
+        ]
+    )
+    assert name_keys(names).nunique() == len(names)
+
+
+def test_name_keys_ignore_stop_words_and_spacing():
+    names = pd.Series(
+        [
+            "The Lord of the Rings: The Third Age",
+            "Lord of the Rings: The Third Age",
+            "The Fairly OddParents: Shadow Showdown",
+            "The Fairly Odd Parents: Shadow Showdown",
+        ]
+    )
+    keys = name_keys(names)
+    assert keys[0] == keys[1]
+    assert keys[2] == keys[3]
+    assert keys[0] != keys[2]
+
+
+def test_name_keys_do_not_chain_through_a_middle_title():
+    base = "lord of the rings the fellowship of the ring"
+    names = pd.Series([base, f"the {base}", f"the {base} the the"])
+    threshold = 0.93
+    # Each title matches its neighbour, but the ends are too far apart.
+    assert jaccard(names[0], names[1]) >= threshold
+    assert jaccard(names[1], names[2]) >= threshold
+    assert jaccard(names[0], names[2]) < threshold
+    keys = name_keys(names, threshold=threshold)
+    assert keys[0] == keys[1]
+    assert keys[2] != keys[0]
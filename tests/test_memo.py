@@ -0,0 +1,32 @@
+from project_games.analysis.memo import AnalysisCache
+from project_games.analysis.platform import platform_total_sales, platform_yearly_sales
+
+
+def test_repeated_calls_are_served_from_cache(games_df):
+    cache = AnalysisCache()
+    first = cache.call(platform_yearly_sales, games_df, ["PS4", "PC"])
+    second = cache.call(platform_yearly_sales, games_df, ["PS4", "PC"])
+    assert second is first
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_keys_on_parameters_and_content(games_df):
+    cache = AnalysisCache()
+    cache.call(platform_yearly_sales, games_df, ["PS4"])
+    cache.call(platform_yearly_sales, games_df, ["PC"])
+    cache.call(platform_yearly_sales, games_df.copy(), ["PS4"])
+    cache.call(platform_yearly_sales, games_df.head(10), ["PS4"])
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_cache_evicts_least_recently_used(games_df):
+    cache = AnalysisCache(maxsize=2)
+    cache.call(platform_total_sales, games_df)
+    cache.call(platform_yearly_sales, games_df, ["PS4"])
+    cache.call(platform_total_sales, games_df)
+    cache.call(platform_yearly_sales, games_df, ["PC"])
+    assert len(cache) == 2
+
+    cache.call(platform_total_sales, games_df)
+    cache.call(platform_yearly_sales, games_df, ["PS4"])
+    assert (cache.hits, cache.misses) == (2, 4)
@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal, assert_series_equal
+
+from project_games.analysis import genre, parallel, platform, regional
+from project_games.analysis.results import run_analysis
+
+
+@pytest.fixture
+def sales_df():
+    rng = np.random.default_rng(0)
+    n = 500
+    df = pd.DataFrame(
+        {
+            "platform": rng.choice(["PS4", "XOne", "PC", "3DS"], n),
+            "genre": rng.choice(["Action", "Sports", "Shooter"], n),
+            "rating": rng.choice(["E", "M", "T"], n),
+            "year_of_release": rng.integers(2012, 2017, n),
+            "na_sales": rng.gamma(1.0, 0.5, n),
+            "eu_sales": rng.gamma(1.0, 0.4, n),
+            "jp_sales": rng.gamma(1.0, 0.1, n),
+            "other_sales": rng.gamma(1.0, 0.05, n),
+        }
+    )
+    df["total_sales"] = df[["na_sales", "eu_sales", "jp_sales", "other_sales"]].sum(axis=1)
+    return df
+
+
+@pytest.fixture(autouse=True)
+def force_pool(monkeypatch):
+    monkeypatch.setattr(parallel, "MIN_PARALLEL_ROWS", 0)
+
+
+def test_grouped_moments_matches_groupby(sales_df):
+    result = parallel.grouped_moments(sales_df, "genre", ["total_sales"], n_workers=2)
+    expected = sales_df.groupby("genre")["total_sales"].agg(["sum", "count"])
+    assert np.allclose(result["total_sales_sum"], expected["sum"])
+    assert (result["total_sales_count"] == expected["count"]).all()
+
+
+def test_grouped_moments_skips_missing_values(sales_df):
+    sales_df.loc[:9, "total_sales"] = np.nan
+    sales_df.loc[10:19, "genre"] = None
+    result = parallel.grouped_moments(sales_df, "genre", ["total_sales"], n_workers=2)
+    expected = sales_df.groupby("genre")["total_sales"].agg(["sum", "count"])
+    assert np.allclose(result["total_sales_sum"], expected["sum"])
+    assert (result["total_sales_count"] == expected["count"]).all()
+
+
+def test_platform_functions_match_serial(sales_df):
+    assert_series_equal(
+        parallel.platform_total_sales(sales_df, n_workers=2),
+        platform.platform_total_sales(sales_df),
+    )
+    assert_frame_equal(
+        parallel.platform_yearly_sales(sales_df, ["PS4", "PC"], n_workers=2),
+        platform.platform_yearly_sales(sales_df, ["PS4", "PC"]),
+    )
+
+
+def test_genre_summary_matches_serial(sales_df):
+    assert_frame_equal(
+        parallel.genre_sales_summary(sales_df, n_workers=2),
+        genre.genre_sales_summary(sales_df),
+    )
+
+
+def test_regional_functions_match_serial(sales_df):
+    for name in ["market_share_platforms", "market_share_genres", "rating_sales_by_region"]:
+        assert_frame_equal(
+            getattr(parallel, name)(sales_df, n_workers=2),
+            getattr(regional, name)(sales_df),
+        )
+    result = parallel.top_platforms_by_region(sales_df, n_workers=2)
+    expected = regional.top_platforms_by_region(sales_df)
+    for region in expected:
+        assert_series_equal(result[region], expected[region])
+
+
+def test_run_analysis_uses_parallel_backend(games_df, cfg, monkeypatch):
+    calls = []
+    original = parallel.grouped_moments
+
+    def tracking(*args, **kwargs):
+        calls.append(args[1])
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(parallel, "grouped_moments", tracking)
+    expected = run_analysis(games_df, cfg)
+    assert not calls
+    result = run_analysis(games_df, {**cfg, "parallel": {"workers": 2}})
+    assert calls
+    assert result.keys() == expected.keys()
+    for name, value in expected.items():
+        if isinstance(value, pd.Series):
+            assert_series_equal(result[name], value)
+        elif isinstance(value, pd.DataFrame):
+            assert_frame_equal(result[name], value)
+        elif name.startswith("top_"):
+            for region, series in value.items():
+                assert_series_equal(result[name][region], series)
+        elif name == "classify_genres":
+            assert result[name] == value
@@ -0,0 +1,87 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from project_games.analysis.temporal import filter_relevant_period, relevant_period_filters
+from project_games.data import partitioned
+from project_games.data.loader import load_processed_data
+from project_games.data.partitioned import apply_filters, open_partitioned, write_partitioned
+
+
+@pytest.fixture
+def frame(games_df):
+    df = games_df.copy()
+    df.loc[[2, 9], "name"] = np.nan
+    return df
+
+
+def _rows(df: pd.DataFrame) -> list:
+    return df.astype(object).where(df.notna(), None).values.tolist()
+
+
+@pytest.mark.parametrize("partition_by", [["year_of_release"], ["year_of_release", "platform"]])
+def test_round_trip_keeps_row_order(frame, tmp_path, partition_by):
+    path = write_partitioned(frame, tmp_path / "games.parts", partition_by)
+    opened = open_partitioned(path)
+    assert list(opened.columns) == list(frame.columns)
+    assert _rows(opened) == _rows(frame)
+    assert opened["genre"].dtype == frame["genre"].dtype
+    assert isinstance(open_partitioned(path, categorical=True)["genre"].dtype, pd.CategoricalDtype)
+
+
+def test_filters_prune_partitions(frame, tmp_path, monkeypatch):
+    path = write_partitioned(frame, tmp_path / "games.parts", ["year_of_release", "platform"])
+    opened_parts = []
+    original = partitioned.open_columnar
+
+    def tracking(part_path, columns=None, categorical=False):
+        opened_parts.append(part_path.relative_to(path).as_posix())
+        return original(part_path, columns, categorical)
+
+    monkeypatch.setattr(partitioned, "open_columnar", tracking)
+    filters = [("year_of_release", ">=", 2015), ("platform", "in", ["PS4"]), ("user_score", ">", 5)]
+    df = open_partitioned(path, filters=filters, columns=["name", "total_sales"])
+
+    assert sorted(opened_parts) == [
+        "year_of_release=2015/platform=PS4",
+        "year_of_release=2016/platform=PS4",
+    ]
+    expected = frame[
+        (frame["year_of_release"] >= 2015)
+        & (frame["platform"] == "PS4")
+        & (frame["user_score"] > 5)
+    ]
+    assert _rows(df) == _rows(expected[["name", "total_sales"]])
+
+
+def test_filters_matching_nothing_keep_dtypes(frame, tmp_path):
+    path = write_partitioned(frame, tmp_path / "games.parts")
+    df = open_partitioned(path, filters=[("year_of_release", "<", 1990)])
+    assert len(df) == 0
+    assert df["na_sales"].dtype == np.float64
+
+
+def test_rewrite_replaces_partitions(frame, tmp_path):
+    path = tmp_path / "games.parts"
+    write_partitioned(frame, path, ["year_of_release", "platform"])
+    write_partitioned(frame[frame["year_of_release"] == 2016], path)
+    assert [p.name for p in path.iterdir() if p.is_dir()] == ["year_of_release=2016"]
+
+
+def test_load_processed_data_filters_every_format(frame, tmp_path):
+    filters = [("year_of_release", ">=", 2014)]
+    cfg = {"analysis": {"relevant_period": {"start_year": 2014}}}
+    assert relevant_period_filters(cfg) == filters
+    expected = filter_relevant_period(frame, cfg)
+
+    csv = tmp_path / "games.csv"
+    frame.to_csv(csv, index=False)
+    parts = write_partitioned(frame, tmp_path / "games.parts")
+    for path in (csv, parts):
+        df = load_processed_data(path, filters=filters, columns=["name", "year_of_release"])
+        assert _rows(df) == _rows(expected[["name", "year_of_release"]])
+
+
+def test_unknown_operator_raises(frame):
+    with pytest.raises(ValueError, match="Unknown filter operator"):
+        apply_filters(frame, [("year_of_release", "~", 2014)])
@@ -0,0 +1,35 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from project_games.data.profiling import null_profiles, null_rates
+
+
+@pytest.fixture
+def raw_df(games_df):
+    df = games_df.copy()
+    rng = np.random.default_rng(1)
+    df["critic_score"] = np.where(rng.random(len(df)) < 0.4, np.nan, 70.0)
+    df.loc[rng.random(len(df)) < 0.4, "user_score"] = np.nan
+    df.loc[rng.random(len(df)) < 0.3, "rating"] = None
+    return df
+
+
+def test_null_profiles_match_groupby(raw_df):
+    attributes = ["critic_score", "user_score", "rating"]
+    profiles = null_profiles(raw_df, attributes=attributes)
+    for by in ["genre", "platform", "year_of_release"]:
+        expected = raw_df.groupby(by)[attributes].apply(lambda x: x.isna().mean() * 100)
+        pd.testing.assert_frame_equal(profiles[by], expected, check_names=False)
+
+
+def test_null_rates_buckets_large_groupings(raw_df):
+    by_platform = null_rates(raw_df, "platform", max_categories=2)
+    top = raw_df["platform"].value_counts().index[0]
+    assert by_platform.index.tolist() == [top, "Other"]
+    assert by_platform.loc["Other", "user_score"] == pytest.approx(
+        raw_df.loc[raw_df["platform"] != top, "user_score"].isna().mean() * 100
+    )
+
+    by_year = null_rates(raw_df, "year_of_release", max_categories=3)
+    assert by_year.index.tolist() == ["2010–2012", "2013–2015", "2016"]
@@ -0,0 +1,25 @@
+from project_games.analysis.temporal import games_per_year
+from project_games.visualization.report import FigureSpec, render_report, report_figures
+
+
+def test_report_figures_cover_configured_tests(games_df, cfg):
+    names = [spec.name for spec in report_figures(games_df, cfg)]
+    assert "games_per_year" in names
+    assert "hypothesis_xone_vs_pc" in names
+    assert "null_heatmaps" not in names
+
+
+def test_render_skips_unchanged_figures(games_df, tmp_path):
+    spec = FigureSpec("games_per_year", "plot_games_per_year", (games_per_year(games_df),))
+
+    assert render_report([spec], tmp_path, n_workers=1) == {"games_per_year": "rendered"}
+    assert (tmp_path / "games_per_year.png").exists()
+    assert render_report([spec], tmp_path, n_workers=1) == {"games_per_year": "skipped"}
+    assert render_report([spec], tmp_path, n_workers=1, force=True) == {
+        "games_per_year": "rendered"
+    }
+
+    changed = FigureSpec(
+        "games_per_year", "plot_games_per_year", (games_per_year(games_df.head(50)),)
+    )
+    assert render_report([changed], tmp_path, n_workers=1) == {"games_per_year": "rendered"}
@@ -0,0 +1,44 @@
+import pandas as pd
+import pytest
+
+from project_games.analysis.results import (
+    ResultsStore,
+    load_results,
+    run_analysis,
+    save_results,
+)
+
+
+def test_load_results_miss_computes_live(games_df, cfg, tmp_path):
+    store = ResultsStore(tmp_path / "results.sqlite")
+    results, from_store = load_results(games_df, cfg, store)
+    assert not from_store
+    assert "platform_total_sales" in results
+
+
+def test_store_round_trip(games_df, cfg, tmp_path):
+    store = ResultsStore(tmp_path / "results.sqlite")
+    live = run_analysis(games_df, cfg)
+    save_results(games_df, live, cfg, store)
+
+    stored, from_store = load_results(games_df, cfg, store)
+    assert from_store
+    pd.testing.assert_series_equal(
+        stored["platform_total_sales"], live["platform_total_sales"], check_dtype=False
+    )
+    pd.testing.assert_frame_equal(
+        stored["genre_sales_summary"], live["genre_sales_summary"], check_dtype=False
+    )
+    assert stored["classify_genres"] == live["classify_genres"]
+    assert stored["hypothesis_tests"][0].p_value == pytest.approx(
+        live["hypothesis_tests"][0].p_value
+    )
+
+
+def test_store_is_keyed_by_config(games_df, cfg, tmp_path):
+    store = ResultsStore(tmp_path / "results.sqlite")
+    save_results(games_df, run_analysis(games_df, cfg), cfg, store)
+
+    cfg["analysis"]["relevant_period"]["start_year"] = 2015
+    _, from_store = load_results(games_df, cfg, store)
+    assert not from_store
@@ -0,0 +1,96 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from project_games.analysis.search import TitleIndex, UnknownTitleError
+from project_games.data.matching import fold_text
+
+
+@pytest.fixture
+def catalog():
+    return pd.DataFrame(
+        {
+            "name": [
+                "Pokémon Red",
+                "Pokemon Stadium",
+                "Pokémon Red",
+                "Super Mario Bros.",
+                "Mario Kart Wii",
+                "Dr. Mario",
+                "Mario",
+                "Marionette Tales",
+                None,
+            ],
+            "platform": ["GB", "N64", "3DS", "NES", "Wii", "NES", "NES", "PC", "PC"],
+            "year_of_release": [1996, 1999, 2016, 1985, 2008, 1990, 1983, 2012, 2000],
+            "total_sales": [31.4, 5.5, 1.0, 40.2, 35.5, 5.3, 1.0, 0.1, 9.9],
+            "critic_score": [np.nan, 70.0, 80.0, 90.0, 82.0, 75.0, 60.0, 55.0, 50.0],
+        }
+    )
+
+
+def _brute_force(df, query):
+    key = fold_text(query)
+    names = df["name"].dropna().unique()
+    return {name for name in names if key and key in fold_text(name)}
+
+
+def test_ranking_tiers_and_sales(catalog):
+    result = TitleIndex(catalog).search("mario", limit=None)
+    assert result["name"].tolist() == [
+        "Mario",
+        "Mario Kart Wii",
+        "Marionette Tales",
+        "Super Mario Bros.",
+        "Dr. Mario",
+    ]
+    assert result["match"].tolist() == ["exact", "prefix", "prefix", "word", "word"]
+
+
+def test_accents_substrings_and_cross_platform_totals(catalog):
+    index = TitleIndex(catalog)
+    result = index.search("POKEMON red")
+    assert result.loc[0, "name"] == "Pokémon Red"
+    assert result.loc[0, "platforms"] == "3DS, GB"
+    assert result.loc[0, "releases"] == 2
+    assert result.loc[0, "total_sales"] == pytest.approx(32.4)
+
+    substring = index.search("ario")
+    assert set(substring["name"]) == _brute_force(catalog, "ario")
+    assert set(substring["match"]) == {"substring"}
+    assert index.search("  ").empty
+    assert index.search("zz").empty
+
+
+@pytest.mark.parametrize("query", ["a", "ma", "mar", "kart w", "on", "tad", "os.", "e"])
+def test_matches_agree_with_a_scan(catalog, query):
+    found = set(TitleIndex(catalog).search(query, limit=None)["name"])
+    expected = _brute_force(catalog, query)
+    if len(fold_text(query)) >= 3:
+        assert found == expected
+    else:
+        # Short queries only match at word starts.
+        assert found == {
+            n for n in expected if any(w.startswith(fold_text(query)) for w in fold_text(n).split())
+        }
+
+
+def test_mask_restricts_titles_and_totals(catalog):
+    index = TitleIndex(catalog)
+    mask = (catalog["year_of_release"] >= 2000).to_numpy()
+    result = index.search("pokemon", mask=mask)
+    assert result["name"].tolist() == ["Pokémon Red"]
+    assert result.loc[0, "releases"] == 1
+    assert result.loc[0, "total_sales"] == pytest.approx(1.0)
+
+
+def test_lookup_returns_every_release(catalog):
+    index = TitleIndex(catalog)
+    rows = index.lookup(catalog, "Pokémon Red")
+    assert rows["platform"].tolist() == ["GB", "3DS"]
+    assert rows["critic_score"].isna().tolist() == [True, False]
+    assert index.positions("Pokémon Red").tolist() == [0, 2]
+    with pytest.raises(UnknownTitleError, match="Unknown title"):
+        index.lookup(catalog, "Pokemon Blue")
+    with pytest.raises(ValueError, match="rows"):
+        index.lookup(catalog.head(3), "Mario")
@@ -0,0 +1,106 @@
+import asyncio
+import json
+from http import HTTPStatus
+
+import pytest
+
+from project_games.service import AnalyticsService, parse_query
+
+
+@pytest.fixture
+def service(games_df, cfg):
+    svc = AnalyticsService(games_df, cfg, max_workers=2)
+    yield svc
+    svc.close()
+
+
+def get(service, target):
+    status, body = asyncio.run(service.dispatch("GET", target))
+    return status, json.loads(body)
+
+
+def test_parse_query_normalises_selections():
+    assert parse_query("platform=XOne,PC&platform=PS4&top=3&top=5") == (
+        ("platform", ("PC", "PS4", "XOne")),
+        ("top", "5"),
+    )
+
+
+def test_platform_totals_respect_filters(service, games_df):
+    status, body = get(service, "/platforms/total-sales?start_year=2014&platform=PC,XOne")
+    assert status == HTTPStatus.OK
+    view = games_df[
+        games_df["platform"].isin(["PC", "XOne"]) & (games_df["year_of_release"] >= 2014)
+    ]
+    assert body["rows"] == len(view)
+    totals = {row["platform"]: row["total_sales"] for row in body["result"]}
+    assert totals == pytest.approx(view.groupby("platform")["total_sales"].sum().to_dict())
+
+    get(service, "/platforms/total-sales?platform=XOne,PC&start_year=2014")
+    assert service.cache.hits == 1
+
+
+def test_top_titles_use_the_index(service, games_df):
+    status, body = get(service, "/titles/top?metric=eu_sales&top=3&genre=Action&start_year=2014")
+    assert status == HTTPStatus.OK
+    view = games_df[(games_df["genre"] == "Action") & (games_df["year_of_release"] >= 2014)]
+    assert body["rows"] == len(view)
+    expected = view["eu_sales"].nlargest(3).tolist()
+    assert [row["eu_sales"] for row in body["result"]] == pytest.approx(expected)
+    assert get(service, "/titles/top?metric=name")[0] == HTTPStatus.BAD_REQUEST
+    for top in ("0", "-1"):
+        assert get(service, f"/titles/top?top={top}")[0] == HTTPStatus.BAD_REQUEST
+        assert get(service, f"/platforms/total-sales?top={top}")[0] == HTTPStatus.BAD_REQUEST
+
+
+def test_ttest_and_errors(service):
+    status, body = get(service, "/hypothesis/ttest?group_a=XOne&group_b=PC")
+    assert status == HTTPStatus.OK
+    assert body["result"]["column"] == "user_score"
+    assert "sample_a" not in body["result"]
+
+    assert get(service, "/hypothesis/ttest?group_a=XOne&group_b=Wii")[0] == HTTPStatus.BAD_REQUEST
+    assert get(service, "/regional/shares?kind=ratings")[0] == HTTPStatus.BAD_REQUEST
+    assert get(service, "/nope")[0] == HTTPStatus.NOT_FOUND
+
+
+def test_serves_http_over_socket(service):
+    async def exchange():
+        server = await asyncio.start_server(service.handle_connection, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b"GET /genres/tiers HTTP/1.1\r\nHost: x\r\nConnection: close\r\n\r\n")
+            await writer.drain()
+            response = await reader.read()
+            writer.close()
+        return response
+
+    head, _, body = asyncio.run(exchange()).partition(b"\r\n\r\n")
+    assert head.startswith(b"HTTP/1.1 200 OK")
+    assert set(json.loads(body)["result"]) == {"high_sales", "low_sales"}
+
+
+def test_title_search_and_lookup(service, games_df):
+    status, body = get(service, "/titles/search?q=game%2012&limit=3")
+    assert status == HTTPStatus.OK
+    assert body["filters"] == {}
+    names = [row["name"] for row in body["result"]]
+    assert names[0] == "Game 12" and body["result"][0]["match"] == "exact"
+    prefixed = games_df[
+        games_df["name"].str.startswith("Game 12") & (games_df["name"] != "Game 12")
+    ]
+    assert names[1:] == prefixed.nlargest(2, "total_sales")["name"].tolist()
+
+    status, body = get(service, "/titles/lookup?name=Game%207&start_year=2016")
+    row = games_df.loc[7]
+    assert body["rows"] == int(row["year_of_release"] >= 2016)
+    status, body = get(service, "/titles/lookup?name=Game%207")
+    assert [r["platform"] for r in body["result"]] == [row["platform"]]
+
+    assert get(service, "/titles/search")[0] == HTTPStatus.BAD_REQUEST
+    for limit in ("0", "-1"):
+        assert get(service, f"/titles/search?q=game&limit={limit}")[0] == HTTPStatus.BAD_REQUEST
+    status, body = get(service, "/titles/lookup?name=Nope")
+    assert status == HTTPStatus.NOT_FOUND
+    assert body == {"error": "Unknown title 'Nope'"}
@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from project_games.data.profiling import profile_csv
+from project_games.data.sketches import HyperLogLog, KLLSketch, SpaceSaving
+
+
+def test_hyperloglog_estimates_distinct_count_and_merges():
+    left, right = HyperLogLog(), HyperLogLog()
+    left.update(np.arange(30_000))
+    right.update(np.arange(20_000, 50_000))
+    assert left.count() == pytest.approx(30_000, rel=0.05)
+    left.merge(right)
+    assert left.count() == pytest.approx(50_000, rel=0.05)
+
+
+def test_hyperloglog_small_counts_are_near_exact():
+    hll = HyperLogLog()
+    hll.update(np.array(["a", "b", "c", "a"], dtype=object))
+    hll.update(np.array([1, 1.0, 2]))
+    assert round(hll.count()) == 5
+
+
+def test_kll_quantiles_close_to_exact():
+    values = np.random.default_rng(0).normal(size=100_000)
+    sketch, other = KLLSketch(), KLLSketch(seed=1)
+    for chunk in np.array_split(values[:60_000], 30):
+        sketch.update(chunk)
+    other.update(values[60_000:])
+    sketch.merge(other)
+    qs = [0.05, 0.25, 0.5, 0.75, 0.95]
+    assert sketch.n == len(values)
+    assert sketch.size() < 2_000
+    np.testing.assert_allclose(sketch.quantiles(qs), np.quantile(values, qs), atol=0.05)
+
+
+def test_space_saving_keeps_heavy_hitters_across_merges():
+    rng = np.random.default_rng(0)
+    noise = rng.integers(1_000, 100_000, 20_000)
+    stream = np.concatenate([np.repeat([1, 2, 3], [3_000, 2_000, 1_000]), noise])
+    rng.shuffle(stream)
+    halves = []
+    for part in np.array_split(stream, 2):
+        sketch = SpaceSaving(capacity=50)
+        for chunk in np.array_split(part, 20):
+            sketch.update(chunk)
+        halves.append(sketch)
+    halves[0].merge(halves[1])
+
+    top = halves[0].top(3)
+    assert [value for value, _, _ in top] == [1, 2, 3]
+    for value, count, error in top:
+        true = int((stream == value).sum())
+        assert true <= count <= true + error
+
+
+def test_space_saving_ranks_by_guaranteed_count():
+    # A long tail of rare values evicts counters, so later arrivals carry a
+    # large error; they must not outrank values whose count is certain.
+    rng = np.random.default_rng(1)
+    stream = np.concatenate([np.repeat([1, 2], [400, 250]), rng.integers(1_000, 6_000, 5_000)])
+    rng.shuffle(stream)
+    sketch = SpaceSaving(capacity=50)
+    for chunk in np.array_split(stream, 50):
+        sketch.update(chunk)
+
+    top = sketch.top(5)
+    assert [value for value, _, _ in top][:2] == [1, 2]
+    for value, count, error in top:
+        assert count - error >= sketch.floor()
+        assert count - error <= int((stream == value).sum()) <= count
+
+
+def test_space_saving_reports_nothing_uncertain():
+    sketch = SpaceSaving(capacity=10)
+    for chunk in np.array_split(np.arange(1_000) % 300, 10):
+        sketch.update(chunk)
+    assert sketch.top(3) == []
+
+
+def test_profile_csv_streams_chunks(tmp_path):
+    df = pd.DataFrame(
+        {
+            "name": ["a", "b", "a", None, "c", "a", "b", "d"] * 50,
+            "score": ["8.5", "tbd", None, "7", "9", "tbd", "6.5", "7"] * 50,
+            "sales": np.arange(400) / 10,
+        }
+    )
+    path = tmp_path / "games.csv"
+    df.to_csv(path, index=False)
+
+    profile = profile_csv(path, chunksize=7, top_k=2).set_index("column")
+
+    assert profile.loc["name", "nulls"] == 50
+    assert profile.loc["name", "distinct_approx"] == 4
+    assert profile.loc["name", "top_values"] == "a (150); b (100)"
+    assert np.isnan(profile.loc["name", "mean"])
+    # Chunks read as float and as text agree on the value labels.
+    assert profile.loc["score", "distinct_approx"] == 5
+    assert profile.loc["score", "top_values"] == "7.0 (100); tbd (100)"
+    assert profile.loc["score", "max"] == 9
+    assert profile.loc["sales", "rows"] == 400
+    assert profile.loc["sales", "mean"] == pytest.approx(df["sales"].mean())
+    assert profile.loc["sales", "q50"] == pytest.approx(df["sales"].median(), abs=0.5)
+
+
+def test_profile_csv_top_values_match_value_counts_across_chunks(tmp_path):
+    # More distinct titles than the sketch has counters, as in the raw data.
+    rng = np.random.default_rng(0)
+    names = np.concatenate(
+        [np.repeat(["Top", "Second", "Third"], [40, 30, 20]), rng.integers(0, 3_000, 6_000)]
+    ).astype(str)
+    rng.shuffle(names)
+    path = tmp_path / "games.csv"
+    pd.DataFrame({"name": names}).to_csv(path, index=False)
+
+    profile = profile_csv(path, chunksize=300, top_k=3).set_index("column")
+
+    expected = pd.Series(names).value_counts().head(3)
+    reported = profile.loc["name", "top_values"].split("; ")
+    assert [label.split(" (")[0] for label in reported] == list(expected.index)
+    for label, (value, true) in zip(reported, expected.items()):
+        count = int(label.split(" (")[1].split(",")[0].rstrip(")"))
+        error = int(label.split("≤ ")[1].rstrip(")")) if "≤" in label else 0
+        assert count - error <= true <= count
@@ -0,0 +1,134 @@
+import numpy as np
+import pandas as pd
+import pytest
+from pandas.testing import assert_frame_equal, assert_series_equal
+
+from project_games.analysis import genre, platform, regional, sql, temporal
+from project_games.analysis.hypothesis import collect_samples, configured_sample_keys
+from project_games.analysis.results import run_analysis
+from project_games.data.database import GameDatabase, write_database
+from project_games.data.partitioned import apply_filters
+
+
+@pytest.fixture
+def db(games_df, tmp_path):
+    return GameDatabase(write_database(games_df, tmp_path / "games.sqlite"))
+
+
+@pytest.fixture
+def db_rel(db, cfg):
+    return db.where(temporal.relevant_period_filters(cfg))
+
+
+def test_write_database_indexes_grouping_columns(db):
+    indexes = db.query("SELECT name FROM sqlite_master WHERE type = 'index'")["name"]
+    assert {"games_platform", "games_genre", "games_rating", "games_year_of_release"} <= set(
+        indexes
+    )
+
+
+def test_write_database_replaces_existing(games_df, tmp_path):
+    path = tmp_path / "games.sqlite"
+    write_database(games_df, path)
+    write_database(games_df.head(10), path)
+    assert GameDatabase(path).count() == 10
+
+
+def test_missing_database_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        GameDatabase(tmp_path / "missing.sqlite")
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        [("year_of_release", ">=", 2013)],
+        [("platform", "==", "PC"), ("year_of_release", "<", 2015)],
+        [("genre", "in", ["Action", "Puzzle"])],
+        [("rating", "not in", ["E"])],
+        [("platform", "!=", "PS4")],
+        [("genre", "in", [])],
+    ],
+)
+def test_filters_match_apply_filters(db, games_df, filters):
+    assert db.where(filters).count() == len(apply_filters(games_df, filters))
+
+
+def test_filters_keep_missing_values_like_pandas(games_df, tmp_path):
+    games_df.loc[:9, "rating"] = None
+    db = GameDatabase(write_database(games_df, tmp_path / "games.sqlite"))
+    for filters in ([("rating", "!=", "E")], [("rating", "not in", ["E", "M"])]):
+        assert db.where(filters).count() == len(apply_filters(games_df, filters))
+
+
+def test_unknown_operator_raises(db):
+    with pytest.raises(ValueError, match="Unknown filter operator"):
+        db.where([("platform", "~", "PC")]).count()
+
+
+def test_temporal_functions_match_pandas(db, games_df):
+    assert_series_equal(sql.games_per_year(db), temporal.games_per_year(games_df))
+    assert_series_equal(sql.significant_years(db), temporal.significant_years(games_df))
+    assert_frame_equal(
+        sql.evaluate_lookback_windows(db), temporal.evaluate_lookback_windows(games_df)
+    )
+
+
+def test_platform_functions_match_pandas(db_rel, games_df, cfg):
+    df_rel = temporal.filter_relevant_period(games_df, cfg)
+    assert_series_equal(sql.platform_total_sales(db_rel), platform.platform_total_sales(df_rel))
+    assert_frame_equal(
+        sql.platform_yearly_sales(db_rel, ["PS4", "PC"]),
+        platform.platform_yearly_sales(df_rel, ["PS4", "PC"]),
+    )
+    assert_frame_equal(
+        sql.platform_growth_analysis(db_rel), platform.platform_growth_analysis(df_rel)
+    )
+
+
+def test_genre_functions_match_pandas(db_rel, games_df, cfg):
+    df_rel = temporal.filter_relevant_period(games_df, cfg)
+    assert_frame_equal(sql.genre_sales_summary(db_rel), genre.genre_sales_summary(df_rel))
+    assert sql.classify_genres(db_rel) == genre.classify_genres(df_rel)
+
+
+@pytest.mark.parametrize("n", [1, 2, 5])
+def test_median_matches_pandas_for_odd_and_even_groups(games_df, tmp_path, n):
+    df = games_df.groupby("genre").head(n)
+    db = GameDatabase(write_database(df, tmp_path / "games.sqlite"))
+    assert np.allclose(
+        db.median("genre", "total_sales"), df.groupby("genre")["total_sales"].median()
+    )
+
+
+def test_regional_functions_match_pandas(db_rel, games_df, cfg):
+    df_rel = temporal.filter_relevant_period(games_df, cfg)
+    for name in ("top_platforms_by_region", "top_genres_by_region"):
+        result, expected = getattr(sql, name)(db_rel, 3), getattr(regional, name)(df_rel, 3)
+        for region in expected:
+            assert_series_equal(result[region], expected[region])
+    for name in ("market_share_platforms", "market_share_genres", "rating_sales_by_region"):
+        assert_frame_equal(getattr(sql, name)(db_rel), getattr(regional, name)(df_rel))
+
+
+def test_collect_samples_matches_pandas(db_rel, games_df, cfg):
+    keys = [*configured_sample_keys(cfg), ("platform", "user_score", "Wii")]
+    result = sql.collect_samples(db_rel, keys)
+    expected = collect_samples(temporal.filter_relevant_period(games_df, cfg), keys)
+    assert result.keys() == expected.keys()
+    for key in expected:
+        assert np.array_equal(result[key], expected[key])
+
+
+def test_run_analysis_matches_pandas(db, games_df, cfg):
+    result = sql.run_analysis(db, cfg)
+    expected = run_analysis(games_df, cfg)
+    assert result.keys() == expected.keys()
+    assert_frame_equal(result["genre_sales_summary"], expected["genre_sales_summary"])
+    assert [r.name for r in result["hypothesis_tests"]] == [
+        r.name for r in expected["hypothesis_tests"]
+    ]
+    assert [r.p_value for r in result["hypothesis_tests"]] == pytest.approx(
+        [r.p_value for r in expected["hypothesis_tests"]]
+    )
+    assert isinstance(result["games_per_year"], pd.Series)
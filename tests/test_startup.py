@@ -0,0 +1,67 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from project_games.config import load_config
+
+# Modules on the CLI / API / app start-up path and the heavy libraries they must
+# not import until a function actually needs them.
+STARTUP_MODULES = [
+    "project_games.analysis.results",
+    "project_games.data.imputation",
+    "project_games.data.loader",
+    "project_games.service",
+    "project_games.visualization.report",
+]
+HEAVY_MODULES = ["scipy", "matplotlib", "seaborn", "plotly"]
+IMPORT_BUDGET_SECONDS = 0.5
+
+
+def _run(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+def test_startup_modules_do_not_import_heavy_dependencies():
+    code = (
+        f"import sys, {', '.join(STARTUP_MODULES)}\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    assert _run(code).stdout.strip() == ""
+
+
+@pytest.mark.parametrize("module", STARTUP_MODULES)
+def test_import_time_budget(module):
+    # pandas and numpy are imported first so only the package's own cost counts.
+    stderr = _run(f"import pandas, {module}").stderr
+    cumulative = {}
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and line.count("|") == 2:
+            _, total, name = line.split("|")
+            if total.strip().isdigit():
+                cumulative[name.strip()] = int(total) / 1e6
+    assert cumulative[module] < IMPORT_BUDGET_SECONDS
+
+
+def test_load_config_returns_independent_copies():
+    cfg = load_config()
+    cfg["analysis"]["significance_level"] = 0.5
+    assert load_config()["analysis"]["significance_level"] == 0.05
+    assert load_config() is not load_config()
+
+
+def test_load_config_rereads_changed_file(tmp_path):
+    path = tmp_path / "config.yaml"
+    path.write_text("analysis:\n  top_n_genres: 5\n")
+    assert load_config(path)["analysis"]["top_n_genres"] == 5
+
+    path.write_text("analysis:\n  top_n_genres: 7\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_config(path)["analysis"]["top_n_genres"] == 7
@@ -0,0 +1,85 @@
+import pytest
+
+from project_games.analysis.genre import classify_genres, genre_sales_summary
+from project_games.analysis.hypothesis import run_configured_tests
+from project_games.analysis.sweep import (
+    apply_overrides,
+    expand_grid,
+    run_sweep,
+    sweep_summary,
+)
+from project_games.analysis.temporal import filter_relevant_period
+
+
+@pytest.fixture
+def sweep_cfg(cfg):
+    cfg["analysis"].update(top_n_platforms=5, top_n_genres=5)
+    return cfg
+
+
+def test_expand_grid_and_overrides(sweep_cfg):
+    points = expand_grid(
+        {"analysis.significance_level": [0.01, 0.05], "analysis.top_n_genres": [3]}
+    )
+    assert points == [
+        {"analysis.significance_level": 0.01, "analysis.top_n_genres": 3},
+        {"analysis.significance_level": 0.05, "analysis.top_n_genres": 3},
+    ]
+    updated = apply_overrides(sweep_cfg, {"analysis.relevant_period.start_year": 2015})
+    assert updated["analysis"]["relevant_period"]["start_year"] == 2015
+    assert sweep_cfg["analysis"]["relevant_period"]["start_year"] == 2013
+    with pytest.raises(KeyError, match="Unknown config key"):
+        apply_overrides(sweep_cfg, {"analysis.relevant_priod.start_year": 2015})
+    with pytest.raises(ValueError, match="non-empty list"):
+        expand_grid({"analysis.top_n_genres": []})
+
+
+def test_points_match_the_pipeline(games_df, sweep_cfg):
+    grid = {
+        "analysis.relevant_period.start_year": [2012, 2015],
+        "analysis.significance_level": [0.01, 0.5],
+        "analysis.top_n_genres": [2, 4],
+    }
+    table = run_sweep(grid, processed=games_df, cfg=sweep_cfg, n_workers=1)
+    assert list(table.columns[:4]) == ["point", *grid]
+    assert table["point"].nunique() == 8
+
+    for point, overrides in enumerate(expand_grid(grid)):
+        cfg = apply_overrides(sweep_cfg, overrides)
+        df_rel = filter_relevant_period(games_df, cfg)
+        rows = table[table["point"] == point].set_index(["section", "item", "metric"])["value"]
+
+        assert rows[("dataset", "period", "rows")] == len(df_rel)
+        genres = genre_sales_summary(df_rel)["sum"].head(overrides["analysis.top_n_genres"])
+        assert rows.loc["genres"].xs("total_sales", level="metric").to_dict() == pytest.approx(
+            genres.to_dict()
+        )
+        tiers = classify_genres(df_rel)
+        assert sorted(rows.loc["genre_tiers"].xs("high_sales", level="metric").index) == sorted(
+            tiers["high_sales"]
+        )
+        for result in run_configured_tests(df_rel, cfg):
+            assert rows[("hypothesis", result.name, "p_value")] == pytest.approx(result.p_value)
+            assert rows[("hypothesis", result.name, "reject_null")] == result.reject_null
+
+
+def test_imputation_grid_reimputes_cleaned_data(games_df, sweep_cfg):
+    cleaned = games_df.assign(critic_score=70.0, rating="E")
+    cleaned.loc[::3, "rating"] = None
+    sweep_cfg["imputation"] = {"min_samples": 5, "strategy": {}}
+    table = run_sweep(
+        {"imputation.min_samples": [1, 10_000]}, cleaned=cleaned, cfg=sweep_cfg, n_workers=1
+    )
+    tbd = table[(table["section"] == "dataset") & (table["item"] == "rating")]
+    # With an unreachable minimum no group qualifies and missing ratings stay TBD.
+    assert tbd["value"].tolist() == [0, cleaned["rating"].isna().sum()]
+
+
+def test_summary_and_unsupported_keys(games_df, sweep_cfg):
+    grid = {"analysis.significance_level": [0.01, 0.5]}
+    summary = sweep_summary(run_sweep(grid, processed=games_df, cfg=sweep_cfg, n_workers=1))
+    assert summary["point"].tolist() == [0, 1]
+    assert (summary["period_rows"] == len(filter_relevant_period(games_df, sweep_cfg))).all()
+    assert {"top_platform", "top_genre", "xone_vs_pc_p", "xone_vs_pc_reject"} <= set(summary)
+    with pytest.raises(ValueError, match="Cannot sweep"):
+        run_sweep({"data.raw_path": ["x.csv"]}, processed=games_df, cfg=sweep_cfg)
@@ -0,0 +1,69 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from project_games.analysis.temporal import (
+    GROWTH_COLUMNS,
+    dimension_year_matrix,
+    growth_panel,
+    growth_panels,
+)
+
+
+@pytest.fixture
+def matrix():
+    return pd.DataFrame(
+        [[0.0, 10.0, 20.0, 0.0, 40.0, 0.0], [5.0, 5.0, 5.0, 5.0, 5.0, 5.0]],
+        index=pd.Index(["A", "B"], name="platform"),
+        columns=range(2010, 2016),
+    )
+
+
+def test_dimension_year_matrix_fills_every_year(games_df):
+    games_df = games_df[games_df["year_of_release"] != 2012]
+    matrix = dimension_year_matrix(games_df, "platform")
+    assert list(matrix.columns) == list(range(2010, 2017))
+    assert (matrix[2012] == 0).all()
+    expected = games_df.groupby("platform")["total_sales"].sum()
+    assert np.allclose(matrix.sum(axis=1), expected)
+
+
+def test_dimension_year_matrix_regions(games_df):
+    matrix = dimension_year_matrix(games_df, "region")
+    assert list(matrix.index) == ["NA", "EU", "JP"]
+    assert np.isclose(matrix.loc["EU"].sum(), games_df["eu_sales"].sum())
+
+
+def test_growth_panel_spans_first_to_last_sale(matrix):
+    panel = growth_panel(matrix)
+    a = panel[panel["group"] == "A"]
+    assert list(a["year"]) == [2011, 2012, 2013, 2014]
+    assert len(panel[panel["group"] == "B"]) == 6
+
+
+def test_growth_panel_yoy_rolling_and_cagr(matrix):
+    a = growth_panel(matrix, window=2).set_index(["group", "year"]).loc["A"]
+    assert np.isnan(a.loc[2011, "yoy_pct"])
+    assert a.loc[2012, "yoy_pct"] == pytest.approx(100.0)
+    assert a.loc[2013, "yoy_pct"] == pytest.approx(-100.0)
+    # Follows a year without sales.
+    assert np.isnan(a.loc[2014, "yoy_pct"])
+    assert list(a["rolling_avg"]) == pytest.approx([10.0, 15.0, 10.0, 20.0])
+    assert np.isnan(a.loc[2011, "cagr_pct"])
+    assert a.loc[2014, "cagr_pct"] == pytest.approx((4 ** (1 / 3) - 1) * 100)
+
+
+def test_growth_panel_matches_per_group_pandas(games_df):
+    matrix = dimension_year_matrix(games_df, "genre")
+    panel = growth_panel(matrix, window=3).set_index(["group", "year"])
+    for genre, sales in matrix.iterrows():
+        expected = sales.rolling(3, min_periods=1).mean()
+        assert np.allclose(panel.loc[genre, "rolling_avg"], expected)
+        assert np.allclose(panel.loc[genre, "yoy_pct"].iloc[1:], sales.pct_change().iloc[1:] * 100)
+
+
+def test_growth_panels_long_table(games_df):
+    panels = growth_panels(games_df)
+    assert list(panels.columns) == GROWTH_COLUMNS
+    assert set(panels["dimension"]) == {"platform", "genre", "rating", "region"}
+    assert not panels.duplicated(["dimension", "group", "year"]).any()
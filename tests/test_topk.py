@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from project_games.analysis.topk import TopKIndex
+
+
+@pytest.fixture
+def frame(games_df):
+    df = games_df.copy()
+    df["critic_score"] = np.where(np.arange(len(df)) % 3 == 0, np.nan, df["user_score"] * 10)
+    # Ties must be broken by row position.
+    df.loc[[10, 20, 30], "total_sales"] = 99.0
+    return df
+
+
+def _expected(df, metric, k, selections, year_range=None):
+    mask = df[metric].notna()
+    for col, values in selections.items():
+        if values:
+            mask &= df[col].isin(values)
+    if year_range is not None:
+        mask &= df["year_of_release"].between(*year_range)
+    ranked = df[mask].sort_values(metric, ascending=False, kind="stable")
+    return ranked.index.to_numpy()[:k]
+
+
+@pytest.mark.parametrize(
+    "selections, year_range",
+    [
+        ({}, None),
+        ({"platform": ["PS4"]}, None),
+        ({"platform": ["PS4", "PC"], "genre": ["Action"]}, (2012, 2015)),
+        ({"genre": ["Puzzle"], "rating": ["M"]}, (2016, 2016)),
+        ({"platform": ["Wii"]}, None),
+    ],
+)
+@pytest.mark.parametrize("metric", ["total_sales", "eu_sales", "critic_score"])
+def test_query_matches_filter_and_sort(frame, metric, selections, year_range):
+    index = TopKIndex(frame)
+    ranges = {"year_of_release": year_range} if year_range else None
+    for k in (1, 5, 40):
+        positions = index.query(metric, k, selections, ranges)
+        np.testing.assert_array_equal(
+            positions, _expected(frame, metric, k, selections, year_range)
+        )
+
+
+def test_top_returns_ranked_table(frame):
+    table = TopKIndex(frame).top(frame, "total_sales", 3)
+    assert table["rank"].tolist() == [1, 2, 3]
+    assert table["total_sales"].tolist() == [99.0, 99.0, 99.0]
+    assert table["name"].tolist() == ["Game 10", "Game 20", "Game 30"]
+    assert list(table.columns)[-1] == "total_sales"
+
+
+def test_unknown_metric_raises(frame):
+    with pytest.raises(ValueError, match="Unknown metric"):
+        TopKIndex(frame).query("name", 5)